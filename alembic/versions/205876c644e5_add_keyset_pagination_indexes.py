@@ -0,0 +1,45 @@
+"""Add keyset pagination indexes
+
+Revision ID: 205876c644e5
+Revises: bd492236c82d
+Create Date: 2026-10-18 09:45:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '205876c644e5'
+down_revision: Union[str, None] = 'bd492236c82d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_job_updated_at_id', 'job', []),
+    ('ix_job_user_id_updated_at_id', 'job', ['user_id']),
+    ('ix_application_job_id_updated_at_id', 'application', ['job_id']),
+    ('ix_savedjob_user_id_updated_at_id', 'savedjob', ['user_id']),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        for name, table, prefix in INDEXES:
+            op.create_index(
+                name,
+                table,
+                [*prefix, sa.text('updated_at DESC'), sa.text('id DESC')],
+                unique=False,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
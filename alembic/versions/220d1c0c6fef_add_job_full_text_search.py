@@ -0,0 +1,73 @@
+"""Add job full-text search
+
+Revision ID: 220d1c0c6fef
+Revises: 5066cc4603c0
+Create Date: 2026-10-18 11:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '220d1c0c6fef'
+down_revision: Union[str, None] = '5066cc4603c0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match JobRepository.search_document.
+SEARCH_VECTOR_FUNCTION = """
+CREATE OR REPLACE FUNCTION job_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.company, '')), 'B') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.tags, '')), 'B') ||
+        setweight(
+            to_tsvector('english'::regconfig, coalesce(NEW.description, '')), 'C'
+        );
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+"""
+
+SEARCH_VECTOR_TRIGGER = """
+CREATE TRIGGER job_search_vector_update
+BEFORE INSERT OR UPDATE OF title, company, tags, description ON job
+FOR EACH ROW EXECUTE FUNCTION job_search_vector_update()
+"""
+
+
+def upgrade() -> None:
+    # A nullable column without default is a catalog-only change. Existing
+    # rows are filled in batches by `python -m app.commands.backfill_job_search`
+    # instead of one long UPDATE here.
+    op.add_column(
+        'job', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True)
+    )
+    op.execute(SEARCH_VECTOR_FUNCTION)
+    op.execute(SEARCH_VECTOR_TRIGGER)
+
+    # CONCURRENTLY cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_job_search_vector',
+            'job',
+            ['search_vector'],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_job_search_vector', table_name='job', postgresql_concurrently=True
+        )
+    op.execute('DROP TRIGGER IF EXISTS job_search_vector_update ON job')
+    op.execute('DROP FUNCTION IF EXISTS job_search_vector_update()')
+    op.drop_column('job', 'search_vector')
@@ -0,0 +1,41 @@
+"""Add job listing filter indexes
+
+Revision ID: 3e626327fd77
+Revises: 220d1c0c6fef
+Create Date: 2026-10-18 11:45:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e626327fd77'
+down_revision: Union[str, None] = '220d1c0c6fef'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+NEWEST_FIRST = [sa.text('updated_at DESC'), sa.text('id DESC')]
+
+INDEXES = [
+    ('ix_job_created_at_id', 'job', [sa.text('created_at DESC'), sa.text('id DESC')]),
+    ('ix_job_location_updated_at_id', 'job', ['location', *NEWEST_FIRST]),
+    ('ix_job_company_updated_at_id', 'job', ['company', *NEWEST_FIRST]),
+    ('ix_job_is_remote_updated_at_id', 'job', ['is_remote', *NEWEST_FIRST]),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
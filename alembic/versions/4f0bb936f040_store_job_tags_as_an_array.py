@@ -0,0 +1,106 @@
+"""Store job tags as an array
+
+Revision ID: 4f0bb936f040
+Revises: 3e626327fd77
+Create Date: 2026-10-18 12:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f0bb936f040'
+down_revision: Union[str, None] = '3e626327fd77'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BATCH_SIZE = 5000
+
+SPLIT_TAGS = r"array_remove(regexp_split_to_array(trim(tags), '\s*,\s*'), '')"
+
+SPLIT_BATCH = sa.text(
+    f'UPDATE job SET tags_array = {SPLIT_TAGS} '
+    'WHERE id IN (SELECT id FROM job WHERE id > :after_id ORDER BY id LIMIT :limit) '
+    'RETURNING id'
+)
+
+SEARCH_VECTOR_FUNCTION = """
+CREATE OR REPLACE FUNCTION job_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(NEW.company, '')), 'B') ||
+        setweight(to_tsvector('english'::regconfig, coalesce({tags}, '')), 'B') ||
+        setweight(
+            to_tsvector('english'::regconfig, coalesce(NEW.description, '')), 'C'
+        );
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+"""
+
+SEARCH_VECTOR_TRIGGER = """
+CREATE TRIGGER job_search_vector_update
+BEFORE INSERT OR UPDATE OF title, company, tags, description ON job
+FOR EACH ROW EXECUTE FUNCTION job_search_vector_update()
+"""
+
+
+def upgrade() -> None:
+    op.add_column(
+        'job', sa.Column('tags_array', postgresql.ARRAY(sa.String()), nullable=True)
+    )
+
+    # Split the existing comma strings in short transactions so the table
+    # stays writable; the search trigger does not fire on tags_array.
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        after_id = 0
+        while True:
+            ids = bind.execute(
+                SPLIT_BATCH, {'after_id': after_id, 'limit': BATCH_SIZE}
+            ).scalars().all()
+            if not ids:
+                break
+            after_id = max(ids)
+
+    # Writes are blocked from here until the swap commits, so one last sweep
+    # re-splits every row inserted or edited since its batch ran.
+    op.execute('LOCK TABLE job IN SHARE ROW EXCLUSIVE MODE')
+    op.execute('DROP TRIGGER IF EXISTS job_search_vector_update ON job')
+    op.execute(
+        f'UPDATE job SET tags_array = {SPLIT_TAGS} '
+        f'WHERE tags_array IS DISTINCT FROM {SPLIT_TAGS}'
+    )
+    op.drop_column('job', 'tags')
+    op.alter_column('job', 'tags_array', new_column_name='tags')
+    op.execute(SEARCH_VECTOR_FUNCTION.format(tags="array_to_string(NEW.tags, ' ')"))
+    op.execute(SEARCH_VECTOR_TRIGGER)
+
+    # CONCURRENTLY cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_job_tags',
+            'job',
+            ['tags'],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_job_tags', table_name='job', postgresql_concurrently=True)
+
+    op.execute('DROP TRIGGER IF EXISTS job_search_vector_update ON job')
+    op.add_column('job', sa.Column('tags_text', sa.String(), nullable=True))
+    op.execute("UPDATE job SET tags_text = array_to_string(tags, ', ')")
+    op.drop_column('job', 'tags')
+    op.alter_column('job', 'tags_text', new_column_name='tags')
+    op.execute(SEARCH_VECTOR_FUNCTION.format(tags='NEW.tags'))
+    op.execute(SEARCH_VECTOR_TRIGGER)
@@ -0,0 +1,74 @@
+"""Add lookup and foreign key indexes
+
+Revision ID: 5066cc4603c0
+Revises: 205876c644e5
+Create Date: 2026-10-18 10:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5066cc4603c0'
+down_revision: Union[str, None] = '205876c644e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+NEWEST_FIRST = [sa.text('updated_at DESC'), sa.text('id DESC')]
+
+INDEXES = [
+    ('ix_user_email', 'user', ['email'], False),
+    ('ix_user_updated_at_id', 'user', NEWEST_FIRST, False),
+    ('ix_application_updated_at_id', 'application', NEWEST_FIRST, False),
+    (
+        'ix_application_user_id_updated_at_id',
+        'application',
+        ['user_id', *NEWEST_FIRST],
+        False,
+    ),
+    ('uq_application_user_id_job_id', 'application', ['user_id', 'job_id'], True),
+    ('ix_savedjob_updated_at_id', 'savedjob', NEWEST_FIRST, False),
+    ('ix_savedjob_job_id', 'savedjob', ['job_id'], False),
+    ('uq_savedjob_user_id_job_id', 'savedjob', ['user_id', 'job_id'], True),
+]
+
+
+def upgrade() -> None:
+    # The unique indexes cannot be built over duplicate rows. Removing them
+    # deletes user data, so it is a separate, explicit command.
+    connection = op.get_bind()
+    for table in ('application', 'savedjob'):
+        duplicates = connection.scalar(
+            sa.text(
+                'SELECT count(*) FROM ('
+                f'SELECT 1 FROM {table} GROUP BY user_id, job_id '
+                'HAVING count(*) > 1) AS pairs'
+            )
+        )
+        if duplicates:
+            raise RuntimeError(
+                f'{table} has {duplicates} (user_id, job_id) pairs with more '
+                'than one row; run python -m app.commands.dedupe_user_jobs '
+                'first.'
+            )
+
+    # CONCURRENTLY cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        for name, table, columns, unique in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=unique,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
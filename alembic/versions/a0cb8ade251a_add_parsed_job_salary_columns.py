@@ -0,0 +1,54 @@
+"""Add parsed job salary columns
+
+Revision ID: a0cb8ade251a
+Revises: 4f0bb936f040
+Create Date: 2026-10-18 12:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a0cb8ade251a'
+down_revision: Union[str, None] = '4f0bb936f040'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    (
+        'ix_job_salary_max_id',
+        'job',
+        [sa.text('salary_max DESC NULLS LAST'), sa.text('id DESC')],
+    ),
+    ('ix_job_salary_min', 'job', ['salary_min']),
+]
+
+
+def upgrade() -> None:
+    # Nullable columns without defaults are catalog-only changes. Existing
+    # rows are parsed by `python -m app.commands.backfill_job_salary`.
+    # bigint: amounts in currencies such as IDR or VND run past int4.
+    op.add_column('job', sa.Column('salary_min', sa.BigInteger(), nullable=True))
+    op.add_column('job', sa.Column('salary_max', sa.BigInteger(), nullable=True))
+    op.add_column(
+        'job', sa.Column('salary_currency', sa.String(length=3), nullable=True)
+    )
+
+    # CONCURRENTLY cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+    op.drop_column('job', 'salary_currency')
+    op.drop_column('job', 'salary_max')
+    op.drop_column('job', 'salary_min')
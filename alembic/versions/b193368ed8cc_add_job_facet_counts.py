@@ -0,0 +1,50 @@
+"""Add job facet counts
+
+Revision ID: b193368ed8cc
+Revises: a0cb8ade251a
+Create Date: 2026-10-18 13:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b193368ed8cc'
+down_revision: Union[str, None] = 'a0cb8ade251a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same values as JobFacetRepository.facet_values.
+INITIAL_COUNTS = """
+INSERT INTO jobfacet (facet, value, count)
+SELECT 'location', location, count(*) FROM job
+WHERE location IS NOT NULL AND location <> '' GROUP BY location
+UNION ALL
+SELECT 'is_remote', is_remote::text, count(*) FROM job
+WHERE is_remote IS NOT NULL GROUP BY is_remote
+UNION ALL
+SELECT 'company', company, count(*) FROM job
+WHERE company IS NOT NULL AND company <> '' GROUP BY company
+UNION ALL
+SELECT 'tag', tag, count(*)
+FROM (SELECT DISTINCT id, unnest(tags) AS tag FROM job) AS tags GROUP BY tag
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        'jobfacet',
+        sa.Column('facet', sa.String(), nullable=False),
+        sa.Column('value', sa.String(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('facet', 'value'),
+    )
+    op.execute(INITIAL_COUNTS)
+
+
+def downgrade() -> None:
+    op.drop_table('jobfacet')
@@ -0,0 +1,52 @@
+"""Cascade deletes in the database
+
+Revision ID: c4d71e9a2f50
+Revises: b193368ed8cc
+Create Date: 2026-10-18 14:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d71e9a2f50'
+down_revision: Union[str, None] = 'b193368ed8cc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# The initial migration left these unnamed, so they carry Postgres' default
+# names. The application foreign keys already cascade.
+FOREIGN_KEYS = [
+    ('job_user_id_fkey', 'job', 'user_id', 'user'),
+    ('savedjob_user_id_fkey', 'savedjob', 'user_id', 'user'),
+    ('savedjob_job_id_fkey', 'savedjob', 'job_id', 'job'),
+]
+
+
+def _replace_foreign_keys(on_delete: str) -> None:
+    # NOT VALID swaps each constraint without scanning the table, so the
+    # ACCESS EXCLUSIVE lock of the DROP is only held briefly.
+    for name, table, column, referred in FOREIGN_KEYS:
+        op.execute(f'ALTER TABLE {table} DROP CONSTRAINT {name}')
+        op.execute(
+            f'ALTER TABLE {table} ADD CONSTRAINT {name} '
+            f'FOREIGN KEY ({column}) REFERENCES "{referred}" (id) '
+            f'{on_delete} NOT VALID'
+        )
+    # The block commits the swap first, releasing that lock. Each VALIDATE
+    # then scans its table in its own transaction under SHARE UPDATE
+    # EXCLUSIVE, which lets reads and writes go on.
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in FOREIGN_KEYS:
+            op.execute(f'ALTER TABLE {table} VALIDATE CONSTRAINT {name}')
+
+
+def upgrade() -> None:
+    _replace_foreign_keys('ON DELETE CASCADE')
+
+
+def downgrade() -> None:
+    _replace_foreign_keys('')
@@ -0,0 +1,100 @@
+"""Soft delete users and jobs
+
+Revision ID: d8e2f5a61b37
+Revises: c4d71e9a2f50
+Create Date: 2026-10-18 15:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8e2f5a61b37'
+down_revision: Union[str, None] = 'c4d71e9a2f50'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+NEWEST_FIRST = [sa.text('updated_at DESC'), sa.text('id DESC')]
+LIVE = sa.text('deleted_at IS NULL')
+DELETED = sa.text('deleted_at IS NOT NULL')
+
+# Listing indexes rebuilt to hold the live rows only.
+# ix_job_user_id_updated_at_id stays whole: the user foreign key cascade looks
+# deleted jobs up through it.
+PARTIAL_INDEXES = [
+    ('ix_job_updated_at_id', 'job', NEWEST_FIRST, {}),
+    (
+        'ix_job_created_at_id',
+        'job',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        {},
+    ),
+    ('ix_job_location_updated_at_id', 'job', ['location', *NEWEST_FIRST], {}),
+    ('ix_job_company_updated_at_id', 'job', ['company', *NEWEST_FIRST], {}),
+    ('ix_job_is_remote_updated_at_id', 'job', ['is_remote', *NEWEST_FIRST], {}),
+    ('ix_job_search_vector', 'job', ['search_vector'], {'postgresql_using': 'gin'}),
+    ('ix_job_tags', 'job', ['tags'], {'postgresql_using': 'gin'}),
+    (
+        'ix_job_salary_max_id',
+        'job',
+        [sa.text('salary_max DESC NULLS LAST'), sa.text('id DESC')],
+        {},
+    ),
+    ('ix_job_salary_min', 'job', ['salary_min'], {}),
+    ('ix_user_email', 'user', ['email'], {}),
+    ('ix_user_updated_at_id', 'user', NEWEST_FIRST, {}),
+]
+
+# The rows waiting for the purge.
+DELETED_INDEXES = [
+    ('ix_job_deleted_at', 'job'),
+    ('ix_user_deleted_at', 'user'),
+]
+
+
+def _swap_indexes(where) -> None:
+    # Build the replacement next to the old index, so reads always have one,
+    # then drop the old one and take over its name.
+    for name, table, columns, kwargs in PARTIAL_INDEXES:
+        op.create_index(
+            f'{name}_new',
+            table,
+            columns,
+            postgresql_where=where,
+            postgresql_concurrently=True,
+            **kwargs,
+        )
+        op.drop_index(name, table_name=table, postgresql_concurrently=True)
+        op.execute(f'ALTER INDEX {name}_new RENAME TO {name}')
+
+
+def upgrade() -> None:
+    # Nullable without a default: no table rewrite.
+    op.add_column('job', sa.Column('deleted_at', sa.DateTime(), nullable=True))
+    op.add_column('user', sa.Column('deleted_at', sa.DateTime(), nullable=True))
+
+    # CONCURRENTLY cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        _swap_indexes(LIVE)
+        for name, table in DELETED_INDEXES:
+            op.create_index(
+                name,
+                table,
+                ['deleted_at'],
+                postgresql_where=DELETED,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table in reversed(DELETED_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+        _swap_indexes(None)
+
+    op.drop_column('user', 'deleted_at')
+    op.drop_column('job', 'deleted_at')
@@ -0,0 +1,41 @@
+"""Backfill the parsed job salary.
+
+Parses ``job.salary`` into ``salary_min``, ``salary_max`` and
+``salary_currency`` for rows written before those columns existed, in id
+order and one short transaction per batch. Resume with ``--after-id``.
+
+Usage::
+
+    python -m app.commands.backfill_job_salary --batch-size 1000 --pause 0.1
+"""
+
+import argparse
+
+from app.commands.batches import run_in_batches
+from app.core.logging_config import setup_logging
+from app.models import Job
+from app.repositories.job import JobRepository
+
+
+def main():
+    """Run the backfill."""
+    parser = argparse.ArgumentParser(description="Backfill the job salary range.")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--pause", type=float, default=0.1)
+    parser.add_argument("--after-id", type=int, default=0)
+    args = parser.parse_args()
+
+    setup_logging()
+    job_repository = JobRepository(Job)
+    run_in_batches(
+        lambda db, after_id: job_repository.backfill_salary(
+            db, after_id=after_id, batch_size=args.batch_size
+        ),
+        name="Job salary backfill",
+        pause=args.pause,
+        after_id=args.after_id,
+    )
+
+
+if __name__ == "__main__":
+    main()
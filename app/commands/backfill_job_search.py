@@ -0,0 +1,41 @@
+"""Backfill the job search vector.
+
+Fills ``job.search_vector`` for rows written before the search trigger
+existed, in id order and one short transaction per batch, so it can run
+against a live table and be resumed with ``--after-id``.
+
+Usage::
+
+    python -m app.commands.backfill_job_search --batch-size 1000 --pause 0.1
+"""
+
+import argparse
+
+from app.commands.batches import run_in_batches
+from app.core.logging_config import setup_logging
+from app.models import Job
+from app.repositories.job import JobRepository
+
+
+def main():
+    """Run the backfill."""
+    parser = argparse.ArgumentParser(description="Backfill job.search_vector.")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--pause", type=float, default=0.1)
+    parser.add_argument("--after-id", type=int, default=0)
+    args = parser.parse_args()
+
+    setup_logging()
+    job_repository = JobRepository(Job)
+    run_in_batches(
+        lambda db, after_id: job_repository.backfill_search_vector(
+            db, after_id=after_id, batch_size=args.batch_size
+        ),
+        name="Job search vector backfill",
+        pause=args.pause,
+        after_id=args.after_id,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Batched command helpers."""
+
+import logging
+import time
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal, get_engine
+
+logger = logging.getLogger(__name__)
+
+
+def run_in_batches(
+    step: Callable[[Session, int], Optional[int]],
+    *,
+    name: str,
+    pause: float,
+    after_id: int = 0,
+) -> None:
+    """Call ``step(db, after_id)`` until it returns None.
+
+    ``step`` handles one batch in its own transaction and returns the last id
+    it processed, so an interrupted run can be resumed from the logged id.
+    """
+    with SessionLocal(bind=get_engine()) as db:
+        while True:
+            last_id = step(db, after_id)
+            # Repositories only flush; each batch is its own transaction.
+            db.commit()
+            if last_id is None:
+                break
+
+            after_id = last_id
+            logger.info(f"{name}: processed up to id {after_id}")
+            # Leave room for foreground writes and replication to catch up.
+            time.sleep(pause)
+
+    logger.info(f"{name}: finished")
@@ -0,0 +1,86 @@
+"""Remove duplicate applications and saved jobs.
+
+A user applies to, or saves, a job at most once: migration 5066cc4603c0
+adds unique indexes over ``(user_id, job_id)`` and refuses to run while
+duplicates remain. This keeps the newest row of every pair and deletes the
+others, logging how many went, one short transaction per batch. Resume
+files no application refers to any more are deleted with their rows.
+
+Usage::
+
+    python -m app.commands.dedupe_user_jobs --batch-size 500 --pause 0.5
+"""
+
+import argparse
+import logging
+from typing import Any, Optional
+
+from sqlalchemy.orm import Session
+
+from app.commands.batches import run_in_batches
+from app.commands.purge_deleted import remove_files
+from app.core.config import settings
+from app.core.logging_config import setup_logging
+from app.models import Application, SavedJob
+from app.repositories.application import ApplicationRepository
+from app.repositories.save_job import SavedJobRepository
+
+logger = logging.getLogger(__name__)
+
+KEYS = ("user_id", "job_id")
+
+
+def dedupe_step(name: str, repository: Any, batch_size: int, files=None):
+    """A ``run_in_batches`` step deleting one batch of duplicate rows.
+
+    ``files`` is the ``(column, directory)`` of the upload each row refers to.
+    """
+
+    def step(db: Session, after_id: int) -> Optional[int]:
+        rows = repository.delete_duplicates(
+            db,
+            keys=KEYS,
+            after_id=after_id,
+            batch_size=batch_size,
+            returning=[files[0]] if files is not None else [],
+        )
+        if not rows:
+            return None
+        # Only remove the files once the rows are gone for good.
+        db.commit()
+        logger.info(f"{name}: removed {len(rows)} duplicate rows")
+        if files is not None:
+            remove_files(db, *files, [row[1] for row in rows])
+        return max(row.id for row in rows)
+
+    return step
+
+
+def main():
+    """Run the dedupe."""
+    parser = argparse.ArgumentParser(
+        description="Remove duplicate applications and saved jobs."
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--pause", type=float, default=0.5)
+    args = parser.parse_args()
+
+    setup_logging()
+    stages = [
+        (
+            "Application dedupe",
+            ApplicationRepository(Application),
+            (Application.resume, settings.UPLOAD_DIR),
+        ),
+        ("Saved job dedupe", SavedJobRepository(SavedJob), None),
+    ]
+    for name, repository, files in stages:
+        run_in_batches(
+            dedupe_step(name, repository, args.batch_size, files),
+            name=name,
+            pause=args.pause,
+        )
+
+
+if __name__ == "__main__":
+    main()
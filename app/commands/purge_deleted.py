@@ -0,0 +1,89 @@
+"""Purge deleted users and jobs.
+
+Deleting a user or a job only sets its ``deleted_at``. This removes the
+rows for good, children first so no single statement cascades far: the
+applications and saved jobs of deleted jobs or users, then the jobs, then
+the users. Each batch is one short transaction, followed by a pause. Resume
+and logo files no row refers to any more are deleted with their rows.
+
+Usage::
+
+    python -m app.commands.purge_deleted --batch-size 500 --pause 0.5
+"""
+
+import argparse
+import logging
+from typing import Any, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from app.commands.batches import run_in_batches
+from app.core.config import settings
+from app.core.logging_config import setup_logging
+from app.core.uploads import remove_upload
+from app.models import Application, Job, SavedJob, User
+from app.repositories.application import ApplicationRepository
+from app.repositories.base import BaseRepository
+from app.repositories.job import JobRepository
+from app.repositories.save_job import SavedJobRepository
+from app.repositories.user import UserRepository
+
+logger = logging.getLogger(__name__)
+
+
+def remove_files(
+    db: Session, column: Any, directory: str, paths: Sequence[Optional[str]]
+) -> None:
+    """Delete the uploaded files of ``paths`` that no row in ``column`` holds."""
+    paths = {path for path in paths if path}
+    for path in paths - BaseRepository.referenced(db, column, list(paths)):
+        remove_upload(directory, path)
+
+
+def purge_step(repository: Any, batch_size: int, files=None):
+    """A ``run_in_batches`` step purging one batch of ``repository`` rows.
+
+    ``files`` is the ``(column, directory)`` of the upload each row refers to.
+    """
+
+    def step(db: Session, after_id: int) -> Optional[int]:
+        rows = repository.purge_deleted(db, after_id=after_id, batch_size=batch_size)
+        if not rows:
+            return None
+        # Only remove the files once the rows are gone for good.
+        db.commit()
+        if files is not None:
+            remove_files(db, *files, [row[1] for row in rows])
+        return max(row.id for row in rows)
+
+    return step
+
+
+def main():
+    """Run the purge."""
+    parser = argparse.ArgumentParser(description="Purge deleted users and jobs.")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--pause", type=float, default=0.5)
+    args = parser.parse_args()
+
+    setup_logging()
+    stages = [
+        (
+            "Application purge",
+            ApplicationRepository(Application),
+            (Application.resume, settings.UPLOAD_DIR),
+        ),
+        ("Saved job purge", SavedJobRepository(SavedJob), None),
+        ("Job purge", JobRepository(Job), (Job.logo, settings.LOGO_DIR)),
+        ("User purge", UserRepository(User), None),
+    ]
+    for name, repository, files in stages:
+        run_in_batches(
+            purge_step(repository, args.batch_size, files),
+            name=name,
+            pause=args.pause,
+        )
+
+
+if __name__ == "__main__":
+    main()
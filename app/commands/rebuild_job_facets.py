@@ -0,0 +1,30 @@
+"""Rebuild the job facet counts.
+
+The counts are adjusted on every job write; run this after bulk imports or
+if a failed adjustment was logged, preferably while job writes are quiet.
+
+Usage::
+
+    python -m app.commands.rebuild_job_facets
+"""
+
+import logging
+
+from app.core.logging_config import setup_logging
+from app.db.session import SessionLocal, get_engine
+from app.repositories.job_facet import JobFacetRepository
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Run the rebuild."""
+    setup_logging()
+    with SessionLocal(bind=get_engine()) as db:
+        JobFacetRepository().rebuild(db)
+        db.commit()
+    logger.info("Job facet counts rebuilt")
+
+
+if __name__ == "__main__":
+    main()
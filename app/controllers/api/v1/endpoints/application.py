@@ -1,20 +1,26 @@
 """Application Endpoint."""
 import json
 import os
+from typing import Optional
 
 from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, Query
 from fastapi_pagination import Page
 from sqlalchemy.orm import Session
-from starlette.responses import FileResponse
+from starlette.responses import FileResponse, Response
 
 from app import schemas, models
-from app.core.config import Settings
+from app.core.config import Settings, settings
+from app.core.etag import ConditionalRequest, cache_control
+from app.core.idempotency import IdempotentRequest
 from app.core.security import get_current_active_user
+from app.core.uploads import write_after_commit
 from app.db.session import get_db
 from app.use_cases.application import ApplicationUseCase
 from urllib.parse import unquote
 
-application_router = APIRouter()
+application_router = APIRouter(
+    dependencies=[Depends(cache_control(settings.APPLICATION_CACHE_CONTROL))]
+)
 
 
 @application_router.get("/application", response_model=Page[schemas.ApplicationOut])
@@ -33,13 +39,39 @@ def get_applications(
 @application_router.get("/application/job/{job_id}", response_model=Page[schemas.ApplicationOut])
 def get_applications_by_job_id(
         job_id: int,
+        conditional: ConditionalRequest = Depends(),
         db: Session = Depends(get_db),
         current_user: models.User = Depends(get_current_active_user),
 ):
     """Get all applications."""
     application_uc = ApplicationUseCase(db=db)
 
-    applications = application_uc.get_applications_by_job_id(job_id=job_id)
+    applications = application_uc.get_applications_by_job_id(
+        job_id=job_id, conditional=conditional
+    )
+
+    return applications
+
+
+@application_router.get(
+    "/application/job/{job_id}/feed",
+    response_model=schemas.CursorPage[schemas.ApplicationOut],
+)
+def get_applications_feed_by_job_id(
+        job_id: int,
+        cursor: Optional[str] = Query(
+            None, description="Cursor from the previous page"
+        ),
+        size: int = Query(50, ge=1, le=100, description="Page size"),
+        db: Session = Depends(get_db),
+        current_user: models.User = Depends(get_current_active_user),
+):
+    """Get applications by job ID with cursor pagination."""
+    application_uc = ApplicationUseCase(db=db)
+
+    applications = application_uc.get_applications_feed_by_job_id(
+        job_id=job_id, cursor=cursor, size=size
+    )
 
     return applications
 
@@ -47,13 +79,14 @@ def get_applications_by_job_id(
 @application_router.get("/application/{_id}", response_model=schemas.ApplicationOut)
 def get_application(
         _id: int,
+        conditional: ConditionalRequest = Depends(),
         db: Session = Depends(get_db),
         current_user: models.User = Depends(get_current_active_user),
 ):
     """Get application by ID."""
     application_uc = ApplicationUseCase(db=db)
 
-    application = application_uc.get_application(_id=_id)
+    application = application_uc.get_application(_id=_id, conditional=conditional)
 
     return application
 
@@ -74,14 +107,23 @@ def get_application_user_and_job_id(
 
 
 @application_router.post("/application/{job_id}", response_model=schemas.ApplicationOut)
-async def create(
+def create(
         job_id: int,
         obj_in: str = Form(...),
         file: UploadFile = File(...),
+        idempotent: IdempotentRequest = Depends(),
         db: Session = Depends(get_db),
         current_user: models.User = Depends(get_current_active_user),
 ):
-    """Create application."""
+    """Create application.
+
+    A sync route: the session and the upload are read on the threadpool.
+    """
+    resume = file.file.read()
+    # A retry gets the first response without writing the resume again.
+    replayed = idempotent.replay(obj_in, resume)
+    if replayed is not None:
+        return replayed
 
     application_uc = ApplicationUseCase(db=db)
 
@@ -99,12 +141,14 @@ async def create(
 
     obj_in_schema = schemas.ApplicationIn(**obj_data)
 
-    # Save the file
-    with open(file_path, "wb") as buffer:
-        buffer.write(await file.read())
-
     application = application_uc.create_application(obj_in=obj_in_schema)
+    if isinstance(application, Response):
+        return application
+
+    # Written once the application commits, so a rejected one leaves none
+    write_after_commit(db, file_path, resume)
 
+    idempotent.store(application)
     return application
 
 
@@ -0,0 +1,207 @@
+"""Async Job Endpoint."""
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from fastapi_pagination import Page
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import schemas, models
+from app.controllers.api.v1.endpoints.job import (
+    job_fields,
+    job_filters,
+    upload_logo,
+)
+from app.core.config import settings
+from app.core.etag import ConditionalRequest, cache_control
+from app.core.security import async_get_current_active_user
+from app.db.session import get_async_db
+from app.use_cases.async_job import AsyncJobUseCase
+
+async_job_router = APIRouter(
+    dependencies=[Depends(cache_control(settings.JOB_CACHE_CONTROL))]
+)
+
+
+@async_job_router.get(
+    "/job",
+    response_model=Page[schemas.JobCardOut],
+    response_model_exclude_unset=True,
+)
+async def get_jobs(
+    filters: schemas.JobFilter = Depends(job_filters),
+    fields: List[str] = Depends(job_fields),
+    conditional: ConditionalRequest = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.User = Depends(async_get_current_active_user),
+):
+    """Get jobs, optionally filtered and sorted."""
+    job_uc = AsyncJobUseCase(db=db)
+
+    jobs = await job_uc.get_jobs(
+        filters=filters, fields=fields, conditional=conditional
+    )
+
+    return jobs
+
+
+@async_job_router.get("/job/facets", response_model=schemas.JobFacets)
+async def get_job_facets(
+    filters: schemas.JobFilter = Depends(job_filters),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.User = Depends(async_get_current_active_user),
+):
+    """Get job counts per location, remote, company and tag."""
+    job_uc = AsyncJobUseCase(db=db)
+
+    facets = await job_uc.get_job_facets(filters=filters)
+
+    return facets
+
+
+@async_job_router.get("/job/feed", response_model=schemas.CursorPage[schemas.JobOut])
+async def get_jobs_feed(
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+    size: int = Query(50, ge=1, le=100, description="Page size"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.User = Depends(async_get_current_active_user),
+):
+    """Get jobs with cursor pagination."""
+    job_uc = AsyncJobUseCase(db=db)
+
+    jobs = await job_uc.get_jobs_feed(cursor=cursor, size=size)
+
+    return jobs
+
+
+@async_job_router.get("/job/search", response_model=Page[schemas.JobOut])
+async def search_jobs(
+    q: str = Query(..., min_length=1, max_length=200, description="Search terms"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.User = Depends(async_get_current_active_user),
+):
+    """Search jobs by title, company, tags and description."""
+    job_uc = AsyncJobUseCase(db=db)
+
+    jobs = await job_uc.search_jobs(q=q)
+
+    return jobs
+
+
+@async_job_router.get("/job/{_id}", response_model=schemas.JobOut)
+async def get_job(
+    _id: int,
+    conditional: ConditionalRequest = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.User = Depends(async_get_current_active_user),
+):
+    """Get job by ID."""
+    job_uc = AsyncJobUseCase(db=db)
+
+    job = await job_uc.get_job(_id=_id, conditional=conditional)
+
+    return job
+
+
+@async_job_router.get(
+    "/jobs/user/{user_id}",
+    response_model=Page[schemas.JobCardOut],
+    response_model_exclude_unset=True,
+)
+async def get_job_by_user_id(
+    user_id: int,
+    fields: List[str] = Depends(job_fields),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.User = Depends(async_get_current_active_user),
+):
+    """Get job by ID."""
+    job_uc = AsyncJobUseCase(db=db)
+
+    job = await job_uc.get_jobs_by_user_id(user_id=user_id, fields=fields)
+
+    return job
+
+
+@async_job_router.get(
+    "/jobs/user/{user_id}/feed", response_model=schemas.CursorPage[schemas.JobOut]
+)
+async def get_jobs_feed_by_user_id(
+    user_id: int,
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+    size: int = Query(50, ge=1, le=100, description="Page size"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.User = Depends(async_get_current_active_user),
+):
+    """Get jobs by user ID with cursor pagination."""
+    job_uc = AsyncJobUseCase(db=db)
+
+    jobs = await job_uc.get_jobs_feed_by_user_id(
+        user_id=user_id, cursor=cursor, size=size
+    )
+
+    return jobs
+
+
+@async_job_router.get(
+    "/jobs/applied/{user_id}",
+    response_model=Page[schemas.JobCardOut],
+    response_model_exclude_unset=True,
+)
+async def get_applied_jobs(
+    user_id: int,
+    fields: List[str] = Depends(job_fields),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.User = Depends(async_get_current_active_user),
+):
+    """Get job by ID."""
+    job_uc = AsyncJobUseCase(db=db)
+
+    job = await job_uc.get_applied_jobs(user_id=user_id, fields=fields)
+
+    return job
+
+
+@async_job_router.post("/job", response_model=schemas.JobOut)
+async def create(
+    obj_in: schemas.JobIn,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.User = Depends(async_get_current_active_user),
+):
+    """Create job."""
+    job_uc = AsyncJobUseCase(db=db)
+
+    job = await job_uc.create_job(obj_in=obj_in)
+
+    return job
+
+
+@async_job_router.put("/job/{_id}", response_model=schemas.JobOut)
+async def update(
+    _id: int,
+    obj_in: schemas.JobIn,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.User = Depends(async_get_current_active_user),
+):
+    """Update job by ID."""
+    job_uc = AsyncJobUseCase(db=db)
+
+    job = await job_uc.update_job(obj_in=obj_in, _id=_id)
+
+    return job
+
+
+@async_job_router.delete("/job/{_id}", response_model=schemas.JobOut)
+async def delete(
+    _id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.User = Depends(async_get_current_active_user),
+):
+    """Delete job by ID."""
+    job_uc = AsyncJobUseCase(db=db)
+
+    job = await job_uc.delete_job(_id=_id)
+
+    return job
+
+
+async_job_router.add_api_route("/upload-logo/", upload_logo, methods=["POST"])
@@ -12,10 +12,10 @@ auth_router = APIRouter()
 
 
 @auth_router.post("/auth/login/token", response_model=schemas.Token)
-def login_access_token(
+async def login_access_token(
     db: Session = Depends(get_db), form_data: OAuth2PasswordRequestForm = Depends()
 ):
     """OAuth2 compatible token login, get an access token for future requests."""
     auth_uc = AuthenticationUseCase(db=db)
-    response = auth_uc.login_access_token(form_data=form_data)
+    response = await auth_uc.login_access_token(form_data=form_data)
     return response
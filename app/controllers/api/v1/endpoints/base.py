@@ -1,8 +1,10 @@
 """Base Endpoint."""
 from app.controllers.api.v1.endpoints.application import application_router
+from app.controllers.api.v1.endpoints.async_job import async_job_router
 from app.controllers.api.v1.endpoints.auth import auth_router
 from app.controllers.api.v1.endpoints.item import item_router
 from app.controllers.api.v1.endpoints.job import job_router
+from app.controllers.api.v1.endpoints.metrics import metrics_router
 from app.controllers.api.v1.endpoints.save_job import save_job_router
 from app.controllers.api.v1.endpoints.user import user_router
 from app.core.config import settings
@@ -13,6 +15,11 @@ def api_controller(app):
     app.include_router(item_router, prefix=f"{settings.API_PREFIX}", tags=["Item"])
     app.include_router(user_router, prefix=f"{settings.API_PREFIX}", tags=["User"])
     app.include_router(auth_router, prefix=f"{settings.API_PREFIX}", tags=["Login"])
-    app.include_router(job_router, prefix=f"{settings.API_PREFIX}", tags=["Job"])
+    app.include_router(
+        async_job_router if settings.DB_ASYNC else job_router,
+        prefix=f"{settings.API_PREFIX}",
+        tags=["Job"],
+    )
     app.include_router(application_router, prefix=f"{settings.API_PREFIX}", tags=["Application"])
     app.include_router(save_job_router, prefix=f"{settings.API_PREFIX}", tags=["Saved Jobs"])
+    app.include_router(metrics_router, prefix=f"{settings.API_PREFIX}", tags=["Metrics"])
@@ -3,27 +3,128 @@ import os
 import shutil
 import uuid
 
-from fastapi import APIRouter, Depends, UploadFile, File
+from http import HTTPStatus
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Query
 from fastapi_pagination import Page
 from sqlalchemy.orm import Session
 
 from app import schemas, models
+from app.core.config import settings
+from app.core.etag import ConditionalRequest, cache_control
 from app.core.security import get_current_active_user
 from app.db.session import get_db
 from app.use_cases.job import JobUseCase
 
-job_router = APIRouter()
+job_router = APIRouter(
+    dependencies=[Depends(cache_control(settings.JOB_CACHE_CONTROL))]
+)
+
+
+def job_filters(
+        location: Optional[str] = Query(None),
+        is_remote: Optional[bool] = Query(None),
+        company: Optional[str] = Query(None),
+        tag: Optional[List[str]] = Query(None, description="Jobs with every tag"),
+        user_id: Optional[int] = Query(None),
+        salary_min: Optional[int] = Query(None, ge=0, description="Pays at least"),
+        salary_max: Optional[int] = Query(None, ge=0, description="Pays at most"),
+        sort: schemas.JobSort = Query(schemas.JobSort.updated_at),
+) -> schemas.JobFilter:
+    """Job listing filters from the query string."""
+    return schemas.JobFilter(
+        location=location,
+        is_remote=is_remote,
+        company=company,
+        tags=tag,
+        user_id=user_id,
+        salary_min=salary_min,
+        salary_max=salary_max,
+        sort=sort,
+    )
+
+
+def job_fields(
+        fields: Optional[str] = Query(
+            None, description="Comma separated job fields; the card fields if omitted"
+        ),
+) -> List[str]:
+    """Job fields to select and serialize, from the query string."""
+    if fields is None:
+        return list(schemas.JOB_CARD_FIELDS)
+
+    names = list(dict.fromkeys(name.strip() for name in fields.split(",")))
+    unknown = [name for name in names if name not in schemas.JobCardOut.model_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+            detail=f"Unknown job fields: {', '.join(unknown)}",
+        )
+    return names
+
+
+@job_router.get(
+    "/job",
+    response_model=Page[schemas.JobCardOut],
+    response_model_exclude_unset=True,
+)
+def get_jobs(
+        filters: schemas.JobFilter = Depends(job_filters),
+        fields: List[str] = Depends(job_fields),
+        conditional: ConditionalRequest = Depends(),
+        db: Session = Depends(get_db),
+        current_user: models.User = Depends(get_current_active_user),
+):
+    """Get jobs, optionally filtered and sorted."""
+    job_uc = JobUseCase(db=db)
+
+    jobs = job_uc.get_jobs(filters=filters, fields=fields, conditional=conditional)
 
+    return jobs
 
-@job_router.get("/job", response_model=Page[schemas.JobOut])
-def get_jobs(
+
+@job_router.get("/job/facets", response_model=schemas.JobFacets)
+def get_job_facets(
+        filters: schemas.JobFilter = Depends(job_filters),
+        db: Session = Depends(get_db),
+        current_user: models.User = Depends(get_current_active_user),
+):
+    """Get job counts per location, remote, company and tag."""
+    job_uc = JobUseCase(db=db)
+
+    facets = job_uc.get_job_facets(filters=filters)
+
+    return facets
+
+
+@job_router.get("/job/feed", response_model=schemas.CursorPage[schemas.JobOut])
+def get_jobs_feed(
+        cursor: Optional[str] = Query(
+            None, description="Cursor from the previous page"
+        ),
+        size: int = Query(50, ge=1, le=100, description="Page size"),
+        db: Session = Depends(get_db),
+        current_user: models.User = Depends(get_current_active_user),
+):
+    """Get jobs with cursor pagination."""
+    job_uc = JobUseCase(db=db)
+
+    jobs = job_uc.get_jobs_feed(cursor=cursor, size=size)
+
+    return jobs
+
+
+@job_router.get("/job/search", response_model=Page[schemas.JobOut])
+def search_jobs(
+        q: str = Query(..., min_length=1, max_length=200, description="Search terms"),
         db: Session = Depends(get_db),
         current_user: models.User = Depends(get_current_active_user),
 ):
-    """Get all jobs."""
+    """Search jobs by title, company, tags and description."""
     job_uc = JobUseCase(db=db)
 
-    jobs = job_uc.get_jobs()
+    jobs = job_uc.search_jobs(q=q)
 
     return jobs
 
@@ -31,41 +132,72 @@ def get_jobs(
 @job_router.get("/job/{_id}", response_model=schemas.JobOut)
 def get_job(
         _id: int,
+        conditional: ConditionalRequest = Depends(),
         db: Session = Depends(get_db),
         current_user: models.User = Depends(get_current_active_user),
 ):
     """Get job by ID."""
     job_uc = JobUseCase(db=db)
 
-    job = job_uc.get_job(_id=_id)
+    job = job_uc.get_job(_id=_id, conditional=conditional)
 
     return job
 
 
-@job_router.get("/jobs/user/{user_id}", response_model=Page[schemas.JobOut])
+@job_router.get(
+    "/jobs/user/{user_id}",
+    response_model=Page[schemas.JobCardOut],
+    response_model_exclude_unset=True,
+)
 def get_job_by_user_id(
         user_id: int,
+        fields: List[str] = Depends(job_fields),
         db: Session = Depends(get_db),
         current_user: models.User = Depends(get_current_active_user),
 ):
     """Get job by ID."""
     job_uc = JobUseCase(db=db)
 
-    job = job_uc.get_jobs_by_user_id(user_id=user_id)
+    job = job_uc.get_jobs_by_user_id(user_id=user_id, fields=fields)
 
     return job
 
 
-@job_router.get("/jobs/applied/{user_id}", response_model=Page[schemas.JobOut])
+@job_router.get(
+    "/jobs/user/{user_id}/feed", response_model=schemas.CursorPage[schemas.JobOut]
+)
+def get_jobs_feed_by_user_id(
+        user_id: int,
+        cursor: Optional[str] = Query(
+            None, description="Cursor from the previous page"
+        ),
+        size: int = Query(50, ge=1, le=100, description="Page size"),
+        db: Session = Depends(get_db),
+        current_user: models.User = Depends(get_current_active_user),
+):
+    """Get jobs by user ID with cursor pagination."""
+    job_uc = JobUseCase(db=db)
+
+    jobs = job_uc.get_jobs_feed_by_user_id(user_id=user_id, cursor=cursor, size=size)
+
+    return jobs
+
+
+@job_router.get(
+    "/jobs/applied/{user_id}",
+    response_model=Page[schemas.JobCardOut],
+    response_model_exclude_unset=True,
+)
 def get_job_by_user_id(
         user_id: int,
+        fields: List[str] = Depends(job_fields),
         db: Session = Depends(get_db),
         current_user: models.User = Depends(get_current_active_user),
 ):
     """Get job by ID."""
     job_uc = JobUseCase(db=db)
 
-    job = job_uc.get_applied_jobs(user_id=user_id)
+    job = job_uc.get_applied_jobs(user_id=user_id, fields=fields)
 
     return job
 
@@ -117,10 +249,8 @@ def delete(
 async def upload_logo(file: UploadFile = File(...)):
     file_ext = file.filename.split(".")[-1]
     unique_name = f"{uuid.uuid4()}.{file_ext}"
-    upload_dir = "public/logos"
-
-    os.makedirs(upload_dir, exist_ok=True)
-    file_path = os.path.join(upload_dir, unique_name)
+    os.makedirs(settings.LOGO_DIR, exist_ok=True)
+    file_path = os.path.join(settings.LOGO_DIR, unique_name)
 
     with open(file_path, "wb") as buffer:
         shutil.copyfileobj(file.file, buffer)
@@ -0,0 +1,30 @@
+"""Metrics Endpoint."""
+
+from fastapi import APIRouter, Depends
+
+from app import models
+from app.core.config import settings
+from app.core.security import get_current_active_user, password_hasher
+from app.db import session
+
+metrics_router = APIRouter()
+
+
+@metrics_router.get("/metrics/db-pool")
+def get_db_pool_metrics(
+    current_user: models.User = Depends(get_current_active_user),
+):
+    """Get connection pool checkout and wait metrics."""
+    metrics = {"sync": session.pool_metrics(session.get_engine())}
+    if settings.DB_ASYNC:
+        metrics["async"] = session.pool_metrics(session.get_async_engine().sync_engine)
+
+    return metrics
+
+
+@metrics_router.get("/metrics/password-hashing")
+def get_password_hashing_metrics(
+    current_user: models.User = Depends(get_current_active_user),
+):
+    """Get password hashing pool queue and wait metrics."""
+    return password_hasher.snapshot()
@@ -1,10 +1,13 @@
 """Saved Job Endpoint."""
 
+from typing import Optional
+
 from fastapi import APIRouter, Depends, Query
 from fastapi_pagination import Page
 from sqlalchemy.orm import Session
 
 from app import schemas, models
+from app.core.idempotency import IdempotentRequest
 from app.core.security import get_current_active_user
 from app.db.session import get_db
 from app.use_cases.save_job import SavedJobUseCase
@@ -39,6 +42,29 @@ def get_save_jobs_by_user_id(
     return save_jobs
 
 
+@save_job_router.get(
+    "/saved-jobs/{user_id}/feed",
+    response_model=schemas.CursorPage[schemas.SavedJobsOut],
+)
+def get_save_jobs_feed_by_user_id(
+        user_id: int,
+        cursor: Optional[str] = Query(
+            None, description="Cursor from the previous page"
+        ),
+        size: int = Query(50, ge=1, le=100, description="Page size"),
+        db: Session = Depends(get_db),
+        current_user: models.User = Depends(get_current_active_user),
+):
+    """Get save_jobs by user ID with cursor pagination."""
+    save_job_uc = SavedJobUseCase(db=db)
+
+    save_jobs = save_job_uc.get_saved_jobs_feed_by_user_id(
+        user_id=user_id, cursor=cursor, size=size
+    )
+
+    return save_jobs
+
+
 # @save_job_router.get("/save-job/{_id}", response_model=schemas.SavedJobOut)
 # def get_save_job(
 #         _id: int,
@@ -71,14 +97,20 @@ def get_saved_job_user_and_job_id(
 @save_job_router.post("/save-job", response_model=schemas.SavedJobOut)
 def create(
         obj_in: schemas.SavedJobIn,
+        idempotent: IdempotentRequest = Depends(),
         db: Session = Depends(get_db),
         current_user: models.User = Depends(get_current_active_user),
 ):
     """Create save_job."""
+    replayed = idempotent.replay(obj_in)
+    if replayed is not None:
+        return replayed
+
     save_job_uc = SavedJobUseCase(db=db)
 
     save_job = save_job_uc.create_saved_job(obj_in=obj_in)
 
+    idempotent.store(save_job)
     return save_job
 
 
@@ -5,23 +5,28 @@ from fastapi_pagination import Page
 from sqlalchemy.orm import Session
 
 from app import schemas, models
+from app.core.config import settings
+from app.core.etag import ConditionalRequest, cache_control
 from app.core.security import get_current_active_user
 from app.db.session import get_db
 from app.schemas.password import EmailSchema, ResetPasswordRequest
 from app.use_cases.user import UserUseCase
 
-user_router = APIRouter()
+user_router = APIRouter(
+    dependencies=[Depends(cache_control(settings.USER_CACHE_CONTROL))]
+)
 
 
 @user_router.get("/user", response_model=Page[schemas.UserOut])
 def get_users(
+        conditional: ConditionalRequest = Depends(),
         db: Session = Depends(get_db),
         current_user: models.User = Depends(get_current_active_user),
 ):
     """Get all users."""
     user_uc = UserUseCase(db=db)
 
-    users = user_uc.get_users()
+    users = user_uc.get_users(conditional=conditional)
 
     return users
 
@@ -29,13 +34,14 @@ def get_users(
 @user_router.get("/user/{_id}", response_model=schemas.UserOut)
 def get_user(
         _id: int,
+        conditional: ConditionalRequest = Depends(),
         db: Session = Depends(get_db),
         current_user: models.User = Depends(get_current_active_user),
 ):
     """Get user by ID."""
     user_uc = UserUseCase(db=db)
 
-    user = user_uc.get_user(_id=_id)
+    user = user_uc.get_user(_id=_id, conditional=conditional)
 
     return user
 
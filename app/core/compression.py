@@ -0,0 +1,217 @@
+"""Compression."""
+
+import zlib
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Bodies of these types are already compressed (PDF resumes, logos) or too
+# short to matter, so only text-like types are encoded.
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+
+class Encoder(ABC):
+    """Incremental encoder of one response body."""
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Encode a chunk; the output may be empty until enough input arrived."""
+
+    @abstractmethod
+    def finish(self) -> bytes:
+        """Flush the rest of the encoded body."""
+
+
+class GzipEncoder(Encoder):
+    """Gzip encoder."""
+
+    def __init__(self, level: int):
+        """Initialize with the zlib compression level (1-9)."""
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        """Encode a chunk."""
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        """Flush the rest of the encoded body."""
+        return self._compressor.flush()
+
+
+class BrotliEncoder(Encoder):
+    """Brotli encoder."""
+
+    def __init__(self, quality: int):
+        """Initialize with the brotli quality (0-11)."""
+        self._compressor = brotli.Compressor(quality=quality, mode=brotli.MODE_TEXT)
+
+    def compress(self, data: bytes) -> bytes:
+        """Encode a chunk."""
+        return self._compressor.process(data)
+
+    def finish(self) -> bytes:
+        """Flush the rest of the encoded body."""
+        return self._compressor.finish()
+
+
+def available_encoders(
+    gzip_level: int, brotli_quality: int
+) -> Dict[str, Callable[[], Encoder]]:
+    """Encoder factories by content coding, the preferred one first."""
+    return {
+        "br": lambda: BrotliEncoder(brotli_quality),
+        "gzip": lambda: GzipEncoder(gzip_level),
+    }
+
+
+def negotiate(accept_encoding: str, supported: Sequence[str]) -> Optional[str]:
+    """Pick the supported coding the client weights highest; ties keep our order."""
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding.strip().lower()] = weight
+
+    best: Optional[Tuple[float, str]] = None
+    for coding in supported:
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > 0 and (best is None or weight > best[0]):
+            best = (weight, coding)
+    return best[1] if best else None
+
+
+def is_compressible(headers: Headers) -> bool:
+    """Whether a response is worth encoding, judging by its headers."""
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "").lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """Brotli or gzip encoding of text responses, per the Accept-Encoding header.
+
+    Bodies below ``minimum_size``, already encoded or binary responses and
+    requests under ``exclude_paths`` (static files) are sent as they are.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = 1000,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        exclude_paths: Sequence[str] = (),
+    ):
+        """Initialize with the thresholds and compression levels."""
+        self.app = app
+        self.minimum_size = minimum_size
+        self.exclude_paths = tuple(exclude_paths)
+        self.encoders = available_encoders(gzip_level, brotli_quality)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Wrap the response of HTTP requests accepting one of our codings."""
+        if scope["type"] == "http" and not scope["path"].startswith(self.exclude_paths):
+            accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+            coding = negotiate(accept_encoding, list(self.encoders))
+            if coding is not None:
+                responder = CompressionResponder(
+                    self.app, coding, self.encoders[coding], self.minimum_size
+                )
+                await responder(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+class CompressionResponder:
+    """Encodes the body of one response."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        coding: str,
+        encoder_factory: Callable[[], Encoder],
+        minimum_size: int,
+    ):
+        """Initialize with the negotiated coding and its encoder."""
+        self.app = app
+        self.coding = coding
+        self.encoder_factory = encoder_factory
+        self.minimum_size = minimum_size
+        self.send: Optional[Send] = None
+        self.initial_message: Message = {}
+        self.started = False
+        self.encoder: Optional[Encoder] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the app, encoding what it sends."""
+        self.send = send
+        await self.app(scope, receive, self.send_encoded)
+
+    async def send_encoded(self, message: Message) -> None:
+        """Hold the start message until the first body chunk decides the coding."""
+        if message["type"] == "http.response.start":
+            self.initial_message = message
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        if not self.started:
+            self.started = True
+            await self._start(message)
+        elif self.encoder is None:
+            await self.send(message)
+        else:
+            await self.send(self._encode(message))
+
+    async def _start(self, message: Message) -> None:
+        """Send the start message, encoding the response if it qualifies."""
+        headers = MutableHeaders(raw=self.initial_message["headers"])
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not is_compressible(headers) or (
+            not more_body and len(body) < self.minimum_size
+        ):
+            await self.send(self.initial_message)
+            await self.send(message)
+            return
+
+        self.encoder = self.encoder_factory()
+        headers["Content-Encoding"] = self.coding
+        headers.add_vary_header("Accept-Encoding")
+        message = self._encode(message)
+        if more_body:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(len(message["body"]))
+
+        await self.send(self.initial_message)
+        await self.send(message)
+
+    def _encode(self, message: Message) -> Message:
+        """Encode a body chunk, flushing the encoder on the last one."""
+        body = self.encoder.compress(message.get("body", b""))
+        if not message.get("more_body", False):
+            body += self.encoder.finish()
+        return {**message, "body": body}
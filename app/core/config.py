@@ -13,11 +13,57 @@ class Settings:
 
     API_PREFIX = "/api/v1"
     SQLALCHEMY_DATABASE_URL = os.getenv("SQLALCHEMY_DATABASE_URL")
+    # Serve the job endpoints through AsyncSession; the async URL defaults to
+    # SQLALCHEMY_DATABASE_URL with an async driver.
+    DB_ASYNC: bool = os.getenv("DB_ASYNC", "false").lower() == "true"
+    SQLALCHEMY_ASYNC_DATABASE_URL = os.getenv("SQLALCHEMY_ASYNC_DATABASE_URL")
+    # Connection pool, per engine and worker process.
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_USE_LIFO: bool = os.getenv("DB_POOL_USE_LIFO", "true").lower() == "true"
+    # 0 disables the server side statement timeout.
+    DB_STATEMENT_TIMEOUT_MS: int = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
+    # PgBouncer in transaction mode: no app side pool, no prepared statements.
+    DB_EXTERNAL_POOLER: bool = (
+        os.getenv("DB_EXTERNAL_POOLER", "false").lower() == "true"
+    )
+    # "memory" keeps a per-process LRU; "redis" shares it between workers.
+    CACHE_BACKEND: str = os.getenv("CACHE_BACKEND", "memory")
+    CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+    CACHE_MAX_SIZE: int = int(os.getenv("CACHE_MAX_SIZE", "10000"))
+    # Seconds an authenticated user is served from the cache; 0 disables it.
+    USER_CACHE_TTL: int = int(os.getenv("USER_CACHE_TTL", "60"))
+    # Seconds a POST response is replayed for its Idempotency-Key; 0 disables it.
+    IDEMPOTENCY_TTL: int = int(os.getenv("IDEMPOTENCY_TTL", "86400"))
+    # Build the current user from the token claims without any lookup.
+    AUTH_STATELESS: bool = os.getenv("AUTH_STATELESS", "false").lower() == "true"
+    # bcrypt cost factor; stored hashes with another cost are rehashed on login.
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    # Threads hashing passwords, and how many more calls may wait for one.
+    PASSWORD_HASH_WORKERS: int = int(
+        os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 1))
+    )
+    PASSWORD_HASH_MAX_QUEUE: int = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "64"))
+    PASSWORD_HASH_TIMEOUT: float = float(os.getenv("PASSWORD_HASH_TIMEOUT", "10"))
+    # Cache-Control of the GET responses per router; ETags make revalidation cheap.
+    JOB_CACHE_CONTROL = os.getenv("JOB_CACHE_CONTROL", "private, no-cache")
+    APPLICATION_CACHE_CONTROL = os.getenv(
+        "APPLICATION_CACHE_CONTROL", "private, no-cache"
+    )
+    USER_CACHE_CONTROL = os.getenv("USER_CACHE_CONTROL", "private, no-cache")
+    # Text responses of at least this many bytes are brotli or gzip encoded;
+    # levels trade CPU per request for bytes on the wire.
+    COMPRESSION_MINIMUM_SIZE: int = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1000"))
+    COMPRESSION_GZIP_LEVEL: int = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+    COMPRESSION_BROTLI_QUALITY: int = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
     SECRET_KEY: str = secrets.token_urlsafe(32)
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1
     TOKEN_URL = API_PREFIX + "/auth/login/token"
     ALGORITHM = "HS256"
     UPLOAD_DIR = "uploads/resumes/"
+    LOGO_DIR = "public/logos/"
 
 
 settings = Settings()
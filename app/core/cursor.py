@@ -0,0 +1,28 @@
+"""Cursor."""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from http import HTTPStatus
+from typing import Tuple
+
+from exceptions.exceptions import APIException
+
+
+def encode_cursor(updated_at: datetime, _id: int) -> str:
+    """Encode the sort key of the last row of a page into an opaque token."""
+    payload = json.dumps([updated_at.isoformat(), _id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a token produced by ``encode_cursor``."""
+    try:
+        payload = base64.urlsafe_b64decode(cursor.encode("ascii"))
+        updated_at, _id = json.loads(payload)
+        return datetime.fromisoformat(updated_at), int(_id)
+    except (binascii.Error, ValueError, TypeError, UnicodeError) as e:
+        raise APIException(
+            status_code=HTTPStatus.BAD_REQUEST, detail="Invalid cursor."
+        ) from e
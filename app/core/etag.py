@@ -0,0 +1,68 @@
+"""ETag."""
+
+import hashlib
+from typing import Any, Callable, Optional
+
+from fastapi import Request, Response
+from starlette.status import HTTP_304_NOT_MODIFIED
+
+
+def weak_etag(*parts: Any) -> str:
+    """Build a weak ETag from the parts that identify a representation."""
+    digest = hashlib.blake2b(
+        "|".join(str(part) for part in parts).encode(), digest_size=16
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an ETag against an If-None-Match header."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+class ConditionalRequest:
+    """If-None-Match handling for one GET request.
+
+    The ETag covers the path and query string, so each page or filter
+    combination of a list validates separately.
+    """
+
+    def __init__(self, request: Request, response: Response):
+        """Initialize with the request and the response headers to fill."""
+        self.request = request
+        self.response = response
+        self.if_none_match = request.headers.get("if-none-match")
+
+    def set_etag(self, *version: Any) -> str:
+        """Set the ETag of the response from the resource version."""
+        etag = weak_etag(self.request.url.path, self.request.url.query, *version)
+        self.response.headers["ETag"] = etag
+        return etag
+
+    def not_modified(self, *version: Any) -> Optional[Response]:
+        """Return a 304 response when the client already has this version."""
+        etag = self.set_etag(*version)
+        if etag_matches(self.if_none_match, etag):
+            return Response(
+                status_code=HTTP_304_NOT_MODIFIED, headers=dict(self.response.headers)
+            )
+        return None
+
+
+def cache_control(policy: str) -> Callable[[Request, Response], None]:
+    """Router dependency setting the Cache-Control of its GET responses."""
+
+    def set_cache_control(request: Request, response: Response) -> None:
+        if request.method in ("GET", "HEAD"):
+            response.headers["Cache-Control"] = policy
+
+    return set_cache_control
@@ -0,0 +1,121 @@
+"""Password Hashing."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http import HTTPStatus
+from typing import Any, Callable, Dict
+
+from exceptions.exceptions import APIException
+
+
+class PasswordHasher:
+    """Run bcrypt on a small dedicated pool so it cannot take every thread.
+
+    bcrypt releases the GIL, so threads hash in parallel. Work beyond the
+    pool size waits in a bounded queue; once that is full callers are turned
+    away instead of piling up on the request threads. Async callers await
+    the hash with ``run_async`` and hold no request thread while it runs.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int, timeout: float):
+        """Initialize with the pool size, queue bound and wait timeout."""
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hasher"
+        )
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run ``func`` on the hashing pool and return its result."""
+        future = self._submit(func, *args)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError as e:
+            future.cancel()
+            raise self._timed_out() from e
+
+    async def run_async(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run ``func`` on the hashing pool and await its result."""
+        future = self._submit(func, *args)
+        try:
+            # A timeout cancels the hash if it is still queued.
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError as e:
+            raise self._timed_out() from e
+
+    def _submit(self, func: Callable[..., Any], *args: Any) -> Future:
+        """Queue ``func`` on the pool, or turn the caller away when it is full.
+
+        The slot is held until the hash is done, not until the caller stops
+        waiting, so a timed out hash still counts against the bound.
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise APIException(
+                status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+                detail="Too many login attempts in progress, please retry.",
+            )
+
+        with self._lock:
+            self.in_flight += 1
+        try:
+            future = self._executor.submit(
+                self._timed, time.perf_counter(), func, *args
+            )
+        except BaseException:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, future: Any) -> None:
+        with self._lock:
+            self.in_flight -= 1
+        self._slots.release()
+
+    def _timed_out(self) -> APIException:
+        return APIException(
+            status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+            detail="Password hashing timed out, please retry.",
+        )
+
+    def _timed(self, submitted: float, func: Callable[..., Any], *args: Any) -> Any:
+        waited = time.perf_counter() - submitted
+        with self._lock:
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self.completed += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the pool size, queue depth and wait times."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "in_flight": self.in_flight,
+                "queued": max(self.in_flight - self.max_workers, 0),
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "wait_seconds_avg": (
+                    round(self.wait_seconds_total / self.completed, 6)
+                    if self.completed
+                    else 0.0
+                ),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+            }
@@ -0,0 +1,114 @@
+"""Idempotency keys."""
+
+import hashlib
+import json
+from typing import Any, Optional
+
+from fastapi import Depends, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from starlette.responses import JSONResponse, Response
+
+from app import schemas
+from app.core.cache import cache
+from app.core.config import settings
+from app.core.security import get_current_active_user
+from app.db.session import get_db
+
+MAX_KEY_LENGTH = 255
+
+# Session.info entry of the responses to keep once the session commits.
+PENDING = "idempotent_responses"
+
+
+@event.listens_for(Session, "after_commit")
+def _keep_responses(session: Session) -> None:
+    """Cache the responses of a committed request."""
+    for key, content in session.info.pop(PENDING, {}).items():
+        cache.set(key, content, settings.IDEMPOTENCY_TTL)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_responses(session: Session, previous_transaction: Any) -> None:
+    """Forget the responses of a rolled back request.
+
+    A savepoint rolling back leaves the request's transaction going, so its
+    responses are only dropped with the outer transaction.
+    """
+    if not previous_transaction.nested:
+        session.info.pop(PENDING, None)
+
+
+def _fingerprint(*parts: Any) -> str:
+    """Digest of a request body, to tell a retry from a reused key."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        if not isinstance(part, bytes):
+            part = json.dumps(jsonable_encoder(part), sort_keys=True).encode()
+        digest.update(hashlib.blake2b(part, digest_size=16).digest())
+    return digest.hexdigest()
+
+
+class IdempotentRequest:
+    """Idempotency-Key handling for one POST request.
+
+    The response to a key is kept for ``IDEMPOTENCY_TTL`` seconds, per user
+    and path, and sent again for every retry with that key and body. Reusing
+    a key with a different body is a 422. Requests without the header, or
+    without a user, run as usual.
+    """
+
+    def __init__(
+        self,
+        request: Request,
+        db: Session = Depends(get_db),
+        current_user: schemas.UserOut = Depends(get_current_active_user),
+    ):
+        """Initialize with the request's key, session and user."""
+        self.db = db
+        self.key: Optional[str] = None
+        self.body: Optional[str] = None
+        idempotency_key = request.headers.get("idempotency-key")
+        if (
+            idempotency_key is None
+            or current_user is None
+            or not settings.IDEMPOTENCY_TTL
+        ):
+            return
+        if not idempotency_key or len(idempotency_key) > MAX_KEY_LENGTH:
+            raise HTTPException(status_code=400, detail="Invalid Idempotency-Key.")
+        self.key = f"idempotency:{current_user.id}:{request.url.path}:{idempotency_key}"
+
+    def replay(self, *body: Any) -> Optional[Response]:
+        """Return the response already sent for this key and body, if any.
+
+        ``body`` are the parts of the request body, kept with the response
+        by ``store``.
+        """
+        if self.key is None:
+            return None
+        self.body = _fingerprint(*body)
+        kept = cache.get(self.key)
+        if kept is None:
+            return None
+        if kept["body"] != self.body:
+            raise HTTPException(
+                status_code=422,
+                detail="Idempotency-Key was already used with another body.",
+            )
+        return JSONResponse(
+            content=kept["response"], headers={"Idempotent-Replayed": "true"}
+        )
+
+    def store(self, result: Any) -> None:
+        """Keep a successful result for this key once the request committed.
+
+        Error responses are not kept, so a retry runs the request again.
+        """
+        if self.key is None or isinstance(result, Response):
+            return
+        self.db.info.setdefault(PENDING, {})[self.key] = {
+            "body": self.body,
+            "response": jsonable_encoder(result),
+        }
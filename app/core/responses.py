@@ -0,0 +1,7 @@
+"""Responses."""
+
+from fastapi.responses import ORJSONResponse
+
+# FastAPI passes an already validated response model straight through to its
+# serializer, so encoding the result is what is left to speed up.
+DefaultResponse = ORJSONResponse
@@ -0,0 +1,62 @@
+"""Salary."""
+
+import re
+from typing import NamedTuple, Optional
+
+CURRENCY_SYMBOLS = {
+    "$": "USD",
+    "€": "EUR",
+    "£": "GBP",
+    "¥": "JPY",
+    "₱": "PHP",
+    "₹": "INR",
+}
+
+CURRENCY_CODES = {"AUD", "CAD", "EUR", "GBP", "INR", "JPY", "PHP", "SGD", "USD"}
+
+MULTIPLIERS = {"k": 1_000, "m": 1_000_000}
+
+# The largest amount the bigint salary columns hold.
+MAX_AMOUNT = 2**63 - 1
+
+AMOUNT = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*([kKmM])?(?![a-zA-Z])")
+CODE = re.compile(r"\b([A-Za-z]{3})\b")
+
+
+class SalaryRange(NamedTuple):
+    """Salary Range Class."""
+
+    minimum: Optional[int]
+    maximum: Optional[int]
+    currency: Optional[str]
+
+
+def parse_salary(text: Optional[str]) -> SalaryRange:
+    """Parse free text such as "₱50,000 - 80,000" or "USD 90k" into a range."""
+    if not text:
+        return SalaryRange(None, None, None)
+
+    amounts = []
+    for number, suffix in AMOUNT.findall(text):
+        multiplier = MULTIPLIERS.get(suffix.lower(), 1)
+        amount = int(float(number.replace(",", "")) * multiplier)
+        # Longer figures are not salaries; storing them would fail the write.
+        if amount <= MAX_AMOUNT:
+            amounts.append(amount)
+
+    currency = next(
+        (code for symbol, code in CURRENCY_SYMBOLS.items() if symbol in text), None
+    )
+    if currency is None:
+        currency = next(
+            (
+                code.upper()
+                for code in CODE.findall(text)
+                if code.upper() in CURRENCY_CODES
+            ),
+            None,
+        )
+
+    if not amounts:
+        return SalaryRange(None, None, currency)
+    return SalaryRange(min(amounts[:2]), max(amounts[:2]), currency)
@@ -1,22 +1,27 @@
 """Security."""
 
 import logging
-from typing import Union
+from functools import lru_cache
+from typing import Any, Dict, Tuple, Union
 
 import bcrypt
 
 from datetime import datetime, timedelta, timezone
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from passlib.context import CryptContext
 from pydantic import ValidationError
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import schemas
+from app.core.cache import cache
 from app.core.config import settings
-from app.db.session import get_db
+from app.core.hashing import PasswordHasher
+from app.db.session import get_async_db, get_db
 from app.models import User
 
 logger = logging.getLogger(__name__)
@@ -27,22 +32,58 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 reusable_oauth2 = OAuth2PasswordBearer(tokenUrl=settings.TOKEN_URL)
 
 
-def get_password_hash(password: str) -> str:
-    """Hash a password using bcrypt."""
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+    timeout=settings.PASSWORD_HASH_TIMEOUT,
+)
+
+
+def _hash_password(password: str) -> str:
     # Generate a salt
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     # Hash the password with the salt
     hashed_password = bcrypt.hashpw(password.encode("utf-8"), salt)
     return hashed_password.decode("utf-8")
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plain password against a hashed password."""
+def _check_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(
         plain_password.encode("utf-8"), hashed_password.encode("utf-8")
     )
 
 
+def get_password_hash(password: str) -> str:
+    """Hash a password using bcrypt."""
+    return password_hasher.run(_hash_password, password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a plain password against a hashed password."""
+    return password_hasher.run(_check_password, plain_password, hashed_password)
+
+
+async def async_get_password_hash(password: str) -> str:
+    """Hash a password, awaiting the hashing pool instead of blocking."""
+    return await password_hasher.run_async(_hash_password, password)
+
+
+async def async_verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password, awaiting the hashing pool instead of blocking."""
+    return await password_hasher.run_async(
+        _check_password, plain_password, hashed_password
+    )
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a hash was made with another cost factor than configured."""
+    # bcrypt hashes look like $2b$<cost>$<salt and hash>
+    try:
+        return int(hashed_password.split("$")[2]) != settings.BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+
 def create_access_token(data: dict):
     """Create access token."""
     to_encode = data.copy()
@@ -57,24 +98,122 @@ def create_access_token(data: dict):
     return encoded_jwt
 
 
+def user_cache_key(user_id: int) -> str:
+    """Return the cache key of a user principal."""
+    return f"user:{user_id}"
+
+
+# Session.info entry of the users to drop from the cache once it commits.
+INVALIDATED_USERS = "invalidated_users"
+
+
+def invalidate_user(db: Session, user_id: int) -> None:
+    """Drop a cached user principal once the change to the user committed.
+
+    Dropping it before the commit would let a concurrent request cache the
+    old row again, for the whole ``USER_CACHE_TTL``.
+    """
+    db.info.setdefault(INVALIDATED_USERS, set()).add(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _drop_invalidated_users(session: Session) -> None:
+    """Drop the cached principals of the users a commit changed."""
+    for user_id in session.info.pop(INVALIDATED_USERS, ()):
+        cache.delete(user_cache_key(user_id))
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _keep_cached_users(session: Session, previous_transaction: Any) -> None:
+    """Forget the invalidations of a rolled back transaction."""
+    # A savepoint rolling back leaves the rest of the transaction to commit.
+    if not previous_transaction.nested:
+        session.info.pop(INVALIDATED_USERS, None)
+
+
+@lru_cache
+def _user_repository():
+    # use lazy import to avoid circular import error
+    from app.repositories.user import UserRepository
+
+    return UserRepository(User)
+
+
+def _cached_user(user_id: int) -> Union[schemas.UserOut, None]:
+    """Return the cached user principal, if it is fresh."""
+    if settings.USER_CACHE_TTL:
+        cached = cache.get(user_cache_key(user_id))
+        if cached is not None:
+            return schemas.UserOut.model_validate(cached)
+    return None
+
+
+def _cache_user(user: Any) -> schemas.UserOut:
+    """Cache a loaded user as its principal."""
+    principal = schemas.UserOut.model_validate(user)
+    if settings.USER_CACHE_TTL:
+        cache.set(
+            user_cache_key(principal.id),
+            principal.model_dump(),
+            settings.USER_CACHE_TTL,
+        )
+    return principal
+
+
+def load_user(db: Session, user_id: int) -> schemas.UserOut:
+    """Return a user principal, from the cache when it is fresh."""
+    user = _cached_user(user_id)
+    if user is None:
+        user = _cache_user(_user_repository().get(db, user_id))
+    return user
+
+
+async def async_load_user(db: AsyncSession, user_id: int) -> schemas.UserOut:
+    """Return a user principal, like ``load_user``, over an async session."""
+    user = _cached_user(user_id)
+    if user is None:
+        user = _cache_user(await _user_repository().async_get(db, user_id))
+    return user
+
+
+def _decode_token(token: str) -> Tuple[Dict[str, Any], schemas.TokenPayload]:
+    """Verify a token and return its claims."""
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    return payload, schemas.TokenPayload(**payload)
+
+
 def get_current_user(
     db: Session = Depends(get_db), token: str = Depends(reusable_oauth2)
-) -> Union[User, None]:  # pragma: no cover
+) -> Union[schemas.UserOut, None]:  # pragma: no cover
     """Get current user."""
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        token_data = schemas.TokenPayload(**payload)
+        payload, token_data = _decode_token(token)
 
-        # use lazy import to avoid circular import error
-        from app.repositories.user import UserRepository
+        if settings.AUTH_STATELESS:
+            # The claims are signed, so they are trusted until the token expires.
+            return schemas.UserOut(id=token_data.subject, **payload)
 
-        user_repo = UserRepository(User)
-        user = user_repo.get(db, token_data.subject)
-        if not user:
-            raise HTTPException(status_code=404, detail="User not found")
-        return user
+        return load_user(db, token_data.subject)
+
+    except (JWTError, ValidationError):
+        return None
+
+    except Exception as e:
+        logger.error(f"Error: {str(e)}")
+        return None
+
+
+async def async_get_current_user(
+    db: AsyncSession = Depends(get_async_db), token: str = Depends(reusable_oauth2)
+) -> Union[schemas.UserOut, None]:
+    """Get current user over the async session, for the async routes."""
+    try:
+        payload, token_data = _decode_token(token)
+
+        if settings.AUTH_STATELESS:
+            return schemas.UserOut(id=token_data.subject, **payload)
+
+        return await async_load_user(db, token_data.subject)
 
     except (JWTError, ValidationError):
         return None
@@ -85,7 +224,14 @@ def get_current_user(
 
 
 def get_current_active_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: schemas.UserOut = Depends(get_current_user),
+) -> schemas.UserOut:
     """Get current active user."""
     return current_user
+
+
+async def async_get_current_active_user(
+    current_user: schemas.UserOut = Depends(async_get_current_user),
+) -> schemas.UserOut:
+    """Get current active user, without the sync session or the threadpool."""
+    return current_user
@@ -0,0 +1,62 @@
+"""Uploaded files."""
+
+import logging
+import os
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Session.info entries of the files to write, and of the ``(directory, path)``
+# to remove, once the session commits.
+WRITES = "upload_writes"
+SUPERSEDED = "superseded_uploads"
+
+
+def remove_upload(directory: str, path: Optional[str]) -> None:
+    """Delete an uploaded file, if it is still there."""
+    if not path:
+        return
+    # Stored values are paths or bare names; only ever look in ``directory``.
+    file_path = os.path.join(directory, os.path.basename(path))
+    try:
+        os.remove(file_path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.error(f"Could not remove {file_path}: {e}")
+
+
+def write_after_commit(db: Session, file_path: str, content: bytes) -> None:
+    """Write an uploaded file once the change that refers to it commits."""
+    db.info.setdefault(WRITES, {})[file_path] = content
+
+
+def remove_after_commit(db: Session, directory: str, path: Optional[str]) -> None:
+    """Delete an uploaded file once the change that replaced it commits."""
+    if path:
+        db.info.setdefault(SUPERSEDED, set()).add((directory, path))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_uploads(session: Session) -> None:
+    """Write the files a committed change refers to, and drop those it replaced."""
+    for file_path, content in session.info.pop(WRITES, {}).items():
+        try:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, "wb") as buffer:
+                buffer.write(content)
+        except OSError as e:
+            logger.error(f"Could not write {file_path}: {e}")
+    for directory, path in session.info.pop(SUPERSEDED, ()):
+        remove_upload(directory, path)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_uploads(session: Session, previous_transaction: Any) -> None:
+    """Forget the files of a rolled back change; a savepoint leaves them pending."""
+    if not previous_transaction.nested:
+        session.info.pop(WRITES, None)
+        session.info.pop(SUPERSEDED, None)
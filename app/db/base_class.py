@@ -2,8 +2,14 @@
 
 from typing import Any
 
+from sqlalchemy import text
 from sqlalchemy.orm import as_declarative, declared_attr
 
+# Partial index predicates of soft-deleted models: the listing indexes hold
+# the live rows only, and a small one finds the rows waiting for the purge.
+LIVE = text("deleted_at IS NULL")
+DELETED = text("deleted_at IS NOT NULL")
+
 
 @as_declarative()
 class Base:
@@ -1,35 +1,181 @@
 """Session."""
 
-from typing import Generator
+import threading
+from typing import Any, AsyncGenerator, Dict, Generator, Optional, Type
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from fastapi import Request
+from sqlalchemy import create_engine, event, make_url
+from sqlalchemy.engine import URL, Connection, Engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, SessionTransaction, sessionmaker
+from sqlalchemy.pool import NullPool, Pool
 from sqlalchemy_utils import database_exists, create_database
 
 from app.core.config import settings
+from app.db.pool import MeteredAsyncQueuePool, MeteredQueuePool
 
 
 load_dotenv()
 
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URL, pool_pre_ping=True)
 
-# Create database if it does not exist
-if not database_exists(engine.url):
-    create_database(engine.url)  # pragma: no cover
-else:
-    # Connect the database if exists
-    engine.connect()
+def engine_options(
+    url: URL, pool_class: Type[Pool] = MeteredQueuePool
+) -> Dict[str, Any]:
+    """Return the pool and connection options for an engine on ``url``."""
+    options: Dict[str, Any] = {"pool_pre_ping": True}
+    if url.get_backend_name() != "postgresql":
+        return options
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    connect_args: Dict[str, Any] = {}
+    if settings.DB_EXTERNAL_POOLER:
+        # PgBouncer owns the pool; transaction pooling cannot keep prepared
+        # statements or startup parameters across server connections.
+        options["poolclass"] = NullPool
+        if url.get_driver_name() == "psycopg":
+            connect_args["prepare_threshold"] = None
+    else:
+        options.update(
+            poolclass=pool_class,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_use_lifo=settings.DB_POOL_USE_LIFO,
+        )
+        if settings.DB_STATEMENT_TIMEOUT_MS:
+            connect_args["options"] = (
+                f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+            )
+
+    if connect_args:
+        options["connect_args"] = connect_args
+    return options
+
+
+def pool_metrics(bound_engine) -> Dict[str, Any]:
+    """Return the checkout metrics of an engine's pool, if it collects any."""
+    pool = bound_engine.pool
+    metrics = getattr(pool, "metrics", None)
+    if metrics is None:
+        return {"pool": pool.status()}
+    return metrics.snapshot(pool)
+
+
+_engine: Optional[Engine] = None
+_async_engine: Optional[AsyncEngine] = None
+_engine_lock = threading.Lock()
+
+# Objects stay loaded after commit, so validating the record a write returned
+# does not reload it.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False)
+
+# Objects must stay loaded after commit: lazy loads cannot run in async code.
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
+
+ASYNC_DRIVERS = {"postgresql": "postgresql+psycopg", "sqlite": "sqlite+aiosqlite"}
+
+# Requests of these methods only read; see get_db.
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+@event.listens_for(Session, "after_begin")
+def _begin_read_only(
+    session: Session, transaction: SessionTransaction, connection: Connection
+) -> None:
+    """Open the transactions of read-only sessions as READ ONLY."""
+    if session.info.get("read_only") and connection.dialect.name == "postgresql":
+        # Transaction scoped, so it holds behind a transaction pooler too.
+        connection.exec_driver_sql("SET TRANSACTION READ ONLY")
+
+
+def get_async_database_url() -> URL:
+    """Return the async database URL, derived from the sync one by default."""
+    if settings.SQLALCHEMY_ASYNC_DATABASE_URL:
+        return make_url(settings.SQLALCHEMY_ASYNC_DATABASE_URL)
+
+    url = make_url(settings.SQLALCHEMY_DATABASE_URL)
+    return url.set(drivername=ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername))
+
+
+def get_engine() -> Engine:
+    """Return the engine, creating it on first use."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            url = make_url(settings.SQLALCHEMY_DATABASE_URL)
+            _engine = create_engine(url, **engine_options(url))
+    return _engine
+
+
+def get_async_engine() -> AsyncEngine:
+    """Return the async engine, creating it on first use."""
+    global _async_engine
+    with _engine_lock:
+        if _async_engine is None:
+            url = get_async_database_url()
+            _async_engine = create_async_engine(
+                url, **engine_options(url, MeteredAsyncQueuePool)
+            )
+    return _async_engine
+
+
+def init_db() -> None:
+    """Create the database if it does not exist and check it is reachable."""
+    engine = get_engine()
+    if not database_exists(engine.url):
+        create_database(engine.url)  # pragma: no cover
+
+    with engine.connect():
+        pass
+
+
+async def dispose_engines() -> None:
+    """Close the pooled connections of the engines created so far."""
+    global _engine, _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+    if _engine is not None:
+        _engine.dispose()
+        _engine = None
 
 
 # Dependency callable for DB
-def get_db() -> Generator:
-    """Yield a new database session."""
-    db = None
-    try:
-        db = SessionLocal()
-        yield db
-    finally:
-        db.close()
+def get_db(request: Request) -> Generator:
+    """Yield the request's session, a unit of work over one transaction.
+
+    Repositories only flush. The writes of a request are committed together
+    once the route returned and rolled back together if it raised. Requests
+    with a read-only method run in a READ ONLY transaction instead, which is
+    never committed.
+    """
+    read_only = request.method in READ_ONLY_METHODS
+    with SessionLocal(bind=get_engine(), info={"read_only": read_only}) as db:
+        try:
+            yield db
+            if not read_only:
+                db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+
+# Dependency callable for async DB
+async def get_async_db(request: Request) -> AsyncGenerator:
+    """Yield the request's async session, a unit of work like ``get_db``."""
+    read_only = request.method in READ_ONLY_METHODS
+    async with AsyncSessionLocal(
+        bind=get_async_engine(), info={"read_only": read_only}
+    ) as db:
+        try:
+            yield db
+            if not read_only:
+                await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
@@ -1,16 +1,37 @@
 """Main."""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi_pagination import add_pagination
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.cors import CORSMiddleware
 from starlette.staticfiles import StaticFiles
 
 from app.controllers.api.v1.endpoints.base import api_controller
+from app.core.compression import CompressionMiddleware
+from app.core.config import settings
 from app.core.logging_config import setup_logging
+from app.core.responses import DefaultResponse
+from app.db.session import dispose_engines, init_db
 
 setup_logging()
 
-app = FastAPI(title="Project", version="1")
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Bootstrap the database on startup and release the pools on shutdown."""
+    await run_in_threadpool(init_db)
+    yield
+    await dispose_engines()
+
+
+app = FastAPI(
+    title="Project",
+    version="1",
+    lifespan=lifespan,
+    default_response_class=DefaultResponse,
+)
 
 # Allow all origins
 app.add_middleware(
@@ -19,6 +40,14 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Static files under /public are logos, already compressed images.
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    exclude_paths=("/public",),
+)
 
 
 app.mount("/public", StaticFiles(directory="public"), name="public")
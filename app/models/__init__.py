@@ -5,3 +5,4 @@ from .user import User  # noqa
 from .job import Job  # noqa
 from .application import Application  # noqa
 from .save_job import SavedJob  # noqa
+from .job_facet import JobFacet  # noqa
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, String, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, String, DateTime, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -18,5 +18,19 @@ class Application(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        # Keyset pagination: ORDER BY updated_at DESC, id DESC
+        Index("ix_application_updated_at_id", updated_at.desc(), id.desc()),
+        Index(
+            "ix_application_job_id_updated_at_id",
+            job_id, updated_at.desc(), id.desc(),
+        ),
+        Index(
+            "ix_application_user_id_updated_at_id",
+            user_id, updated_at.desc(), id.desc(),
+        ),
+        Index("uq_application_user_id_job_id", user_id, job_id, unique=True),
+    )
+
     user = relationship("User", back_populates="applications")
     job = relationship("Job", back_populates="applications")
@@ -1,26 +1,120 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Boolean, Text, DateTime
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
+from sqlalchemy.orm import deferred, relationship, validates
 from datetime import datetime
 
-from app.db.base_class import Base
+from app.core.salary import parse_salary
+from app.db.base_class import DELETED, LIVE, Base
+
+
+def split_tags(tags: str) -> list:
+    """Split a comma separated tag string, dropping blanks."""
+    return [tag.strip() for tag in tags.split(",") if tag.strip()]
 
 
 class Job(Base):
     """Job Model."""
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("user.id"), nullable=False)  # Links to User table
+    # Links to User table
+    user_id = Column(
+        Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+    )
     title = Column(String, nullable=True)
     company = Column(String, nullable=True)
     description = Column(Text, nullable=True)
     salary = Column(String, nullable=True)
+    # Parsed from salary on every write; see validate_salary.
+    salary_min = Column(BigInteger, nullable=True)
+    salary_max = Column(BigInteger, nullable=True)
+    salary_currency = Column(String(3), nullable=True)
     location = Column(String, nullable=True)
-    tags = Column(String, nullable=True)
+    tags = Column(ARRAY(String), nullable=True)
     is_remote = Column(Boolean, default=True)
     logo = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Maintained by the job_search_vector_update trigger; see JobRepository.
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
+    # Set by a delete; app.commands.purge_deleted removes the row later.
+    deleted_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # Keyset pagination: ORDER BY updated_at DESC, id DESC
+        Index(
+            "ix_job_updated_at_id",
+            updated_at.desc(), id.desc(),
+            postgresql_where=LIVE,
+        ),
+        # Also serves the user foreign key cascade, so it keeps deleted jobs.
+        Index("ix_job_user_id_updated_at_id", user_id, updated_at.desc(), id.desc()),
+        # Listing filters and the created_at sort
+        Index(
+            "ix_job_created_at_id",
+            created_at.desc(), id.desc(),
+            postgresql_where=LIVE,
+        ),
+        Index(
+            "ix_job_location_updated_at_id",
+            location, updated_at.desc(), id.desc(),
+            postgresql_where=LIVE,
+        ),
+        Index(
+            "ix_job_company_updated_at_id",
+            company, updated_at.desc(), id.desc(),
+            postgresql_where=LIVE,
+        ),
+        Index(
+            "ix_job_is_remote_updated_at_id",
+            is_remote, updated_at.desc(), id.desc(),
+            postgresql_where=LIVE,
+        ),
+        Index(
+            "ix_job_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+            postgresql_where=LIVE,
+        ),
+        Index("ix_job_tags", tags, postgresql_using="gin", postgresql_where=LIVE),
+        # Salary range filters and the salary sort
+        Index(
+            "ix_job_salary_max_id",
+            salary_max.desc().nulls_last(), id.desc(),
+            postgresql_where=LIVE,
+        ),
+        Index("ix_job_salary_min", salary_min, postgresql_where=LIVE),
+        # Rows waiting for the purge
+        Index("ix_job_deleted_at", deleted_at, postgresql_where=DELETED),
+    )
+
+    @validates("tags")
+    def validate_tags(self, key, tags):
+        """Store the comma separated tags of the API as a list."""
+        if isinstance(tags, str):
+            return split_tags(tags)
+        return tags
+
+    @validates("salary")
+    def validate_salary(self, key, salary):
+        """Keep the numeric salary columns in step with the salary text."""
+        self.salary_min, self.salary_max, self.salary_currency = parse_salary(salary)
+        return salary
 
     user = relationship("User", back_populates="jobs")
-    applications = relationship("Application", back_populates="job", cascade="all, delete")
-    saved_jobs = relationship("SavedJob", back_populates="job", cascade="all, delete")
+    # Children are removed by the ON DELETE CASCADE foreign keys, not loaded.
+    applications = relationship(
+        "Application", back_populates="job", cascade="all, delete", passive_deletes=True
+    )
+    saved_jobs = relationship(
+        "SavedJob", back_populates="job", cascade="all, delete", passive_deletes=True
+    )
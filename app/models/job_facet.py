@@ -0,0 +1,13 @@
+"""Job facet model."""
+
+from sqlalchemy import Column, Integer, String
+
+from app.db.base_class import Base
+
+
+class JobFacet(Base):
+    """Number of jobs per facet value, kept current by the job use cases."""
+
+    facet = Column(String, primary_key=True)
+    value = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
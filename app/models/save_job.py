@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, Integer, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 
 from app.db.base_class import Base
@@ -9,10 +9,21 @@ from app.db.base_class import Base
 class SavedJob(Base):
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("user.id"))
-    job_id = Column(Integer, ForeignKey("job.id"))
+    user_id = Column(Integer, ForeignKey("user.id", ondelete="CASCADE"))
+    job_id = Column(Integer, ForeignKey("job.id", ondelete="CASCADE"))
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        # Keyset pagination: ORDER BY updated_at DESC, id DESC
+        Index("ix_savedjob_updated_at_id", updated_at.desc(), id.desc()),
+        Index(
+            "ix_savedjob_user_id_updated_at_id",
+            user_id, updated_at.desc(), id.desc(),
+        ),
+        Index("ix_savedjob_job_id", job_id),
+        Index("uq_savedjob_user_id_job_id", user_id, job_id, unique=True),
+    )
+
     user = relationship("User", back_populates="saved_jobs")
     job = relationship("Job", back_populates="saved_jobs")
@@ -1,10 +1,10 @@
 """User model."""
 from datetime import datetime
 
-from sqlalchemy import Column, String, Integer, Boolean, DateTime
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, Index
 from sqlalchemy.orm import relationship
 
-from app.db.base_class import Base
+from app.db.base_class import DELETED, LIVE, Base
 
 
 class User(Base):
@@ -19,7 +19,30 @@ class User(Base):
     hashed_password = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Set by a delete; app.commands.purge_deleted removes the row later.
+    deleted_at = Column(DateTime, nullable=True)
 
-    jobs = relationship("Job", back_populates="user", cascade="all, delete")
-    applications = relationship("Application", back_populates="user", cascade="all, delete")
-    saved_jobs = relationship("SavedJob", back_populates="user", cascade="all, delete")
+    __table_args__ = (
+        Index("ix_user_email", email, postgresql_where=LIVE),
+        Index(
+            "ix_user_updated_at_id",
+            updated_at.desc(), id.desc(),
+            postgresql_where=LIVE,
+        ),
+        # Rows waiting for the purge
+        Index("ix_user_deleted_at", deleted_at, postgresql_where=DELETED),
+    )
+
+    # Children are removed by the ON DELETE CASCADE foreign keys, not loaded.
+    jobs = relationship(
+        "Job", back_populates="user", cascade="all, delete", passive_deletes=True
+    )
+    applications = relationship(
+        "Application",
+        back_populates="user",
+        cascade="all, delete",
+        passive_deletes=True,
+    )
+    saved_jobs = relationship(
+        "SavedJob", back_populates="user", cascade="all, delete", passive_deletes=True
+    )
@@ -1,46 +1,77 @@
 """Application Repository."""
 from http import HTTPStatus
-from typing import List, cast, Optional, Union
+from typing import Any, List, Optional, Sequence, Tuple
 
-from sqlalchemy import desc
-from sqlalchemy.orm import Session
-from starlette.responses import JSONResponse
+from fastapi_pagination import Page
+from sqlalchemy import exists, literal_column, or_, select
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.sql import ColumnElement, Select
 
-from app.models import Application
+from app.models import Application, Job, User
 from app.repositories.base import BaseRepository
-from app.schemas import ApplicationIn
+from app.repositories.job import JobRepository
+from app.repositories.user import UserRepository
+from app.schemas import ApplicationIn, ApplicationOut
+from app.schemas.pagination import CursorPage
 from exceptions.exceptions import APIException
 
 
 class ApplicationRepository(BaseRepository[Application, ApplicationIn, ApplicationIn]):
     """Application Repository Class."""
 
-    @staticmethod
-    def get_all_by_job_id(db: Session, *, job_id: int) -> List[Application]:
-        """Get by user id."""
-        response = cast(
-            List[Application],
-            db.query(Application).filter(Application.job_id == job_id).order_by(desc(Application.updated_at)).all(),
+    def live_criteria(self) -> tuple:
+        """Leave out the applications of soft-deleted jobs or users."""
+        return (
+            Application.job.has(Job.deleted_at.is_(None)),
+            Application.user.has(User.deleted_at.is_(None)),
         )
 
-        return response
+    def get_all_by_job_id_paginated(
+        self, db: Session, *, job_id: int
+    ) -> Page[Any]:
+        """Get a page of applications by job id, as the columns of ApplicationOut."""
+        return self.paginate(
+            db,
+            self._by_job_id_query(
+                job_id, self.columns(list(ApplicationOut.model_fields))
+            ),
+        )
+
+    def get_all_by_job_id_version(
+        self, db: Session, *, job_id: int
+    ) -> Tuple[Any, ...]:
+        """Get the version of the list returned by ``get_all_by_job_id_paginated``."""
+        return self.get_list_version(db, self._by_job_id_query(job_id))
 
-    @staticmethod
-    def get_all_by_user_id(db: Session, *, user_id: int) -> List[Application]:
-        """Get by user id."""
-        response = cast(
-            List[Application],
-            db.query(Application).filter(Application.user_id == user_id).order_by(desc(Application.updated_at)).all(),
+    def get_feed_by_job_id(
+        self, db: Session, *, job_id: int, cursor: Optional[str], size: int
+    ) -> CursorPage[Any]:
+        """Get the page of applications by job id after ``cursor``."""
+        return self.paginate_by_cursor(
+            db, self._by_job_id_query(job_id), cursor=cursor, size=size
         )
 
-        return response
+    def _by_job_id_query(
+        self, job_id: int, columns: Optional[Sequence[Any]] = None
+    ) -> Select:
+        """Applications to a job, newest first."""
+        return (
+            self._select(columns)
+            .filter(Application.job_id == job_id)
+            .order_by(*self.default_order_by())
+        )
 
-    @staticmethod
-    def get_by_user_id_and_job_id(db: Session, *, user_id: int, job_id: int) -> Application:
+    def get_by_user_id_and_job_id(
+        self, db: Session, *, user_id: int, job_id: int
+    ) -> Application:
         """Get a single application by user ID and job ID."""
         application: Optional[Application] = (
             db.query(Application)
-            .filter(Application.user_id == user_id, Application.job_id == job_id)
+            .filter(
+                Application.user_id == user_id,
+                Application.job_id == job_id,
+                *self.live_criteria(),
+            )
             .first()
         )
 
@@ -49,3 +80,62 @@ class ApplicationRepository(BaseRepository[Application, ApplicationIn, Applicati
                 status_code=HTTPStatus.NOT_FOUND, detail="Record not found."
             )
         return application
+
+    def apply(
+        self,
+        db: Session,
+        *,
+        obj_in: ApplicationIn,
+        where: Sequence[ColumnElement] = (),
+    ) -> Tuple[Application, Optional[str]]:
+        """Create the application of a user to a job; applying again updates it.
+
+        One ``upsert`` round trip, which also returns the resume path an
+        update replaced when no other application holds it, so its file can
+        be removed.
+        """
+        before, other = aliased(Application), aliased(Application)
+        # The written row by name: a mapped column would be added to the
+        # subquery's FROM, as RETURNING does not correlate.
+        written_id = literal_column("application.id")
+        written_resume = literal_column("application.resume")
+        # Subqueries of RETURNING see the rows as they were before the write.
+        unused_resume = (
+            select(before.resume)
+            .filter(
+                before.id == written_id,
+                before.resume != written_resume,
+                ~exists().where(
+                    other.resume == before.resume, other.id != before.id
+                ),
+            )
+            .scalar_subquery()
+        )
+        statement = self._upsert_statement(
+            obj_in,
+            ("user_id", "job_id"),
+            ("email", "mobile_number", "expected_salary", "resume"),
+            where,
+        ).returning(unused_resume)
+        application, resume = self._execute_insert(db, statement, row=True)
+        return application, resume
+
+    def purge_deleted(
+        self, db: Session, *, after_id: int, batch_size: int
+    ) -> List[Any]:
+        """Remove the next batch of applications of deleted jobs or users.
+
+        Returns their ids and resume paths.
+        """
+        return self.delete_batch(
+            db,
+            criteria=[
+                or_(
+                    Application.job_id.in_(JobRepository.deleted_ids()),
+                    Application.user_id.in_(UserRepository.deleted_ids()),
+                )
+            ],
+            after_id=after_id,
+            batch_size=batch_size,
+            returning=[Application.resume],
+        )
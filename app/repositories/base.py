@@ -1,15 +1,47 @@
 """Base Repository."""
 
 import logging
+from datetime import datetime
+from functools import lru_cache
 from http import HTTPStatus
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from fastapi.encoders import jsonable_encoder
+from fastapi_pagination import Page
+from fastapi_pagination.ext.sqlalchemy import paginate as sqlalchemy_paginate
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
-from sqlalchemy import exc, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, Session, aliased
+from sqlalchemy import (
+    delete,
+    exc,
+    desc,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import ColumnElement, Delete, Insert, Select, Update
 
+from app.core.cursor import decode_cursor, encode_cursor
 from app.db.base_class import Base
+from app.schemas.pagination import CursorPage
 from exceptions.exceptions import DatabaseException, APIException
 
 logger = logging.getLogger(__name__)
@@ -19,6 +51,29 @@ CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
+@lru_cache(maxsize=None)
+def row_type(fields: Tuple[str, ...]) -> type:
+    """A ``__slots__`` class holding one projected row.
+
+    Instances carry no ORM state and validate straight into the ``*Out``
+    schemas through ``from_attributes``.
+    """
+
+    def __init__(self, *values: Any):
+        for name, value in zip(fields, values):
+            setattr(self, name, value)
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in fields)
+        return f"ProjectedRow({values})"
+
+    return type(
+        "ProjectedRow",
+        (),
+        {"__slots__": fields, "__init__": __init__, "__repr__": __repr__},
+    )
+
+
 class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """Base Repository."""
 
@@ -35,7 +90,12 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def get_all(self, db: Session) -> List[ModelType]:
         """Retrieve all records, with optional pagination."""
         try:
-            return db.query(self.model).order_by(desc(self.model.updated_at)).all()
+            return (
+                db.query(self.model)
+                .filter(*self.live_criteria())
+                .order_by(*self.default_order_by())
+                .all()
+            )
         except Exception as e:
             # Log the exception (you may want to use your logger here)
             logger.error(f"Error fetching all items: {str(e)}")
@@ -44,9 +104,168 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 detail="An error occurred while fetching the items.",
             ) from e
 
+    def get_all_projected(self, db: Session, fields: Sequence[str]) -> List[Any]:
+        """Retrieve the named columns of all records, without loading entities."""
+        query = self._select(self.columns(fields)).order_by(*self.default_order_by())
+        return self.project(db, query)
+
+    def project(self, db: Session, query: Select) -> List[Any]:
+        """Run a column select and return its rows as ``__slots__`` objects."""
+        try:
+            result = db.execute(query)
+        except Exception as e:
+            logger.error(f"Error fetching items: {str(e)}")
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An error occurred while fetching the items.",
+            ) from e
+        return self._projected_rows(query)(result)
+
+    def columns(self, fields: Sequence[str]) -> List[InstrumentedAttribute]:
+        """The columns of the requested fields, the primary key first."""
+        return [
+            self.model.id,
+            *(getattr(self.model, name) for name in fields if name != "id"),
+        ]
+
+    def _select(self, columns: Optional[Sequence[Any]]) -> Select:
+        """Select live records, or only their ``columns`` to keep rows narrow."""
+        query = select(*columns) if columns else select(self.model)
+        return query.filter(*self.live_criteria())
+
+    @staticmethod
+    def _is_projection(query: Select) -> bool:
+        """Whether a select returns columns rather than one entity."""
+        descriptions = query.column_descriptions
+        return (
+            len(descriptions) != 1
+            or descriptions[0]["expr"] is not descriptions[0]["entity"]
+        )
+
+    @staticmethod
+    def _projected_rows(query: Select) -> Callable[[Any], List[Any]]:
+        """Turn the rows of a column select into ``__slots__`` objects."""
+        cls = row_type(tuple(query.selected_columns.keys()))
+        return lambda rows: [cls(*row) for row in rows]
+
+    def get_all_paginated(self, db: Session) -> Page[ModelType]:
+        """Retrieve the current page of records, limited and counted in SQL."""
+        query = self._select(None).order_by(*self.default_order_by())
+        return self.paginate(db, query)
+
+    def paginate(self, db: Session, query: Select, **kwargs: Any) -> Page[Any]:
+        """Paginate a select statement with LIMIT/OFFSET and a COUNT query.
+
+        Page params are resolved from the request the same way as
+        ``fastapi_pagination.paginate``, so only one page of rows is loaded.
+        Extra keyword arguments (e.g. ``transformer``) are passed through.
+        Rows of a column select come back as ``__slots__`` objects.
+        """
+        if self._is_projection(query):
+            kwargs.setdefault("transformer", self._projected_rows(query))
+        try:
+            return sqlalchemy_paginate(db, query, **kwargs)
+        except Exception as e:
+            logger.error(f"Error paginating items: {str(e)}")
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An error occurred while fetching the items.",
+            ) from e
+
+    def get_feed(
+        self, db: Session, *, cursor: Optional[str], size: int
+    ) -> CursorPage[Any]:
+        """Retrieve the page of records after ``cursor``."""
+        query = self._select(None).order_by(*self.default_order_by())
+        return self.paginate_by_cursor(db, query, cursor=cursor, size=size)
+
+    def paginate_by_cursor(
+        self,
+        db: Session,
+        query: Select,
+        *,
+        cursor: Optional[str],
+        size: int,
+        transformer: Optional[Callable[[List[Any]], List[Any]]] = None,
+    ) -> CursorPage[Any]:
+        """Keyset-paginate a query ordered by ``(updated_at, id)`` descending.
+
+        The cursor holds the sort key of the last row already returned, so
+        each page is an index range scan without OFFSET or COUNT.
+        """
+        query = self._after_cursor(query, cursor)
+
+        try:
+            result = db.execute(query.limit(size + 1))
+        except Exception as e:
+            logger.error(f"Error fetching feed: {str(e)}")
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An error occurred while fetching the items.",
+            ) from e
+
+        return self._cursor_page(result, query, size=size, transformer=transformer)
+
+    def _after_cursor(self, query: Select, cursor: Optional[str]) -> Select:
+        """Restrict a query to the rows sorted after ``cursor``."""
+        if cursor is None:
+            return query
+
+        updated_at, _id = decode_cursor(cursor)
+        return query.filter(
+            tuple_(self.model.updated_at, self.model.id) < (updated_at, _id)
+        )
+
+    @staticmethod
+    def _cursor_page(
+        result: Any,
+        query: Select,
+        *,
+        size: int,
+        transformer: Optional[Callable[[List[Any]], List[Any]]],
+    ) -> CursorPage[Any]:
+        """Build a cursor page from the ``size + 1`` rows fetched."""
+        # Entity selects come back as one-element rows; projections as rows.
+        single = len(query.column_descriptions) == 1
+        rows = list(result.scalars() if single else result)
+
+        next_cursor = None
+        if len(rows) > size:
+            rows = rows[:size]
+            next_cursor = encode_cursor(rows[-1].updated_at, rows[-1].id)
+
+        items = transformer(rows) if transformer else rows
+        return CursorPage(items=items, size=size, next_cursor=next_cursor)
+
+    def default_order_by(self) -> tuple:
+        """Newest first, with the primary key as a stable tie breaker."""
+        updated_at = getattr(self.model, "updated_at", None)
+        if updated_at is None:
+            return (desc(self.model.id),)
+        return desc(updated_at), desc(self.model.id)
+
+    def live_exists(self, _id: int) -> ColumnElement:
+        """EXISTS over the live record ``_id``, to check it in another statement."""
+        return exists().where(self.model.id == _id, *self.live_criteria())
+
+    def live_criteria(self) -> tuple:
+        """Leave out soft-deleted records, for models with a ``deleted_at``.
+
+        The listing indexes of those models are partial on the same
+        predicate, so every read must carry it to use them.
+        """
+        deleted_at = getattr(self.model, "deleted_at", None)
+        if deleted_at is None:
+            return ()
+        return (deleted_at.is_(None),)
+
     def get(self, db: Session, _id: int) -> Optional[ModelType]:
         """Get record by its ID.."""
-        item = db.query(self.model).filter(self.model.id == _id).first()
+        item = (
+            db.query(self.model)
+            .filter(self.model.id == _id, *self.live_criteria())
+            .first()
+        )
 
         if item is None:
             raise APIException(
@@ -54,22 +273,138 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             )
         return item
 
+    def get_version(self, db: Session, _id: int) -> Tuple[Any, ...]:
+        """Get the (id, updated_at) of a record without loading the row."""
+        version = db.execute(self._version_query(_id)).first()
+
+        if version is None:
+            raise APIException(
+                status_code=HTTPStatus.NOT_FOUND, detail="Record not found."
+            )
+        return tuple(version)
+
+    def get_list_version(self, db: Session, query: Select) -> Tuple[Any, ...]:
+        """Get the latest updated_at and the row count of a list query."""
+        try:
+            return tuple(db.execute(self._list_version_query(query)).one())
+        except Exception as e:
+            logger.error(f"Error fetching list version: {str(e)}")
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An error occurred while fetching the items.",
+            ) from e
+
+    def get_all_version(self, db: Session) -> Tuple[Any, ...]:
+        """Get the version of the list returned by ``get_all_paginated``."""
+        return self.get_list_version(db, self._select(None))
+
+    def _version_query(self, _id: int) -> Select:
+        """The version columns of one record, served by the primary key."""
+        return select(self.model.id, self.model.updated_at).filter(
+            self.model.id == _id, *self.live_criteria()
+        )
+
+    def _list_version_query(self, query: Select) -> Select:
+        """Replace the columns and order of a list query with its version."""
+        return query.with_only_columns(
+            func.max(self.model.updated_at),
+            func.count(),
+            maintain_column_froms=True,
+        ).order_by(None)
+
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
-        """Create record."""
+        """Create record in one ``INSERT ... RETURNING`` round trip."""
+        statement = (
+            insert(self.model)
+            .values(**self._column_values(jsonable_encoder(obj_in)))
+            .returning(self.model)
+        )
+        return self._execute_insert(db, statement)
+
+    def upsert(
+        self,
+        db: Session,
+        *,
+        obj_in: CreateSchemaType,
+        index_elements: Sequence[str],
+        update_columns: Sequence[str] = (),
+        where: Sequence[ColumnElement] = (),
+    ) -> ModelType:
+        """Create a record, or return the one already holding its unique key.
+
+        One ``INSERT ... ON CONFLICT ... RETURNING`` round trip on the unique
+        index over ``index_elements``. The ``update_columns`` of an existing
+        record are overwritten; by default it is returned as it is. With
+        ``where``, nothing is written unless it holds, and that is a 404.
+        """
+        return self._execute_insert(
+            db, self._upsert_statement(obj_in, index_elements, update_columns, where)
+        )
+
+    def _upsert_statement(
+        self,
+        obj_in: CreateSchemaType,
+        index_elements: Sequence[str],
+        update_columns: Sequence[str],
+        where: Sequence[ColumnElement] = (),
+    ) -> Insert:
+        """Build the ``INSERT ... ON CONFLICT DO UPDATE ... RETURNING``.
+
+        With ``where`` it is an ``INSERT ... SELECT ... WHERE``, which checks
+        the criteria in the same statement.
+        """
+        values = self._column_values(jsonable_encoder(obj_in))
+        table = self.model.__table__
+        if where:
+            row = select(
+                *(
+                    literal(value, table.c[key].type).label(key)
+                    for key, value in values.items()
+                )
+            ).where(*where)
+            statement = postgresql.insert(self.model).from_select(list(values), row)
+        else:
+            statement = postgresql.insert(self.model).values(**values)
+        if update_columns:
+            set_ = {name: statement.excluded[name] for name in update_columns}
+            if "updated_at" in table.c:
+                # ON CONFLICT DO UPDATE skips the columns' ``onupdate``.
+                set_["updated_at"] = datetime.utcnow()
+        else:
+            # DO NOTHING returns no row for a duplicate; assigning the key to
+            # itself changes nothing and returns the existing record.
+            set_ = {index_elements[0]: table.c[index_elements[0]]}
+        return statement.on_conflict_do_update(
+            index_elements=list(index_elements), set_=set_
+        ).returning(self.model)
+
+    @staticmethod
+    def _execute_insert(db: Session, statement: Insert, *, row: bool = False) -> Any:
+        """Run an ``INSERT ... RETURNING`` of one record.
+
+        Returns the record, or with ``row`` every column it returned. An
+        ``INSERT ... SELECT`` whose criteria did not hold is a 404.
+        """
         try:
-            obj_in_data = jsonable_encoder(obj_in)
-            db_obj = self.model(**obj_in_data)  # type: ignore
-            db.add(db_obj)
-            db.commit()
-            db.refresh(db_obj)
+            result = db.execute(statement) if row else db.scalars(statement)
+            db_obj = result.one()
+            db.flush()
+        except exc.NoResultFound as e:
+            db.rollback()
+            raise APIException(
+                status_code=HTTPStatus.NOT_FOUND, detail="Record not found."
+            ) from e
+
         except exc.IntegrityError as e:
             error = e.orig.args
 
+            db.rollback()
             raise DatabaseException(
                 status_code=HTTPStatus.CONFLICT, detail=error[0]
             ) from e
 
         except Exception as e:
+            db.rollback()
             raise DatabaseException(
                 status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
                 detail="An unexpected error occurred.",
@@ -77,49 +412,113 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         return db_obj
 
-    @staticmethod
-    def update(
+    def update_by_id(
+        self,
         db: Session,
         *,
-        db_obj: ModelType,
+        _id: int,
         obj_in: Union[UpdateSchemaType, Dict[str, Any]],
     ) -> ModelType:
-        """Update record by its ID."""
+        """Update a record in one ``UPDATE ... RETURNING`` round trip."""
+        row = self._execute_update(db, self._update_statement(_id, obj_in))
+        return row[0]
+
+    def update_by_id_returning_previous(
+        self,
+        db: Session,
+        *,
+        _id: int,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]],
+        previous: Sequence[str],
+    ) -> Tuple[ModelType, Any]:
+        """Update a record, also returning the ``previous`` values it replaced."""
+        row = self._execute_update(db, self._update_statement(_id, obj_in, previous))
+        return row[0], row_type(tuple(previous))(*row[1:])
+
+    @staticmethod
+    def _execute_update(db: Session, statement: Update) -> Any:
+        """Run an ``UPDATE ... RETURNING`` of one record.
+
+        A missing record or a failure rolls the request's transaction back.
+        """
         try:
-            obj_data = jsonable_encoder(db_obj)
-            update_data = (
-                obj_in.model_dump(exclude_unset=True)
-                if not isinstance(obj_in, dict)
-                else obj_in
-            )
+            row = db.execute(statement).first()
 
-            for field in obj_data:
-                if field in update_data:
-                    setattr(db_obj, field, update_data[field])
+            if row is None:
+                raise APIException(
+                    status_code=HTTPStatus.NOT_FOUND, detail="Record not found."
+                )
+            db.flush()
+            return row
 
-            db.add(db_obj)
-            db.commit()
-            db.refresh(db_obj)
+        except APIException as e:
+            db.rollback()
+            raise e
 
         except exc.IntegrityError as e:
             error = e.orig.args
+            db.rollback()
             raise DatabaseException(
                 status_code=HTTPStatus.CONFLICT, detail=error[0]
             ) from e
 
         except Exception as e:
-            # Handle unexpected exceptions and raise a DatabaseException
+            db.rollback()
             raise DatabaseException(
                 status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
                 detail="An unexpected error occurred during the update.",
             ) from e
 
-        return db_obj
+    def _update_statement(
+        self,
+        _id: int,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]],
+        previous: Sequence[str] = (),
+    ) -> Update:
+        """``UPDATE ... WHERE id = :id RETURNING`` the record.
+
+        With ``previous``, the row is also read locked in a subquery of the
+        same statement, which returns those columns as they were before.
+        """
+        update_data = (
+            obj_in.model_dump(exclude_unset=True)
+            if not isinstance(obj_in, dict)
+            else obj_in
+        )
+        statement = update(self.model).values(**self._column_values(update_data))
+        if not previous:
+            return statement.where(
+                self.model.id == _id, *self.live_criteria()
+            ).returning(self.model)
+
+        before = (
+            select(self.model.id, *(getattr(self.model, name) for name in previous))
+            .filter(self.model.id == _id, *self.live_criteria())
+            .with_for_update()
+            .subquery("previous")
+        )
+        return statement.where(self.model.id == before.c.id).returning(
+            self.model, *(before.c[name] for name in previous)
+        )
+
+    def _column_values(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """The column values of ``data``, after the model's ``@validates`` hooks.
+
+        A transient instance runs the validators (e.g. the parsed job salary
+        and tags) that a Core statement would otherwise skip.
+        """
+        columns = self.model.__mapper__.column_attrs.keys()
+        record = self.model(**{key: data[key] for key in columns if key in data})
+        return {key: record.__dict__[key] for key in columns if key in record.__dict__}
 
     def delete(self, db: Session, *, _id: int) -> ModelType:
-        """Delete a record by its ID."""
+        """Delete a record by its ID in one ``DELETE ... RETURNING``.
+
+        Child rows are removed by the ``ON DELETE CASCADE`` foreign keys, so
+        none of them is loaded into the session.
+        """
         try:
-            obj = db.query(self.model).get(_id)
+            obj = db.scalars(self._delete_statement(_id)).first()
 
             if obj is None:
                 raise APIException(
@@ -127,16 +526,351 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                     detail="Record not found.",
                 )
 
-            db.delete(obj)
-            db.commit()
+            db.flush()
             return obj
 
         except APIException as e:
             # Re-raise the APIException to propagate it correctly
+            db.rollback()
+            raise e
+
+        except Exception as e:
+            db.rollback()
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An unexpected error occurred during the deletion.",
+            ) from e
+
+    def _delete_statement(self, _id: int) -> Delete:
+        """``DELETE ... WHERE id = :id RETURNING`` the record."""
+        return delete(self.model).where(self.model.id == _id).returning(self.model)
+
+    def soft_delete(self, db: Session, *, _id: int) -> ModelType:
+        """Mark a live record deleted in one ``UPDATE ... RETURNING``.
+
+        The row and its children stay until ``app.commands.purge_deleted``
+        removes them in batches; reads leave it out from now on.
+        """
+        return self._execute_update(db, self._soft_delete_statement(_id))[0]
+
+    def _soft_delete_statement(self, _id: int) -> Update:
+        """``UPDATE ... SET deleted_at`` of a live record, returning it."""
+        return (
+            update(self.model)
+            .where(self.model.id == _id, *self.live_criteria())
+            .values(deleted_at=datetime.utcnow())
+            .returning(self.model)
+        )
+
+    def delete_batch(
+        self,
+        db: Session,
+        *,
+        criteria: Sequence[ColumnElement],
+        after_id: int,
+        batch_size: int,
+        returning: Sequence[Any] = (),
+    ) -> List[Any]:
+        """Delete the next ``batch_size`` records matching ``criteria``, by id.
+
+        Returns the id and the ``returning`` columns of every deleted row.
+        """
+        batch = (
+            select(self.model.id)
+            .filter(self.model.id > after_id, *criteria)
+            .order_by(self.model.id)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        rows = db.execute(
+            delete(self.model)
+            .where(self.model.id.in_(batch))
+            .returning(self.model.id, *returning)
+            .execution_options(synchronize_session=False)
+        ).all()
+        db.flush()
+        return rows
+
+    def delete_duplicates(
+        self,
+        db: Session,
+        *,
+        keys: Sequence[str],
+        after_id: int,
+        batch_size: int,
+        returning: Sequence[Any] = (),
+    ) -> List[Any]:
+        """Delete the next batch of records a newer one with the same ``keys`` has.
+
+        The record with the highest id of every ``keys`` value is kept.
+        Returns the id and the ``returning`` columns of every deleted row.
+        """
+        newer = aliased(self.model)
+        superseded = exists().where(
+            *(getattr(newer, key) == getattr(self.model, key) for key in keys),
+            newer.id > self.model.id,
+        )
+        return self.delete_batch(
+            db,
+            criteria=[superseded],
+            after_id=after_id,
+            batch_size=batch_size,
+            returning=returning,
+        )
+
+    @staticmethod
+    def referenced(db: Session, column: Any, values: Sequence[Any]) -> set:
+        """The ``values`` some row still holds in ``column``."""
+        if not values:
+            return set()
+        return set(db.scalars(select(column).filter(column.in_(values)).distinct()))
+
+    # Async variants, used with an ``AsyncSession`` when ``settings.DB_ASYNC``
+    # is enabled. They share the statements built above.
+
+    async def async_get_all_paginated(self, db: AsyncSession) -> Page[ModelType]:
+        """Retrieve the current page of records, limited and counted in SQL."""
+        query = self._select(None).order_by(*self.default_order_by())
+        return await self.async_paginate(db, query)
+
+    async def async_get_all_projected(
+        self, db: AsyncSession, fields: Sequence[str]
+    ) -> List[Any]:
+        """Retrieve the named columns of all records, without loading entities."""
+        query = self._select(self.columns(fields)).order_by(*self.default_order_by())
+        return await self.async_project(db, query)
+
+    async def async_project(self, db: AsyncSession, query: Select) -> List[Any]:
+        """Run a column select and return its rows as ``__slots__`` objects."""
+        try:
+            result = await db.execute(query)
+        except Exception as e:
+            logger.error(f"Error fetching items: {str(e)}")
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An error occurred while fetching the items.",
+            ) from e
+        return self._projected_rows(query)(result)
+
+    async def async_paginate(
+        self, db: AsyncSession, query: Select, **kwargs: Any
+    ) -> Page[Any]:
+        """Paginate a select statement with LIMIT/OFFSET and a COUNT query."""
+        if self._is_projection(query):
+            kwargs.setdefault("transformer", self._projected_rows(query))
+        try:
+            return await sqlalchemy_paginate(db, query, **kwargs)
+        except Exception as e:
+            logger.error(f"Error paginating items: {str(e)}")
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An error occurred while fetching the items.",
+            ) from e
+
+    async def async_get_feed(
+        self, db: AsyncSession, *, cursor: Optional[str], size: int
+    ) -> CursorPage[Any]:
+        """Retrieve the page of records after ``cursor``."""
+        query = self._select(None).order_by(*self.default_order_by())
+        return await self.async_paginate_by_cursor(db, query, cursor=cursor, size=size)
+
+    async def async_paginate_by_cursor(
+        self,
+        db: AsyncSession,
+        query: Select,
+        *,
+        cursor: Optional[str],
+        size: int,
+        transformer: Optional[Callable[[List[Any]], List[Any]]] = None,
+    ) -> CursorPage[Any]:
+        """Keyset-paginate a query ordered by ``(updated_at, id)`` descending."""
+        query = self._after_cursor(query, cursor)
+
+        try:
+            result = await db.execute(query.limit(size + 1))
+        except Exception as e:
+            logger.error(f"Error fetching feed: {str(e)}")
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An error occurred while fetching the items.",
+            ) from e
+
+        return self._cursor_page(result, query, size=size, transformer=transformer)
+
+    async def async_get(self, db: AsyncSession, _id: int) -> Optional[ModelType]:
+        """Get record by its ID."""
+        item = (
+            await db.scalars(self._select(None).filter(self.model.id == _id))
+        ).first()
+
+        if item is None:
+            raise APIException(
+                status_code=HTTPStatus.NOT_FOUND, detail="Record not found."
+            )
+        return item
+
+    async def async_get_version(self, db: AsyncSession, _id: int) -> Tuple[Any, ...]:
+        """Get the (id, updated_at) of a record without loading the row."""
+        version = (await db.execute(self._version_query(_id))).first()
+
+        if version is None:
+            raise APIException(
+                status_code=HTTPStatus.NOT_FOUND, detail="Record not found."
+            )
+        return tuple(version)
+
+    async def async_get_list_version(
+        self, db: AsyncSession, query: Select
+    ) -> Tuple[Any, ...]:
+        """Get the latest updated_at and the row count of a list query."""
+        try:
+            return tuple((await db.execute(self._list_version_query(query))).one())
+        except Exception as e:
+            logger.error(f"Error fetching list version: {str(e)}")
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An error occurred while fetching the items.",
+            ) from e
+
+    async def async_create(
+        self, db: AsyncSession, *, obj_in: CreateSchemaType
+    ) -> ModelType:
+        """Create record in one ``INSERT ... RETURNING`` round trip."""
+        statement = (
+            insert(self.model)
+            .values(**self._column_values(jsonable_encoder(obj_in)))
+            .returning(self.model)
+        )
+        return await self._async_execute_insert(db, statement)
+
+    async def async_upsert(
+        self,
+        db: AsyncSession,
+        *,
+        obj_in: CreateSchemaType,
+        index_elements: Sequence[str],
+        update_columns: Sequence[str] = (),
+        where: Sequence[ColumnElement] = (),
+    ) -> ModelType:
+        """Create a record, or return the one already holding its unique key."""
+        return await self._async_execute_insert(
+            db, self._upsert_statement(obj_in, index_elements, update_columns, where)
+        )
+
+    @staticmethod
+    async def _async_execute_insert(db: AsyncSession, statement: Insert) -> Any:
+        """Run an ``INSERT ... RETURNING`` of one record."""
+        try:
+            db_obj = (await db.scalars(statement)).one()
+            await db.flush()
+        except exc.NoResultFound as e:
+            await db.rollback()
+            raise APIException(
+                status_code=HTTPStatus.NOT_FOUND, detail="Record not found."
+            ) from e
+
+        except exc.IntegrityError as e:
+            error = e.orig.args
+
+            await db.rollback()
+            raise DatabaseException(
+                status_code=HTTPStatus.CONFLICT, detail=error[0]
+            ) from e
+
+        except Exception as e:
+            await db.rollback()
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An unexpected error occurred.",
+            ) from e
+
+        return db_obj
+
+    async def async_update_by_id(
+        self,
+        db: AsyncSession,
+        *,
+        _id: int,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]],
+    ) -> ModelType:
+        """Update a record in one ``UPDATE ... RETURNING`` round trip."""
+        row = await self._async_execute_update(db, self._update_statement(_id, obj_in))
+        return row[0]
+
+    async def async_update_by_id_returning_previous(
+        self,
+        db: AsyncSession,
+        *,
+        _id: int,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]],
+        previous: Sequence[str],
+    ) -> Tuple[ModelType, Any]:
+        """Update a record, also returning the ``previous`` values it replaced."""
+        row = await self._async_execute_update(
+            db, self._update_statement(_id, obj_in, previous)
+        )
+        return row[0], row_type(tuple(previous))(*row[1:])
+
+    @staticmethod
+    async def _async_execute_update(db: AsyncSession, statement: Update) -> Any:
+        """Run an ``UPDATE ... RETURNING`` of one record.
+
+        A missing record or a failure rolls the request's transaction back.
+        """
+        try:
+            row = (await db.execute(statement)).first()
+
+            if row is None:
+                raise APIException(
+                    status_code=HTTPStatus.NOT_FOUND, detail="Record not found."
+                )
+            await db.flush()
+            return row
+
+        except APIException as e:
+            await db.rollback()
             raise e
 
+        except exc.IntegrityError as e:
+            error = e.orig.args
+            await db.rollback()
+            raise DatabaseException(
+                status_code=HTTPStatus.CONFLICT, detail=error[0]
+            ) from e
+
         except Exception as e:
+            await db.rollback()
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An unexpected error occurred during the update.",
+            ) from e
+
+    async def async_delete(self, db: AsyncSession, *, _id: int) -> ModelType:
+        """Delete a record by its ID in one ``DELETE ... RETURNING``."""
+        try:
+            obj = (await db.scalars(self._delete_statement(_id))).first()
+
+            if obj is None:
+                raise APIException(
+                    status_code=HTTPStatus.NOT_FOUND,
+                    detail="Record not found.",
+                )
+
+            await db.flush()
+            return obj
+
+        except APIException as e:
+            await db.rollback()
+            raise e
+
+        except Exception as e:
+            await db.rollback()
             raise DatabaseException(
                 status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
                 detail="An unexpected error occurred during the deletion.",
             ) from e
+
+    async def async_soft_delete(self, db: AsyncSession, *, _id: int) -> ModelType:
+        """Mark a live record deleted in one ``UPDATE ... RETURNING``."""
+        row = await self._async_execute_update(db, self._soft_delete_statement(_id))
+        return row[0]
@@ -1,23 +1,298 @@
 """Job Repository."""
-from typing import Optional, List, cast
+from datetime import datetime
+from http import HTTPStatus
+from typing import Any, List, Optional, Sequence, Tuple
 
-from sqlalchemy import desc
+from fastapi_pagination import Page
+from sqlalchemy import desc, exc, func, literal_column, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement, Select
 
-from app.models import Job
-from app.repositories.base import BaseRepository
-from app.schemas import JobIn
+from app.core.salary import parse_salary
+from app.models import Application, Job
+from app.repositories.base import BaseRepository, row_type
+from app.repositories.user import UserRepository
+from app.schemas import JobFilter, JobIn, JobSort
+from app.schemas.pagination import CursorPage
+from exceptions.exceptions import DatabaseException
+
+SEARCH_CONFIG = literal_column("'english'::regconfig")
+
+# Whitelisted sorts, served by ix_job_created_at_id, ix_job_updated_at_id
+# and ix_job_salary_max_id.
+SORTS = {
+    JobSort.created_at: (desc(Job.created_at), desc(Job.id)),
+    JobSort.updated_at: (desc(Job.updated_at), desc(Job.id)),
+    JobSort.salary: (desc(Job.salary_max).nulls_last(), desc(Job.id)),
+}
 
 
 class JobRepository(BaseRepository[Job, JobIn, JobIn]):
     """Job Repository Class."""
 
+    def get_all_by_user_id_paginated(
+        self, db: Session, *, user_id: int, columns: Optional[Sequence[Any]] = None
+    ) -> Page[Any]:
+        """Get a page of jobs by user id, or of their ``columns`` only."""
+        return self.paginate(db, self._by_user_id_query(user_id, columns))
+
+    def get_feed_by_user_id(
+        self, db: Session, *, user_id: int, cursor: Optional[str], size: int
+    ) -> CursorPage[Any]:
+        """Get the page of jobs by user id after ``cursor``."""
+        return self.paginate_by_cursor(
+            db, self._by_user_id_query(user_id), cursor=cursor, size=size
+        )
+
+    def get_applied_by_user_id_paginated(
+        self, db: Session, *, user_id: int, columns: Optional[Sequence[Any]] = None
+    ) -> Page[Any]:
+        """Get a page of jobs a user applied to, latest application first."""
+        return self.paginate(db, self._applied_by_user_id_query(user_id, columns))
+
+    def search(
+        self,
+        db: Session,
+        *,
+        filters: JobFilter,
+        columns: Optional[Sequence[Any]] = None,
+    ) -> Page[Any]:
+        """Get a page of jobs matching the filters, in the requested order."""
+        return self.paginate(db, self._filtered_query(filters, columns))
+
+    def search_version(self, db: Session, *, filters: JobFilter) -> Tuple[Any, ...]:
+        """Get the version of the list returned by ``search``."""
+        return self.get_list_version(db, self._filtered_query(filters))
+
+    def search_paginated(self, db: Session, *, q: str) -> Page[Job]:
+        """Get a page of jobs matching a full-text query, best match first."""
+        return self.paginate(db, self._full_text_query(q))
+
+    def backfill_search_vector(
+        self, db: Session, *, after_id: int, batch_size: int
+    ) -> Optional[int]:
+        """Fill the search vector of the next batch of jobs; return its last id."""
+        batch = (
+            select(Job.id)
+            .filter(Job.id > after_id)
+            .order_by(Job.id)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        ids = db.scalars(
+            update(Job)
+            .where(Job.id.in_(batch))
+            # Keep updated_at: filling the vector does not change the job.
+            .values(search_vector=self.search_document(), updated_at=Job.updated_at)
+            .returning(Job.id)
+            .execution_options(synchronize_session=False)
+        ).all()
+        db.flush()
+        return max(ids) if ids else None
+
+    def soft_delete_by_user_id(
+        self, db: Session, *, user_id: int, returning: Sequence[str] = ()
+    ) -> List[Any]:
+        """Mark the live jobs of a user deleted; return their id and ``returning``."""
+        try:
+            rows = db.execute(
+                update(Job)
+                .where(Job.user_id == user_id, *self.live_criteria())
+                .values(deleted_at=datetime.utcnow())
+                .returning(Job.id, *(getattr(Job, name) for name in returning))
+                .execution_options(synchronize_session=False)
+            ).all()
+            db.flush()
+        except exc.SQLAlchemyError as e:
+            db.rollback()
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An unexpected error occurred during the deletion.",
+            ) from e
+
+        cls = row_type(("id", *returning))
+        return [cls(*row) for row in rows]
+
+    @staticmethod
+    def deleted_ids() -> Select:
+        """Ids of the deleted jobs, including those of deleted users."""
+        return select(Job.id).filter(
+            or_(
+                Job.deleted_at.is_not(None),
+                Job.user_id.in_(UserRepository.deleted_ids()),
+            )
+        )
+
+    def purge_deleted(
+        self, db: Session, *, after_id: int, batch_size: int
+    ) -> List[Any]:
+        """Remove the next batch of deleted jobs; return their ids and logos."""
+        return self.delete_batch(
+            db,
+            criteria=[Job.id.in_(self.deleted_ids())],
+            after_id=after_id,
+            batch_size=batch_size,
+            returning=[Job.logo],
+        )
+
+    def backfill_salary(
+        self, db: Session, *, after_id: int, batch_size: int
+    ) -> Optional[int]:
+        """Parse the salary of the next batch of jobs; return its last id."""
+        rows = db.execute(
+            select(Job.id, Job.salary, Job.updated_at)
+            .filter(Job.id > after_id)
+            .order_by(Job.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return None
+
+        values = []
+        for row in rows:
+            salary = parse_salary(row.salary)
+            values.append(
+                {
+                    "id": row.id,
+                    "salary_min": salary.minimum,
+                    "salary_max": salary.maximum,
+                    "salary_currency": salary.currency,
+                    # Keep updated_at: parsing does not change the job.
+                    "updated_at": row.updated_at,
+                }
+            )
+        db.execute(update(Job), values)
+        db.flush()
+        return rows[-1].id
+
+    async def async_get_all_by_user_id_paginated(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: int,
+        columns: Optional[Sequence[Any]] = None,
+    ) -> Page[Any]:
+        """Get a page of jobs by user id, or of their ``columns`` only."""
+        return await self.async_paginate(db, self._by_user_id_query(user_id, columns))
+
+    async def async_get_feed_by_user_id(
+        self, db: AsyncSession, *, user_id: int, cursor: Optional[str], size: int
+    ) -> CursorPage[Any]:
+        """Get the page of jobs by user id after ``cursor``."""
+        return await self.async_paginate_by_cursor(
+            db, self._by_user_id_query(user_id), cursor=cursor, size=size
+        )
+
+    async def async_get_applied_by_user_id_paginated(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: int,
+        columns: Optional[Sequence[Any]] = None,
+    ) -> Page[Any]:
+        """Get a page of jobs a user applied to, latest application first."""
+        return await self.async_paginate(
+            db, self._applied_by_user_id_query(user_id, columns)
+        )
+
+    async def async_search(
+        self,
+        db: AsyncSession,
+        *,
+        filters: JobFilter,
+        columns: Optional[Sequence[Any]] = None,
+    ) -> Page[Any]:
+        """Get a page of jobs matching the filters, in the requested order."""
+        return await self.async_paginate(db, self._filtered_query(filters, columns))
+
+    async def async_search_version(
+        self, db: AsyncSession, *, filters: JobFilter
+    ) -> Tuple[Any, ...]:
+        """Get the version of the list returned by ``search``."""
+        return await self.async_get_list_version(db, self._filtered_query(filters))
+
+    async def async_search_paginated(self, db: AsyncSession, *, q: str) -> Page[Job]:
+        """Get a page of jobs matching a full-text query, best match first."""
+        return await self.async_paginate(db, self._full_text_query(q))
+
+    @staticmethod
+    def search_document():
+        """Weighted tsvector of a job, the same as the database trigger builds."""
+
+        def weighted(column, weight):
+            return func.setweight(
+                func.to_tsvector(SEARCH_CONFIG, func.coalesce(column, "")),
+                literal_column(f"'{weight}'"),
+            )
+
+        return (
+            weighted(Job.title, "A")
+            .op("||")(weighted(Job.company, "B"))
+            .op("||")(weighted(func.array_to_string(Job.tags, " "), "B"))
+            .op("||")(weighted(Job.description, "C"))
+        )
+
     @staticmethod
-    def get_all_by_user_id(db: Session, *, user_id: int) -> List[Job]:
-        """Get by user id."""
-        response = cast(
-            List[Job],
-            db.query(Job).filter(Job.user_id == user_id).order_by(desc(Job.updated_at)).all(),
+    def filter_criteria(filters: JobFilter) -> List[ColumnElement]:
+        """WHERE criteria for every given filter."""
+        criteria = []
+        if filters.location is not None:
+            criteria.append(Job.location == filters.location)
+        if filters.is_remote is not None:
+            criteria.append(Job.is_remote == filters.is_remote)
+        if filters.company is not None:
+            criteria.append(Job.company == filters.company)
+        if filters.user_id is not None:
+            criteria.append(Job.user_id == filters.user_id)
+        # A job matches when its range overlaps the requested one; a single
+        # figure is stored as min = max.
+        if filters.salary_min is not None:
+            criteria.append(Job.salary_max >= filters.salary_min)
+        if filters.salary_max is not None:
+            criteria.append(Job.salary_min <= filters.salary_max)
+        if filters.tags:
+            # Containment (@>) is answered by the ix_job_tags GIN index.
+            criteria.append(Job.tags.contains(filters.tags))
+        return criteria
+
+    def _filtered_query(
+        self, filters: JobFilter, columns: Optional[Sequence[Any]] = None
+    ) -> Select:
+        """Jobs matching every given filter, compiled into one query."""
+        return (
+            self._select(columns)
+            .filter(*self.filter_criteria(filters))
+            .order_by(*SORTS[filters.sort])
+        )
+
+    def _by_user_id_query(
+        self, user_id: int, columns: Optional[Sequence[Any]] = None
+    ) -> Select:
+        """Jobs posted by a user, newest first."""
+        return (
+            self._select(columns)
+            .filter(Job.user_id == user_id)
+            .order_by(*self.default_order_by())
+        )
+
+    def _applied_by_user_id_query(
+        self, user_id: int, columns: Optional[Sequence[Any]] = None
+    ) -> Select:
+        """Jobs a user applied to, joined in one query."""
+        return (
+            self._select(columns)
+            .join(Application, Application.job_id == Job.id)
+            .filter(Application.user_id == user_id)
+            .order_by(desc(Application.updated_at), desc(Application.id))
         )
 
-        return response
+    @staticmethod
+    def _full_text_query(q: str) -> Select:
+        """Jobs matching web search syntax, ranked by ts_rank over the GIN index."""
+        query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+        return (
+            select(Job)
+            .filter(Job.search_vector.bool_op("@@")(query), Job.deleted_at.is_(None))
+            .order_by(desc(func.ts_rank(Job.search_vector, query)), desc(Job.id))
+        )
@@ -0,0 +1,210 @@
+"""Job Facet Repository."""
+
+from collections import Counter
+from http import HTTPStatus
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import String, cast, delete, desc, exc, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from app.models import Job, JobFacet
+from app.repositories.base import BaseRepository
+from app.repositories.job import JobRepository
+from app.schemas import FacetCount, JobFacets, JobFilter
+from exceptions.exceptions import DatabaseException
+
+FacetValue = Tuple[str, str]
+
+# Facet name -> the JobFilter field that narrows it.
+FACET_FILTERS = {
+    "location": "location",
+    "is_remote": "is_remote",
+    "company": "company",
+    "tag": "tags",
+}
+
+# The job columns the facets are counted from.
+FACET_COLUMNS = tuple(FACET_FILTERS.values())
+
+FILTER_FIELDS = (
+    "location",
+    "is_remote",
+    "company",
+    "tags",
+    "user_id",
+    "salary_min",
+    "salary_max",
+)
+
+
+class JobFacetRepository(BaseRepository[JobFacet, FacetCount, FacetCount]):
+    """Job Facet Repository Class."""
+
+    def __init__(self, model=JobFacet, limit: int = 20):
+        """Initialize with the number of values returned per facet."""
+        super().__init__(model)
+        self.limit = limit
+
+    @staticmethod
+    def facet_values(job: Optional[Job]) -> List[FacetValue]:
+        """Return the (facet, value) pairs a job counts towards."""
+        if job is None:
+            return []
+
+        values = []
+        if job.location:
+            values.append(("location", job.location))
+        if job.is_remote is not None:
+            values.append(("is_remote", str(job.is_remote).lower()))
+        if job.company:
+            values.append(("company", job.company))
+        for tag in sorted(set(job.tags or [])):
+            values.append(("tag", tag))
+        return values
+
+    def apply(
+        self,
+        db: Session,
+        *,
+        removed: Iterable[FacetValue] = (),
+        added: Iterable[FacetValue] = (),
+    ) -> None:
+        """Move the counts from a job's old facet values to its new ones."""
+        statement = self._apply_statement(removed, added)
+        if statement is None:
+            return
+        try:
+            # A savepoint: a failed count must not undo the job write.
+            with db.begin_nested():
+                db.execute(statement)
+        except exc.SQLAlchemyError as e:
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An error occurred while updating the job facets.",
+            ) from e
+
+    async def async_apply(
+        self,
+        db: AsyncSession,
+        *,
+        removed: Iterable[FacetValue] = (),
+        added: Iterable[FacetValue] = (),
+    ) -> None:
+        """Move the counts from a job's old facet values to its new ones."""
+        statement = self._apply_statement(removed, added)
+        if statement is None:
+            return
+        try:
+            # A savepoint: a failed count must not undo the job write.
+            async with db.begin_nested():
+                await db.execute(statement)
+        except exc.SQLAlchemyError as e:
+            raise DatabaseException(
+                status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+                detail="An error occurred while updating the job facets.",
+            ) from e
+
+    def rebuild(self, db: Session) -> None:
+        """Recount every facet from the job table."""
+        db.execute(delete(JobFacet))
+        for facet in FACET_FILTERS:
+            grouped = self._grouped_query(facet, JobFilter()).limit(None)
+            db.execute(
+                insert(JobFacet).from_select(
+                    ["facet", "value", "count"],
+                    select(literal(facet), *grouped.subquery().c),
+                )
+            )
+        db.flush()
+
+    def get_facets(self, db: Session, *, filters: JobFilter) -> JobFacets:
+        """Count the jobs per facet value under the other active filters."""
+        return JobFacets(
+            **{
+                facet: [FacetCount(value=v, count=c) for v, c in db.execute(query)]
+                for facet, query in self._facet_queries(filters).items()
+            }
+        )
+
+    async def async_get_facets(
+        self, db: AsyncSession, *, filters: JobFilter
+    ) -> JobFacets:
+        """Count the jobs per facet value under the other active filters."""
+        facets = {}
+        for facet, query in self._facet_queries(filters).items():
+            rows = await db.execute(query)
+            facets[facet] = [FacetCount(value=v, count=c) for v, c in rows]
+        return JobFacets(**facets)
+
+    @staticmethod
+    def _apply_statement(removed, added):
+        """One upsert adding the count deltas; None when nothing changed."""
+        deltas: Dict[FacetValue, int] = Counter(added)
+        deltas.subtract(Counter(removed))
+        rows = [
+            {"facet": facet, "value": value, "count": delta}
+            # Sorted so concurrent writers lock the rows in the same order.
+            for (facet, value), delta in sorted(deltas.items())
+            if delta
+        ]
+        if not rows:
+            return None
+
+        statement = insert(JobFacet).values(rows)
+        return statement.on_conflict_do_update(
+            index_elements=[JobFacet.facet, JobFacet.value],
+            set_={"count": JobFacet.count + statement.excluded.count},
+        )
+
+    def _facet_queries(self, filters: JobFilter) -> Dict[str, Select]:
+        """Build one count query per facet, ignoring that facet's own filter.
+
+        Without other filters the counts come from the aggregate table;
+        otherwise they are grouped over the jobs the other filters select.
+        """
+        queries = {}
+        for facet, field in FACET_FILTERS.items():
+            others = filters.model_copy(update={field: None})
+            if any(getattr(others, name) not in (None, []) for name in FILTER_FIELDS):
+                queries[facet] = self._grouped_query(facet, others)
+            else:
+                queries[facet] = self._aggregate_query(facet)
+        return queries
+
+    def _aggregate_query(self, facet: str) -> Select:
+        """Top values of a facet from the aggregate table."""
+        return (
+            select(JobFacet.value, JobFacet.count)
+            .filter(JobFacet.facet == facet, JobFacet.count > 0)
+            .order_by(desc(JobFacet.count), JobFacet.value)
+            .limit(self.limit)
+        )
+
+    def _grouped_query(self, facet: str, filters: JobFilter) -> Select:
+        """Top values of a facet over the filtered jobs."""
+        criteria = [Job.deleted_at.is_(None), *JobRepository.filter_criteria(filters)]
+        if facet == "tag":
+            # unnest yields no rows for a NULL or empty array.
+            value = func.unnest(Job.tags)
+        elif facet == "is_remote":
+            value = cast(Job.is_remote, String)
+            criteria.append(Job.is_remote.is_not(None))
+        else:
+            value = getattr(Job, facet)
+            criteria.extend([value.is_not(None), value != ""])
+
+        jobs = select(value.label("value")).filter(*criteria)
+        if facet == "tag":
+            # A tag repeated on a job counts once, as in ``facet_values``.
+            jobs = jobs.add_columns(Job.id).distinct()
+        jobs = jobs.subquery()
+        count = func.count().label("count")
+        return (
+            select(jobs.c.value, count)
+            .group_by(jobs.c.value)
+            .order_by(desc(count), jobs.c.value)
+            .limit(self.limit)
+        )
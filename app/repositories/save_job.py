@@ -1,35 +1,90 @@
 """Saved Job Repository."""
 from http import HTTPStatus
-from typing import List, cast, Optional
+from typing import Any, List, Optional
 
-from sqlalchemy import desc
+from fastapi_pagination import Page
+from sqlalchemy import Row, or_, select
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
 
-from app.models import SavedJob
+from app.models import Job, SavedJob, User
 from app.repositories.base import BaseRepository
-from app.schemas import SavedJobIn
+from app.repositories.job import JobRepository
+from app.repositories.user import UserRepository
+from app.schemas import SavedJobIn, SavedJobsOut
+from app.schemas.pagination import CursorPage
 from exceptions.exceptions import APIException
 
 
 class SavedJobRepository(BaseRepository[SavedJob, SavedJobIn, SavedJobIn]):
     """Saved Job Repository Class."""
 
-    @staticmethod
-    def get_all_by_user_id(db: Session, *, user_id: int) -> List[SavedJob]:
-        """Get by user id."""
-        response = cast(
-            List[SavedJob],
-            db.query(SavedJob).filter(SavedJob.user_id == user_id).order_by(desc(SavedJob.updated_at)).all(),
+    def live_criteria(self) -> tuple:
+        """Leave out the saved jobs of soft-deleted jobs or users."""
+        return (
+            SavedJob.job.has(Job.deleted_at.is_(None)),
+            SavedJob.user.has(User.deleted_at.is_(None)),
         )
 
-        return response
+    def get_all_by_user_id_paginated(
+        self, db: Session, *, user_id: int
+    ) -> Page[SavedJobsOut]:
+        """Get a page of saved jobs with their job details by user id."""
+        return self.paginate(
+            db, self._by_user_id_query(user_id), transformer=self._to_saved_jobs_out
+        )
+
+    def get_feed_by_user_id(
+        self, db: Session, *, user_id: int, cursor: Optional[str], size: int
+    ) -> CursorPage[SavedJobsOut]:
+        """Get the page of saved jobs with their job details after ``cursor``."""
+        return self.paginate_by_cursor(
+            db,
+            self._by_user_id_query(user_id),
+            cursor=cursor,
+            size=size,
+            transformer=self._to_saved_jobs_out,
+        )
+
+    def _by_user_id_query(self, user_id: int) -> Select:
+        """Jobs saved by a user, projected to the columns of ``SavedJobsOut``."""
+        return (
+            select(
+                SavedJob.id,
+                SavedJob.user_id,
+                SavedJob.job_id,
+                Job.title.label("job_title"),
+                Job.location.label("job_location"),
+                Job.description.label("job_description"),
+                Job.salary.label("job_salary"),
+                SavedJob.created_at,
+                SavedJob.updated_at,
+            )
+            .join(Job, Job.id == SavedJob.job_id)
+            .filter(
+                SavedJob.user_id == user_id,
+                Job.deleted_at.is_(None),
+                SavedJob.user.has(User.deleted_at.is_(None)),
+            )
+            .order_by(*self.default_order_by())
+        )
 
     @staticmethod
-    def get_by_user_id_and_job_id(db: Session, *, user_id: int, job_id: int) -> SavedJob:
+    def _to_saved_jobs_out(rows: List[Row]) -> List[SavedJobsOut]:
+        """Map projected rows straight to the schema."""
+        return [SavedJobsOut.model_validate(row) for row in rows]
+
+    def get_by_user_id_and_job_id(
+        self, db: Session, *, user_id: int, job_id: int
+    ) -> SavedJob:
         """Get a single save job by user ID and job ID."""
         response: Optional[SavedJob] = (
             db.query(SavedJob)
-            .filter(SavedJob.user_id == user_id, SavedJob.job_id == job_id)
+            .filter(
+                SavedJob.user_id == user_id,
+                SavedJob.job_id == job_id,
+                *self.live_criteria(),
+            )
             .first()
         )
 
@@ -38,3 +93,19 @@ class SavedJobRepository(BaseRepository[SavedJob, SavedJobIn, SavedJobIn]):
                 status_code=HTTPStatus.NOT_FOUND, detail="Record not found."
             )
         return response
+
+    def purge_deleted(
+        self, db: Session, *, after_id: int, batch_size: int
+    ) -> List[Any]:
+        """Remove the next batch of saved jobs of deleted jobs or users."""
+        return self.delete_batch(
+            db,
+            criteria=[
+                or_(
+                    SavedJob.job_id.in_(JobRepository.deleted_ids()),
+                    SavedJob.user_id.in_(UserRepository.deleted_ids()),
+                )
+            ],
+            after_id=after_id,
+            batch_size=batch_size,
+        )
@@ -1,13 +1,21 @@
 """User Repository."""
 
 from http import HTTPStatus
-from typing import Optional
+from typing import Any, List, Optional
 from fastapi.encoders import jsonable_encoder
-from sqlalchemy import exc
+from sqlalchemy import exc, select
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from starlette.concurrency import run_in_threadpool
 from starlette.responses import JSONResponse
 
-from app.core.security import get_password_hash, verify_password
+from app.core.security import (
+    async_get_password_hash,
+    async_verify_password,
+    get_password_hash,
+    invalidate_user,
+    password_needs_rehash,
+)
 from app.models.user import User
 from app.repositories.base import BaseRepository
 from app.schemas.password import EmailSchema
@@ -21,7 +29,11 @@ class UserRepository(BaseRepository[User, UserIn, UserIn]):
     @staticmethod
     def get_by_email(db: Session, *, email: str) -> Optional[User]:
         """Get by email."""
-        return db.query(User).filter(User.email == email).first()
+        return (
+            db.query(User)
+            .filter(User.email == email, User.deleted_at.is_(None))
+            .first()
+        )
 
     FAKE_OTP = "111111"
 
@@ -56,37 +68,61 @@ class UserRepository(BaseRepository[User, UserIn, UserIn]):
 
         user.hashed_password = get_password_hash(new_password)
         db.add(user)
-        db.commit()
+        db.flush()
+        invalidate_user(db, user.id)
 
         return JSONResponse(content={"message": "Password reset successful!"})
 
     @staticmethod
     def get_by_username(db: Session, *, username: str) -> Optional[User]:
         """Get by username."""
-        return db.query(User).filter(User.username == username).first()
+        return (
+            db.query(User)
+            .filter(User.username == username, User.deleted_at.is_(None))
+            .first()
+        )
+
+    @staticmethod
+    def deleted_ids() -> Select:
+        """Ids of the deleted users."""
+        return select(User.id).filter(User.deleted_at.is_not(None))
+
+    def purge_deleted(
+        self, db: Session, *, after_id: int, batch_size: int
+    ) -> List[Any]:
+        """Remove the next batch of deleted users; return their ids."""
+        return self.delete_batch(
+            db,
+            criteria=[User.deleted_at.is_not(None)],
+            after_id=after_id,
+            batch_size=batch_size,
+        )
 
     def create_user_with_password(
         self, db: Session, *, obj_in: UserIn
     ) -> Optional[User]:
         """Create user with password."""
+        hashed_password = get_password_hash(obj_in.password)
         try:
             obj_in_data = jsonable_encoder(obj_in)
 
-            obj_in_data.update({"hashed_password": get_password_hash(obj_in.password)})
+            obj_in_data.update({"hashed_password": hashed_password})
             del obj_in_data["password"]
             db_obj = self.model(**obj_in_data)  # type: ignore
             db.add(db_obj)
-            db.commit()
+            db.flush()
             db.refresh(db_obj)
 
         except exc.IntegrityError as e:
             error = e.orig.args
 
+            db.rollback()
             raise DatabaseException(
                 status_code=HTTPStatus.CONFLICT, detail=error[0]
             ) from e
 
         except Exception as e:
+            db.rollback()
             raise DatabaseException(
                 status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
                 detail="An unexpected error occurred.",
@@ -94,13 +130,22 @@ class UserRepository(BaseRepository[User, UserIn, UserIn]):
 
         return db_obj
 
-    def authenticate(
+    async def authenticate(
         self, db: Session, *, username: str, password: str
     ) -> Optional[User]:
-        """Authenticate."""
-        user = self.get_by_username(db, username=username)  # noqa
+        """Authenticate.
+
+        The queries run on the request threadpool and the hash is awaited on
+        the hashing pool, so a login holds no request thread while it hashes.
+        """
+        user = await run_in_threadpool(self.get_by_username, db, username=username)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        if not await async_verify_password(password, user.hashed_password):
             return None
+        if password_needs_rehash(user.hashed_password):
+            # The cost factor changed; upgrade the hash while we have the password.
+            user.hashed_password = await async_get_password_hash(password)
+            db.add(user)
+            await run_in_threadpool(db.flush)
         return user
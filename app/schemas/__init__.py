@@ -18,8 +18,14 @@ from .token import (
 )
 
 from .job import (
+    JOB_CARD_FIELDS,  # noqa: F401
+    FacetCount,  # noqa: F401
+    JobCardOut,  # noqa: F401
+    JobFacets,  # noqa: F401
+    JobFilter,  # noqa: F401
     JobIn,  # noqa: F401
-    JobOut  # noqa: F401
+    JobOut,  # noqa: F401
+    JobSort  # noqa: F401
 )
 
 from .application import (
@@ -32,3 +38,7 @@ from .save_job import (
     SavedJobOut,  # noqa: F401
     SavedJobsOut  # noqa: F401
 )
+
+from .pagination import (
+    CursorPage  # noqa: F401
+)
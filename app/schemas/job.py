@@ -1,4 +1,6 @@
-from pydantic import BaseModel, ConfigDict
+from enum import Enum
+
+from pydantic import BaseModel, ConfigDict, field_validator
 from datetime import datetime
 
 
@@ -16,6 +18,14 @@ class JobBase(BaseModel):
     logo: str | None = None
     company: str | None = None
 
+    @field_validator("tags", mode="before")
+    @classmethod
+    def join_tags(cls, tags):
+        """Emit the stored tag list in the comma separated API format."""
+        if isinstance(tags, list):
+            return ", ".join(tags)
+        return tags
+
 
 class JobIn(JobBase):
     """Job In Class."""
@@ -28,5 +38,65 @@ class JobOut(JobBase):
 
     id: int
     user_id: int
+    salary_min: int | None = None
+    salary_max: int | None = None
+    salary_currency: str | None = None
     created_at: datetime
     updated_at: datetime
+
+
+class JobCardOut(JobBase):
+    """Job Card Out Class.
+
+    Lists carry only the card fields by default; ``fields`` picks others.
+    Fields that were not selected are left unset and not serialized.
+    """
+
+    id: int
+    location: str | None = None
+    user_id: int | None = None
+    salary_min: int | None = None
+    salary_max: int | None = None
+    salary_currency: str | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+
+JOB_CARD_FIELDS = ("id", "title", "company", "location", "is_remote", "salary", "logo")
+
+
+class JobSort(str, Enum):
+    """Job Sort Keys; each is served by an index, newest or highest first."""
+
+    created_at = "created_at"
+    updated_at = "updated_at"
+    salary = "salary"
+
+
+class JobFilter(BaseModel):
+    """Job Filter Class."""
+
+    location: str | None = None
+    is_remote: bool | None = None
+    company: str | None = None
+    tags: list[str] | None = None
+    user_id: int | None = None
+    salary_min: int | None = None
+    salary_max: int | None = None
+    sort: JobSort = JobSort.updated_at
+
+
+class FacetCount(BaseModel):
+    """Facet Count Class."""
+
+    value: str
+    count: int
+
+
+class JobFacets(BaseModel):
+    """Job Facets Class."""
+
+    location: list[FacetCount] = []
+    is_remote: list[FacetCount] = []
+    company: list[FacetCount] = []
+    tag: list[FacetCount] = []
@@ -0,0 +1,15 @@
+"""Pagination Schemas."""
+
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """Cursor Page Class."""
+
+    items: List[T]
+    size: int
+    next_cursor: Optional[str] = None
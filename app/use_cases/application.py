@@ -1,15 +1,19 @@
 """Application Use Case."""
 
 import logging
-from typing import Union
+from typing import Optional, Union
 
-from fastapi_pagination import paginate, Page
+from fastapi_pagination import Page
 from sqlalchemy.orm import Session
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
 from app import schemas
-from app.models import Application
+from app.core.config import settings
+from app.core.etag import ConditionalRequest
+from app.core.uploads import remove_after_commit
+from app.models import Application, Job
 from app.repositories.application import ApplicationRepository
+from app.repositories.job import JobRepository
 from exceptions.exceptions import DatabaseException, APIException
 
 logger = logging.getLogger(__name__)
@@ -22,34 +26,73 @@ class ApplicationUseCase:
         """Initialize with db and Application Repository."""
         self.db = db
         self.application_repository = ApplicationRepository(Application)
+        self.job_repository = JobRepository(Job)
 
     def get_applications(self) -> Union[Page[schemas.ApplicationOut], JSONResponse]:
         """Get all applications record."""
         try:
-            applications = self.application_repository.get_all(self.db)
+            applications = self.application_repository.get_all_paginated(self.db)
 
         except DatabaseException as e:
             logger.error(f"Database error occurred while fetching applications: {e.detail}")
             return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
 
-        return paginate(applications)
+        return applications
 
-    def get_applications_by_job_id(self, job_id: int) -> Union[Page[schemas.ApplicationOut], JSONResponse]:
-        """Get all applications record."""
+    def get_applications_by_job_id(
+            self, job_id: int, *, conditional: Optional[ConditionalRequest] = None
+    ) -> Union[Page[schemas.ApplicationOut], Response]:
+        """Get all applications record, or 304 if the client has them."""
         try:
-            applications = self.application_repository.get_all_by_job_id(self.db, job_id=job_id)
+            if conditional is not None:
+                version = self.application_repository.get_all_by_job_id_version(
+                    self.db, job_id=job_id
+                )
+                not_modified = conditional.not_modified(*version)
+                if not_modified is not None:
+                    return not_modified
+
+            applications = self.application_repository.get_all_by_job_id_paginated(
+                self.db, job_id=job_id
+            )
 
         except DatabaseException as e:
             logger.error(f"Database error occurred while fetching applications: {e.detail}")
             return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
 
-        return paginate(applications)
+        return applications
 
-    def get_application(self, _id: int) -> Union[schemas.ApplicationOut, JSONResponse]:
-        """Get application record."""
+    def get_applications_feed_by_job_id(
+            self, job_id: int, *, cursor: Optional[str], size: int
+    ) -> Union[schemas.CursorPage[schemas.ApplicationOut], JSONResponse]:
+        """Get the applications by job id after cursor."""
         try:
+            applications = self.application_repository.get_feed_by_job_id(
+                self.db, job_id=job_id, cursor=cursor, size=size
+            )
+
+        except (DatabaseException, APIException) as e:
+            logger.error(f"Database error occurred while fetching applications: {e.detail}")
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        return applications
+
+    def get_application(
+            self, _id: int, *, conditional: Optional[ConditionalRequest] = None
+    ) -> Union[schemas.ApplicationOut, Response]:
+        """Get application record, or 304 if the client has it."""
+        try:
+            if conditional is not None and conditional.if_none_match:
+                version = self.application_repository.get_version(self.db, _id)
+                not_modified = conditional.not_modified(*version)
+                if not_modified is not None:
+                    return not_modified
+
             application = self.application_repository.get(self.db, _id)
 
+            if conditional is not None:
+                conditional.set_etag(application.id, application.updated_at)
+
             return schemas.ApplicationOut.model_validate(application)
 
         except APIException as e:
@@ -72,13 +115,20 @@ class ApplicationUseCase:
             *,
             obj_in: schemas.ApplicationIn,
     ) -> Union[schemas.ApplicationOut, JSONResponse]:
-        """Create application record."""
+        """Create application record; applying again updates its details."""
         try:
-            application = self.application_repository.create(db=self.db, obj_in=obj_in)
+            # The foreign key also accepts a soft-deleted job: 404 for those.
+            application, unused_resume = self.application_repository.apply(
+                self.db,
+                obj_in=obj_in,
+                where=[self.job_repository.live_exists(obj_in.job_id)],
+            )
+            # Applying again with another file leaves the previous one unused.
+            remove_after_commit(self.db, settings.UPLOAD_DIR, unused_resume)
 
             return schemas.ApplicationOut.model_validate(application)
 
-        except DatabaseException as e:
+        except (DatabaseException, APIException) as e:
             logger.error(f"Database error occurred while creating application: {e.detail}")
             return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
 
@@ -90,10 +140,8 @@ class ApplicationUseCase:
     ) -> Union[schemas.ApplicationOut, JSONResponse]:
         """Update application record."""
         try:
-            application = self.application_repository.get(db=self.db, _id=_id)
-
-            application_update = self.application_repository.update(
-                db=self.db, obj_in=obj_in, db_obj=application
+            application_update = self.application_repository.update_by_id(
+                db=self.db, _id=_id, obj_in=obj_in
             )
 
             return schemas.ApplicationOut.model_validate(application_update)
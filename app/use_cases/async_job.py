@@ -0,0 +1,237 @@
+"""Async Job Use Case."""
+
+import logging
+from typing import Optional, Sequence, Union
+
+from fastapi_pagination import Page
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import JSONResponse, Response
+
+from app import schemas
+from app.core.etag import ConditionalRequest
+from app.models import Job
+from app.repositories.job import JobRepository
+from app.repositories.job_facet import FACET_COLUMNS, JobFacetRepository
+from exceptions.exceptions import DatabaseException, APIException
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncJobUseCase:
+    """Async Job Use Case Class."""
+
+    def __init__(self, db: AsyncSession):
+        """Initialize with db and Job Repository."""
+        self.db = db
+        self.job_repository = JobRepository(Job)
+        self.job_facet_repository = JobFacetRepository()
+
+    async def get_jobs(
+        self,
+        *,
+        filters: schemas.JobFilter,
+        fields: Sequence[str] = schemas.JOB_CARD_FIELDS,
+        conditional: Optional[ConditionalRequest] = None,
+    ) -> Union[Page[schemas.JobCardOut], Response]:
+        """Get the jobs matching filters, or 304 if the client has them."""
+        try:
+            if conditional is not None:
+                version = await self.job_repository.async_search_version(
+                    self.db, filters=filters
+                )
+                not_modified = conditional.not_modified(*version)
+                if not_modified is not None:
+                    return not_modified
+
+            jobs = await self.job_repository.async_search(
+                self.db, filters=filters, columns=self.job_repository.columns(fields)
+            )
+
+        except DatabaseException as e:
+            logger.error(f"Database error occurred while fetching jobs: {e.detail}")
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        return jobs
+
+    async def get_jobs_feed(
+        self, *, cursor: Optional[str], size: int
+    ) -> Union[schemas.CursorPage[schemas.JobOut], JSONResponse]:
+        """Get the jobs after cursor."""
+        try:
+            jobs = await self.job_repository.async_get_feed(
+                self.db, cursor=cursor, size=size
+            )
+
+        except (DatabaseException, APIException) as e:
+            logger.error(f"Database error occurred while fetching jobs: {e.detail}")
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        return jobs
+
+    async def get_job_facets(
+        self, *, filters: schemas.JobFilter
+    ) -> Union[schemas.JobFacets, JSONResponse]:
+        """Get the job counts per facet value under the filters."""
+        try:
+            facets = await self.job_facet_repository.async_get_facets(
+                self.db, filters=filters
+            )
+
+        except DatabaseException as e:
+            logger.error(f"Database error occurred while counting jobs: {e.detail}")
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        return facets
+
+    async def search_jobs(self, *, q: str) -> Union[Page[schemas.JobOut], JSONResponse]:
+        """Get the jobs matching a full-text query."""
+        try:
+            jobs = await self.job_repository.async_search_paginated(self.db, q=q)
+
+        except DatabaseException as e:
+            logger.error(f"Database error occurred while searching jobs: {e.detail}")
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        return jobs
+
+    async def get_job(
+        self, _id: int, *, conditional: Optional[ConditionalRequest] = None
+    ) -> Union[schemas.JobOut, Response]:
+        """Get job record, or 304 if the client has it."""
+        try:
+            if conditional is not None and conditional.if_none_match:
+                version = await self.job_repository.async_get_version(self.db, _id)
+                not_modified = conditional.not_modified(*version)
+                if not_modified is not None:
+                    return not_modified
+
+            job = await self.job_repository.async_get(self.db, _id)
+
+            if conditional is not None:
+                conditional.set_etag(job.id, job.updated_at)
+
+            return schemas.JobOut.model_validate(job)
+
+        except APIException as e:
+            logger.error(f"Database error occurred while fetching job: {e.detail}")
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+    async def get_jobs_by_user_id(
+        self, user_id: int, *, fields: Sequence[str] = schemas.JOB_CARD_FIELDS
+    ) -> Union[Page[schemas.JobCardOut], JSONResponse]:
+        """Get all jobs by user id record."""
+        try:
+            jobs = await self.job_repository.async_get_all_by_user_id_paginated(
+                self.db, user_id=user_id, columns=self.job_repository.columns(fields)
+            )
+
+        except DatabaseException as e:
+            logger.error(
+                f"Database error occurred while fetching evaluations: {e.detail}"
+            )
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        return jobs
+
+    async def get_jobs_feed_by_user_id(
+        self, user_id: int, *, cursor: Optional[str], size: int
+    ) -> Union[schemas.CursorPage[schemas.JobOut], JSONResponse]:
+        """Get the jobs by user id after cursor."""
+        try:
+            jobs = await self.job_repository.async_get_feed_by_user_id(
+                self.db, user_id=user_id, cursor=cursor, size=size
+            )
+
+        except (DatabaseException, APIException) as e:
+            logger.error(f"Database error occurred while fetching jobs: {e.detail}")
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        return jobs
+
+    async def get_applied_jobs(
+        self, user_id: int, *, fields: Sequence[str] = schemas.JOB_CARD_FIELDS
+    ) -> Union[Page[schemas.JobCardOut], JSONResponse]:
+        """Get all jobs by user id record."""
+        try:
+            jobs = await self.job_repository.async_get_applied_by_user_id_paginated(
+                self.db, user_id=user_id, columns=self.job_repository.columns(fields)
+            )
+
+        except DatabaseException as e:
+            logger.error(
+                f"Database error occurred while fetching evaluations: {e.detail}"
+            )
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        return jobs
+
+    async def create_job(
+        self,
+        *,
+        obj_in: schemas.JobIn,
+    ) -> Union[schemas.JobOut, JSONResponse]:
+        """Create job record."""
+        try:
+            job = await self.job_repository.async_create(db=self.db, obj_in=obj_in)
+            job_out = schemas.JobOut.model_validate(job)
+            await self._update_facets(added=JobFacetRepository.facet_values(job))
+
+            return job_out
+
+        except DatabaseException as e:
+            logger.error(f"Database error occurred while creating job: {e.detail}")
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+    async def update_job(
+        self,
+        _id: int,
+        *,
+        obj_in: schemas.JobIn,
+    ) -> Union[schemas.JobOut, JSONResponse]:
+        """Update job record."""
+        try:
+            (
+                job_update,
+                job_before,
+            ) = await self.job_repository.async_update_by_id_returning_previous(
+                db=self.db, _id=_id, obj_in=obj_in, previous=FACET_COLUMNS
+            )
+            facets_before = JobFacetRepository.facet_values(job_before)
+            job_out = schemas.JobOut.model_validate(job_update)
+            await self._update_facets(
+                removed=facets_before,
+                added=JobFacetRepository.facet_values(job_update),
+            )
+
+            return job_out
+
+        except (DatabaseException, APIException) as e:
+            logger.error(f"Database error occurred while updating job: {e.detail}")
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+    async def delete_job(self, _id: int) -> Union[schemas.JobOut, JSONResponse]:
+        """Delete job record."""
+        try:
+            job_update = await self.job_repository.async_soft_delete(
+                db=self.db, _id=_id
+            )
+            await self._update_facets(
+                removed=JobFacetRepository.facet_values(job_update)
+            )
+
+            return schemas.JobOut.model_validate(job_update)
+
+        except (DatabaseException, APIException) as e:
+            logger.error(f"Database error occurred while deleting job: {e.detail}")
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+    async def _update_facets(self, *, removed=(), added=()) -> None:
+        """Adjust the facet counts; a failure must not fail the job write."""
+        try:
+            await self.job_facet_repository.async_apply(
+                self.db, removed=removed, added=added
+            )
+
+        except DatabaseException as e:
+            # Counts drift until `python -m app.commands.rebuild_job_facets`.
+            logger.error(f"Database error occurred while updating facets: {e.detail}")
@@ -10,6 +10,7 @@ from starlette.responses import JSONResponse
 from app.core.security import create_access_token
 from app.models import User
 from app.repositories.user import UserRepository
+from exceptions.exceptions import APIException
 
 
 class AuthenticationUseCase:
@@ -20,13 +21,17 @@ class AuthenticationUseCase:
         self.db = db
         self.user_repository = UserRepository(User)
 
-    def login_access_token(
+    async def login_access_token(
         self, form_data: OAuth2PasswordRequestForm = Depends()
     ) -> Union[JSONResponse, dict]:
         """OAuth2 compatible token login, get an access token for future requests."""
-        user = self.user_repository.authenticate(
-            self.db, username=form_data.username, password=form_data.password
-        )
+        try:
+            user = await self.user_repository.authenticate(
+                self.db, username=form_data.username, password=form_data.password
+            )
+        except APIException as e:
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
         if not user:
             return JSONResponse(
                 status_code=HTTPStatus.NOT_FOUND,
@@ -38,6 +43,7 @@ class AuthenticationUseCase:
                 "subject": user.id,
                 "username": user.username,
                 "first_name": user.first_name,
+                "middle_name": user.middle_name,
                 "email": user.email,
                 "last_name": user.last_name,
             }
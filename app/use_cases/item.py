@@ -3,7 +3,7 @@
 import logging
 from typing import Union
 
-from fastapi_pagination import paginate, Page
+from fastapi_pagination import Page
 from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse
 
@@ -26,13 +26,13 @@ class ItemUseCase:
     def get_items(self) -> Union[Page[schemas.ItemOut], JSONResponse]:
         """Get all items record."""
         try:
-            items = self.item_repository.get_all(self.db)
+            items = self.item_repository.get_all_paginated(self.db)
 
         except DatabaseException as e:
             logger.error(f"Database error occurred while fetching items: {e.detail}")
             return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
 
-        return paginate(items)
+        return items
 
     def get_item(self, _id: int) -> Union[schemas.ItemOut, JSONResponse]:
         """Get item record."""
@@ -68,10 +68,8 @@ class ItemUseCase:
     ) -> Union[schemas.ItemOut, JSONResponse]:
         """Update item record."""
         try:
-            item = self.item_repository.get(db=self.db, _id=_id)
-
-            item_update = self.item_repository.update(
-                db=self.db, obj_in=obj_in, db_obj=item
+            item_update = self.item_repository.update_by_id(
+                db=self.db, _id=_id, obj_in=obj_in
             )
 
             return schemas.ItemOut.model_validate(item_update)
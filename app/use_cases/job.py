@@ -1,16 +1,17 @@
 """Job Use Case."""
 
 import logging
-from typing import Union
+from typing import Optional, Sequence, Union
 
-from fastapi_pagination import paginate, Page
+from fastapi_pagination import Page
 from sqlalchemy.orm import Session
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
 from app import schemas
-from app.models import Job, Application
-from app.repositories.application import ApplicationRepository
+from app.core.etag import ConditionalRequest
+from app.models import Job
 from app.repositories.job import JobRepository
+from app.repositories.job_facet import FACET_COLUMNS, JobFacetRepository
 from exceptions.exceptions import DatabaseException, APIException
 
 logger = logging.getLogger(__name__)
@@ -23,24 +24,88 @@ class JobUseCase:
         """Initialize with db and Job Repository."""
         self.db = db
         self.job_repository = JobRepository(Job)
-        self.application_repository = ApplicationRepository(Application)
+        self.job_facet_repository = JobFacetRepository()
 
-    def get_jobs(self) -> Union[Page[schemas.JobOut], JSONResponse]:
-        """Get all jobs record."""
+    def get_jobs(
+            self,
+            *,
+            filters: schemas.JobFilter,
+            fields: Sequence[str] = schemas.JOB_CARD_FIELDS,
+            conditional: Optional[ConditionalRequest] = None,
+    ) -> Union[Page[schemas.JobCardOut], Response]:
+        """Get the jobs matching filters, or 304 if the client has them."""
         try:
-            jobs = self.job_repository.get_all(self.db)
+            if conditional is not None:
+                version = self.job_repository.search_version(self.db, filters=filters)
+                not_modified = conditional.not_modified(*version)
+                if not_modified is not None:
+                    return not_modified
+
+            jobs = self.job_repository.search(
+                self.db, filters=filters, columns=self.job_repository.columns(fields)
+            )
 
         except DatabaseException as e:
             logger.error(f"Database error occurred while fetching jobs: {e.detail}")
             return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
 
-        return paginate(jobs)
+        return jobs
+
+    def get_jobs_feed(
+            self, *, cursor: Optional[str], size: int
+    ) -> Union[schemas.CursorPage[schemas.JobOut], JSONResponse]:
+        """Get the jobs after cursor."""
+        try:
+            jobs = self.job_repository.get_feed(self.db, cursor=cursor, size=size)
+
+        except (DatabaseException, APIException) as e:
+            logger.error(f"Database error occurred while fetching jobs: {e.detail}")
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        return jobs
+
+    def get_job_facets(
+            self, *, filters: schemas.JobFilter
+    ) -> Union[schemas.JobFacets, JSONResponse]:
+        """Get the job counts per facet value under the filters."""
+        try:
+            facets = self.job_facet_repository.get_facets(
+                self.db, filters=filters
+            )
+
+        except DatabaseException as e:
+            logger.error(f"Database error occurred while counting jobs: {e.detail}")
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        return facets
+
+    def search_jobs(self, *, q: str) -> Union[Page[schemas.JobOut], JSONResponse]:
+        """Get the jobs matching a full-text query."""
+        try:
+            jobs = self.job_repository.search_paginated(self.db, q=q)
+
+        except DatabaseException as e:
+            logger.error(f"Database error occurred while searching jobs: {e.detail}")
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        return jobs
 
-    def get_job(self, _id: int) -> Union[schemas.JobOut, JSONResponse]:
-        """Get job record."""
+    def get_job(
+            self, _id: int, *, conditional: Optional[ConditionalRequest] = None
+    ) -> Union[schemas.JobOut, Response]:
+        """Get job record, or 304 if the client has it."""
         try:
+            if conditional is not None and conditional.if_none_match:
+                version = self.job_repository.get_version(self.db, _id)
+                not_modified = conditional.not_modified(*version)
+                if not_modified is not None:
+                    return not_modified
+
             job = self.job_repository.get(self.db, _id)
 
+            if conditional is not None:
+                conditional.set_etag(job.id, job.updated_at)
+
             return schemas.JobOut.model_validate(job)
 
         except APIException as e:
@@ -48,13 +113,13 @@ class JobUseCase:
             return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
 
     def get_jobs_by_user_id(
-            self, user_id: int
-    ) -> Union[Page[schemas.JobOut], JSONResponse]:
+            self, user_id: int, *, fields: Sequence[str] = schemas.JOB_CARD_FIELDS
+    ) -> Union[Page[schemas.JobCardOut], JSONResponse]:
         """Get all jobs by user id record."""
         try:
 
-            jobs = self.job_repository.get_all_by_user_id(
-                self.db, user_id=user_id
+            jobs = self.job_repository.get_all_by_user_id_paginated(
+                self.db, user_id=user_id, columns=self.job_repository.columns(fields)
             )
 
         except DatabaseException as e:
@@ -63,20 +128,31 @@ class JobUseCase:
             )
             return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
 
-        return paginate(jobs)
+        return jobs
 
-    def get_applied_jobs(
-            self, user_id: int
-    ) -> Union[Page[schemas.JobOut], JSONResponse]:
-        """Get all jobs by user id record."""
+    def get_jobs_feed_by_user_id(
+            self, user_id: int, *, cursor: Optional[str], size: int
+    ) -> Union[schemas.CursorPage[schemas.JobOut], JSONResponse]:
+        """Get the jobs by user id after cursor."""
         try:
-            jobs = []
+            jobs = self.job_repository.get_feed_by_user_id(
+                self.db, user_id=user_id, cursor=cursor, size=size
+            )
 
-            applications = self.application_repository.get_all_by_user_id(self.db, user_id=user_id)
+        except (DatabaseException, APIException) as e:
+            logger.error(f"Database error occurred while fetching jobs: {e.detail}")
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
 
-            for app in applications:
-                job = self.job_repository.get(self.db, _id=app.job_id)
-                jobs.append(job)
+        return jobs
+
+    def get_applied_jobs(
+            self, user_id: int, *, fields: Sequence[str] = schemas.JOB_CARD_FIELDS
+    ) -> Union[Page[schemas.JobCardOut], JSONResponse]:
+        """Get all jobs by user id record."""
+        try:
+            jobs = self.job_repository.get_applied_by_user_id_paginated(
+                self.db, user_id=user_id, columns=self.job_repository.columns(fields)
+            )
 
         except DatabaseException as e:
             logger.error(
@@ -84,7 +160,7 @@ class JobUseCase:
             )
             return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
 
-        return paginate(jobs)
+        return jobs
 
     def create_job(
             self,
@@ -94,8 +170,10 @@ class JobUseCase:
         """Create job record."""
         try:
             job = self.job_repository.create(db=self.db, obj_in=obj_in)
+            job_out = schemas.JobOut.model_validate(job)
+            self._update_facets(added=JobFacetRepository.facet_values(job))
 
-            return schemas.JobOut.model_validate(job)
+            return job_out
 
         except DatabaseException as e:
             logger.error(f"Database error occurred while creating job: {e.detail}")
@@ -109,13 +187,19 @@ class JobUseCase:
     ) -> Union[schemas.JobOut, JSONResponse]:
         """Update job record."""
         try:
-            job = self.job_repository.get(db=self.db, _id=_id)
-
-            job_update = self.job_repository.update(
-                db=self.db, obj_in=obj_in, db_obj=job
+            job_update, job_before = (
+                self.job_repository.update_by_id_returning_previous(
+                    db=self.db, _id=_id, obj_in=obj_in, previous=FACET_COLUMNS
+                )
+            )
+            facets_before = JobFacetRepository.facet_values(job_before)
+            job_out = schemas.JobOut.model_validate(job_update)
+            self._update_facets(
+                removed=facets_before,
+                added=JobFacetRepository.facet_values(job_update),
             )
 
-            return schemas.JobOut.model_validate(job_update)
+            return job_out
 
         except (DatabaseException, APIException) as e:
             logger.error(f"Database error occurred while updating job: {e.detail}")
@@ -124,10 +208,24 @@ class JobUseCase:
     def delete_job(self, _id: int) -> Union[schemas.JobOut, JSONResponse]:
         """Delete job record."""
         try:
-            job_update = self.job_repository.delete(db=self.db, _id=_id)
+            job_update = self.job_repository.soft_delete(db=self.db, _id=_id)
+            self._update_facets(
+                removed=JobFacetRepository.facet_values(job_update)
+            )
 
             return schemas.JobOut.model_validate(job_update)
 
         except (DatabaseException, APIException) as e:
             logger.error(f"Database error occurred while deleting job: {e.detail}")
             return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+    def _update_facets(self, *, removed=(), added=()) -> None:
+        """Adjust the facet counts; a failure must not fail the job write."""
+        try:
+            self.job_facet_repository.apply(
+                self.db, removed=removed, added=added
+            )
+
+        except DatabaseException as e:
+            # Counts drift until `python -m app.commands.rebuild_job_facets`.
+            logger.error(f"Database error occurred while updating facets: {e.detail}")
@@ -1,14 +1,14 @@
 """SavedJob Use Case."""
 
 import logging
-from typing import Union
+from typing import Optional, Union
 
-from fastapi_pagination import paginate, Page
+from fastapi_pagination import Page
 from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse
 
 from app import schemas
-from app.models import SavedJob, Job
+from app.models import Job, SavedJob
 from app.repositories.job import JobRepository
 from app.repositories.save_job import SavedJobRepository
 from exceptions.exceptions import DatabaseException, APIException
@@ -28,13 +28,13 @@ class SavedJobUseCase:
     def get_saved_jobs(self) -> Union[Page[schemas.SavedJobOut], JSONResponse]:
         """Get all save_jobs record."""
         try:
-            save_jobs = self.save_job_repository.get_all(self.db)
+            save_jobs = self.save_job_repository.get_all_paginated(self.db)
 
         except DatabaseException as e:
             logger.error(f"Database error occurred while fetching save_jobs: {e.detail}")
             return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
 
-        return paginate(save_jobs)
+        return save_jobs
 
     def get_saved_job(self, _id: int) -> Union[schemas.SavedJobOut, JSONResponse]:
         """Get save_job record."""
@@ -61,36 +61,49 @@ class SavedJobUseCase:
     def get_saved_jobs_by_user_id(self, user_id: int) -> Union[Page[schemas.SavedJobsOut], JSONResponse]:
         """Get all save_jobs by user id record."""
         try:
-            save_jobs = self.save_job_repository.get_all_by_user_id(self.db, user_id=user_id)
-            updated_saved_jobs = []
-            for save_job in save_jobs:
-                job = self.job_repository.get(self.db, _id=save_job.job_id)
-                save_job_dict = save_job.__dict__
-                save_job_dict.update({'job_title': job.title})
-                save_job_dict.update({'job_location': job.location})
-                save_job_dict.update({'job_description': job.description})
-                save_job_dict.update({'job_salary': job.salary})
-
-                updated_saved_jobs.append(schemas.SavedJobsOut(**save_job_dict))
+            updated_saved_jobs = self.save_job_repository.get_all_by_user_id_paginated(
+                self.db, user_id=user_id
+            )
 
         except DatabaseException as e:
             logger.error(f"Database error occurred while fetching save_jobs: {e.detail}")
             return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
 
-        return paginate(updated_saved_jobs)
+        return updated_saved_jobs
+
+    def get_saved_jobs_feed_by_user_id(
+        self, user_id: int, *, cursor: Optional[str], size: int
+    ) -> Union[schemas.CursorPage[schemas.SavedJobsOut], JSONResponse]:
+        """Get the save_jobs by user id after cursor."""
+        try:
+            updated_saved_jobs = self.save_job_repository.get_feed_by_user_id(
+                self.db, user_id=user_id, cursor=cursor, size=size
+            )
+
+        except (DatabaseException, APIException) as e:
+            logger.error(f"Database error occurred while fetching save_jobs: {e.detail}")
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
+
+        return updated_saved_jobs
 
     def create_saved_job(
         self,
         *,
         obj_in: schemas.SavedJobIn,
     ) -> Union[schemas.SavedJobOut, JSONResponse]:  # schemas.SavedJobOut
-        """Create save_job record."""
+        """Create save_job record, or return the one the user already saved."""
         try:
-            save_job = self.save_job_repository.create(db=self.db, obj_in=obj_in)
+            # The foreign key also accepts a soft-deleted job: 404 for those.
+            save_job = self.save_job_repository.upsert(
+                db=self.db,
+                obj_in=obj_in,
+                index_elements=("user_id", "job_id"),
+                where=[self.job_repository.live_exists(obj_in.job_id)],
+            )
 
             return schemas.SavedJobOut.model_validate(save_job)
 
-        except DatabaseException as e:
+        except (DatabaseException, APIException) as e:
             logger.error(f"Database error occurred while creating save_job: {e.detail}")
             return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
 
@@ -102,10 +115,8 @@ class SavedJobUseCase:
     ) -> Union[schemas.SavedJobOut, JSONResponse]:
         """Update save_job record."""
         try:
-            save_job = self.save_job_repository.get(db=self.db, _id=_id)
-
-            save_job_update = self.save_job_repository.update(
-                db=self.db, obj_in=obj_in, db_obj=save_job
+            save_job_update = self.save_job_repository.update_by_id(
+                db=self.db, _id=_id, obj_in=obj_in
             )
 
             return schemas.SavedJobOut.model_validate(save_job_update)
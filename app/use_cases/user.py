@@ -1,14 +1,18 @@
 """User Use Case."""
 
 import logging
-from typing import Union
+from typing import Optional, Union
 
-from fastapi_pagination import paginate, Page
+from fastapi_pagination import Page
 from sqlalchemy.orm import Session
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
 from app import schemas
-from app.models import User
+from app.core.etag import ConditionalRequest
+from app.core.security import invalidate_user
+from app.models import Job, User
+from app.repositories.job import JobRepository
+from app.repositories.job_facet import FACET_COLUMNS, JobFacetRepository
 from app.repositories.user import UserRepository
 from app.schemas.password import EmailSchema, ResetPasswordRequest
 from exceptions.exceptions import DatabaseException, APIException
@@ -24,23 +28,44 @@ class UserUseCase:
         """Initialize with db."""
         self.db = db
         self.user_repository = UserRepository(User)
+        self.job_repository = JobRepository(Job)
+        self.job_facet_repository = JobFacetRepository()
 
-    def get_users(self) -> Union[Page[schemas.UserOut], JSONResponse]:
-        """Get all users record."""
+    def get_users(
+            self, *, conditional: Optional[ConditionalRequest] = None
+    ) -> Union[Page[schemas.UserOut], Response]:
+        """Get all users record, or 304 if the client has them."""
         try:
-            users = self.user_repository.get_all(self.db)
+            if conditional is not None:
+                version = self.user_repository.get_all_version(self.db)
+                not_modified = conditional.not_modified(*version)
+                if not_modified is not None:
+                    return not_modified
+
+            users = self.user_repository.get_all_paginated(self.db)
 
         except DatabaseException as e:
             logger.error(f"Database error occurred while fetching users: {e.detail}")
             return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
 
-        return paginate(users)
+        return users
 
-    def get_user(self, _id: int) -> Union[schemas.UserOut, JSONResponse]:
-        """Get user record."""
+    def get_user(
+            self, _id: int, *, conditional: Optional[ConditionalRequest] = None
+    ) -> Union[schemas.UserOut, Response]:
+        """Get user record, or 304 if the client has it."""
         try:
+            if conditional is not None and conditional.if_none_match:
+                version = self.user_repository.get_version(self.db, _id)
+                not_modified = conditional.not_modified(*version)
+                if not_modified is not None:
+                    return not_modified
+
             user = self.user_repository.get(self.db, _id)
 
+            if conditional is not None:
+                conditional.set_etag(user.id, user.updated_at)
+
             return schemas.UserOut.model_validate(user)
 
         except APIException as e:
@@ -59,7 +84,7 @@ class UserUseCase:
             )
             return schemas.UserOut.model_validate(user)
 
-        except DatabaseException as e:
+        except (DatabaseException, APIException) as e:
             logger.error(f"Database error occurred while creating user: {e.detail}")
             return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
 
@@ -71,11 +96,10 @@ class UserUseCase:
     ) -> Union[schemas.UserOut, JSONResponse]:
         """Update user record."""
         try:
-            user = self.user_repository.get(db=self.db, _id=_id)
-
-            update_user = self.user_repository.update(
-                db=self.db, obj_in=obj_in, db_obj=user
+            update_user = self.user_repository.update_by_id(
+                db=self.db, _id=_id, obj_in=obj_in
             )
+            invalidate_user(self.db, _id)
             return schemas.UserOut.model_validate(update_user)
 
         except (DatabaseException, APIException) as e:
@@ -83,9 +107,20 @@ class UserUseCase:
             return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
 
     def delete_user(self, _id: int) -> Union[schemas.UserOut, JSONResponse]:
-        """Delete user record."""
+        """Delete user record.
+
+        The user and their jobs are only marked deleted here; the rows, the
+        applications and saved jobs under them and the uploaded files are
+        removed later by ``python -m app.commands.purge_deleted``.
+        """
         try:
-            user_update = self.user_repository.delete(db=self.db, _id=_id)
+            user_update = self.user_repository.soft_delete(db=self.db, _id=_id)
+            # Same transaction: the user and their jobs go together or not at all.
+            jobs = self.job_repository.soft_delete_by_user_id(
+                self.db, user_id=_id, returning=FACET_COLUMNS
+            )
+            invalidate_user(self.db, _id)
+            self._remove_facets(jobs)
 
             return schemas.UserOut.model_validate(user_update)
 
@@ -93,13 +128,34 @@ class UserUseCase:
             logger.error(f"Database error occurred while deleting user: {e.detail}")
             return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
 
+    def _remove_facets(self, jobs) -> None:
+        """Take deleted jobs out of the facet counts; a failure is only logged."""
+        try:
+            self.job_facet_repository.apply(
+                self.db,
+                removed=[
+                    value
+                    for job in jobs
+                    for value in JobFacetRepository.facet_values(job)
+                ],
+            )
+
+        except DatabaseException as e:
+            # Counts drift until `python -m app.commands.rebuild_job_facets`.
+            logger.error(f"Database error occurred while updating facets: {e.detail}")
+
     def forgot_password_otp(self, email: EmailSchema):
         return self.user_repository.send_otp(db=self.db, email=email)
 
     def reset_password_otp(
             self, data: ResetPasswordRequest
     ):
-        return self.user_repository.reset_password_with_otp(
-            self.db, email=data.email, otp=data.otp, new_password=data.new_password
-        )
+        try:
+            return self.user_repository.reset_password_with_otp(
+                self.db, email=data.email, otp=data.otp, new_password=data.new_password
+            )
+
+        except APIException as e:
+            logger.error(f"Error occurred while resetting password: {e.detail}")
+            return JSONResponse(status_code=e.status_code, content={"detail": e.detail})
 
@@ -0,0 +1,122 @@
+"""Response compression benchmark.
+
+Serves a seeded ``Page[JobOut]`` through an in-process app, with and without
+``CompressionMiddleware``, and reports the bytes on the wire, the time to
+produce the response and the transfer time at a given bandwidth for each
+coding and level.
+
+Usage::
+
+    python -m benchmarks.compression --items 50 --runs 50 --bandwidth-mbps 10
+"""
+
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from fastapi_pagination import Page
+
+from app import schemas
+from app.core.compression import CompressionMiddleware
+
+WORDS = (
+    "we are hiring a senior backend engineer to build and scale our hiring "
+    "platform you will design apis work with postgres and python mentor the "
+    "team and own services in production experience with fastapi sqlalchemy "
+    "docker and cloud infrastructure is a plus remote friendly competitive "
+    "salary health benefits flexible hours"
+).split()
+
+
+def seed_page(items: int, words: int) -> dict:
+    """Build a job page with descriptions of ``words`` random words."""
+    rng = random.Random(0)
+    now = datetime(2026, 10, 18)
+    jobs = [
+        schemas.JobOut(
+            id=i,
+            user_id=rng.randint(1, 100),
+            title=f"Backend Engineer {i}",
+            description=" ".join(rng.choice(WORDS) for _ in range(words)),
+            salary="$100k - $120k",
+            salary_min=100000,
+            salary_max=120000,
+            salary_currency="USD",
+            location=rng.choice(["Manila", "Cebu", "Davao", "Remote"]),
+            tags="python, fastapi, postgres",
+            is_remote=rng.random() < 0.5,
+            company=f"Company {rng.randint(1, 20)}",
+            created_at=now - timedelta(hours=i),
+            updated_at=now - timedelta(minutes=i),
+        )
+        for i in range(items)
+    ]
+    return {"items": jobs, "total": items, "page": 1, "size": items, "pages": 1}
+
+
+def build_client(page: dict, **compression) -> TestClient:
+    """An app serving the page, compressed when ``compression`` is given."""
+    app = FastAPI()
+    if compression:
+        app.add_middleware(CompressionMiddleware, **compression)
+
+    @app.get("/job", response_model=Page[schemas.JobOut])
+    def get_jobs():
+        return page
+
+    return TestClient(app)
+
+
+def measure(client: TestClient, accept_encoding: str, runs: int):
+    """Return the encoded size and the median response time in seconds."""
+    headers = {"Accept-Encoding": accept_encoding}
+    size = 0
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        with client.stream("GET", "/job", headers=headers) as response:
+            size = sum(len(chunk) for chunk in response.iter_raw())
+        timings.append(time.perf_counter() - start)
+    return size, statistics.median(timings)
+
+
+def main():
+    """Run the benchmark and print one line per coding."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--words", type=int, default=300)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--bandwidth-mbps", type=float, default=10.0)
+    args = parser.parse_args()
+
+    page = seed_page(args.items, args.words)
+    bytes_per_second = args.bandwidth_mbps * 1_000_000 / 8
+
+    cases = [("identity", "identity", {})]
+    cases += [(f"gzip {level}", "gzip", {"gzip_level": level}) for level in (1, 6, 9)]
+    cases += [
+        (f"br {quality}", "br", {"brotli_quality": quality}) for quality in (1, 4, 6)
+    ]
+
+    baseline = None
+    for name, accept_encoding, levels in cases:
+        compression = {"minimum_size": 0, **levels} if levels else {}
+        size, latency = measure(
+            build_client(page, **compression), accept_encoding, args.runs
+        )
+        total = latency + size / bytes_per_second
+        baseline = baseline or (size, total)
+        print(
+            f"{name:<9} {size:>9} bytes ({size / baseline[0]:6.1%}), "
+            f"server {latency * 1000:6.2f} ms, "
+            f"with transfer {total * 1000:7.2f} ms "
+            f"(saves {(baseline[1] - total) * 1000:7.2f} ms)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Projection read path benchmark.
+
+Seeds an in-memory SQLite ``application`` table, with the ``job`` and
+``user`` rows its live filter checks, and reads every row into
+``ApplicationOut`` twice: through ``get_all`` (ORM entities, identity map
+and instance state) and through ``get_all_projected`` (the schema's columns
+as ``__slots__`` rows). Reports the median time and the peak memory of each.
+
+Usage::
+
+    python -m benchmarks.projection --rows 10000 --runs 5
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from datetime import datetime
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import Session
+
+from app import schemas
+from app.models import Application
+from app.repositories.application import ApplicationRepository
+
+
+def seed(rows: int):
+    """An in-memory database holding ``rows`` applications."""
+    engine = create_engine("sqlite://")
+    with engine.begin() as connection:
+        # Only the columns the live filter reads; the job model has
+        # Postgres-only types.
+        for table, count in (("job", rows), ("user", 1000)):
+            connection.execute(
+                text(
+                    f'CREATE TABLE "{table}" '
+                    "(id INTEGER PRIMARY KEY, deleted_at DATETIME)"
+                )
+            )
+            connection.execute(
+                text(f'INSERT INTO "{table}" (id) VALUES (:id)'),
+                [{"id": i + 1} for i in range(count)],
+            )
+    Application.__table__.create(engine)
+    now = datetime(2026, 10, 18)
+    with Session(engine) as db:
+        db.execute(
+            insert(Application),
+            [
+                {
+                    "user_id": i % 1000 + 1,
+                    "job_id": i + 1,
+                    "email": f"applicant{i}@example.com",
+                    "mobile_number": "+639170000000",
+                    "expected_salary": 50000 + i,
+                    "resume": f"resume-{i}.pdf",
+                    "applied_at": now,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in range(rows)
+            ],
+        )
+        db.commit()
+    return engine
+
+
+def read_orm(repository, db):
+    """The current path: entities validated into the schema."""
+    return [
+        schemas.ApplicationOut.model_validate(row) for row in repository.get_all(db)
+    ]
+
+
+def read_projected(repository, db):
+    """The projection path: the schema's columns only."""
+    fields = list(schemas.ApplicationOut.model_fields)
+    return [
+        schemas.ApplicationOut.model_validate(row)
+        for row in repository.get_all_projected(db, fields)
+    ]
+
+
+def measure(engine, read, runs: int):
+    """Return the median time in seconds and the peak traced memory in bytes."""
+    repository = ApplicationRepository(Application)
+    timings = []
+    for _ in range(runs):
+        with Session(engine) as db:
+            start = time.perf_counter()
+            read(repository, db)
+            timings.append(time.perf_counter() - start)
+
+    with Session(engine) as db:
+        tracemalloc.start()
+        read(repository, db)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return statistics.median(timings), peak
+
+
+def main():
+    """Run the benchmark and print one line per path."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = seed(args.rows)
+    for name, read in (("orm", read_orm), ("projected", read_projected)):
+        median, peak = measure(engine, read, args.runs)
+        print(
+            f"{name:<10} {median * 1000:8.1f} ms, "
+            f"{args.rows / median:9.0f} rows/s, peak {peak / 1_000_000:6.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Response serialization microbenchmark.
+
+Runs FastAPI's own response path (``serialize_response`` against the
+``response_model`` field, then the response class) on a 100-item
+``Page[JobOut]``:
+
+- a plain dict, which FastAPI has to validate into the model again,
+- the validated model the use cases return, encoded with the stdlib,
+- the validated model encoded with orjson, the app's default.
+
+Usage::
+
+    python -m benchmarks.serialization --items 100 --runs 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from fastapi_pagination import Page
+
+from app import schemas
+from benchmarks.compression import seed_page
+
+
+async def render(field, content, response_class) -> bytes:
+    """Serialize ``content`` the way a route with ``field`` does."""
+    serialized = await serialize_response(field=field, response_content=content)
+    return response_class(serialized).body
+
+
+async def time_render(field, content, response_class, runs: int) -> float:
+    """Return the median time of one render in seconds."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await render(field, content, response_class)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+async def run(args):
+    """Time each path on the same seeded page."""
+    page_class = Page[schemas.JobOut]
+    field = create_model_field("Response", page_class, mode="serialization")
+    page = page_class(**seed_page(args.items, args.words))
+
+    cases = [
+        ("dict, revalidated, json", page.model_dump(), JSONResponse),
+        ("model, json", page, JSONResponse),
+        ("model, orjson", page, ORJSONResponse),
+    ]
+    baseline = None
+    for name, content, response_class in cases:
+        median = await time_render(field, content, response_class, args.runs)
+        size = len(await render(field, content, response_class))
+        baseline = baseline or median
+        print(
+            f"{name:<24} {median * 1000:7.3f} ms "
+            f"({baseline / median:4.1f}x faster, {size} bytes)"
+        )
+
+
+def main():
+    """Run the benchmark and print one line per path."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--words", type=int, default=300)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
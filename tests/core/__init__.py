@@ -0,0 +1 @@
+"""This package contains test core modules for the application."""
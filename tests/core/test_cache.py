@@ -0,0 +1,116 @@
+"""Cache unit tests."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import CacheBackend, MemoryCache
+from app.core.security import async_load_user, invalidate_user, load_user
+
+
+def test_cache_backend_requires_every_method():
+    """Test a backend missing a method cannot be created."""
+
+    class GetOnly(CacheBackend):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        GetOnly()
+
+
+def test_memory_cache_expires_entries():
+    """Test an entry is gone once its TTL passed."""
+    cache = MemoryCache(max_size=10)
+
+    with patch("app.core.cache.time.monotonic", return_value=100.0):
+        cache.set("key", {"id": 1}, ttl=5)
+        assert cache.get("key") == {"id": 1}
+
+    with patch("app.core.cache.time.monotonic", return_value=105.0):
+        assert cache.get("key") is None
+
+
+def test_memory_cache_evicts_least_recently_used():
+    """Test the least recently read entry is evicted when full."""
+    cache = MemoryCache(max_size=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    cache.get("a")
+
+    cache.set("c", 3, ttl=60)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+@patch("app.core.security.cache", new_callable=lambda: MemoryCache(max_size=10))
+@patch("app.core.security._user_repository")
+def test_load_user_is_cached_until_invalidated(
+    mock_user_repository, mock_cache, mock_session, user_model_out
+):
+    """Test the user is read once, then from the cache until invalidated."""
+    mock_user_repository.return_value.get.return_value = user_model_out
+
+    first = load_user(mock_session, 1)
+    second = load_user(mock_session, 1)
+
+    assert first == second
+    assert first.id == user_model_out.id
+    assert mock_user_repository.return_value.get.call_count == 1
+
+    with Session(create_engine("sqlite://")) as db:
+        db.execute(text("SELECT 1"))
+        invalidate_user(db, 1)
+        load_user(mock_session, 1)
+        assert mock_user_repository.return_value.get.call_count == 1
+
+        db.commit()
+
+    load_user(mock_session, 1)
+    assert mock_user_repository.return_value.get.call_count == 2
+
+
+@patch("app.core.security.cache", new_callable=lambda: MemoryCache(max_size=10))
+def test_invalidation_is_dropped_with_its_transaction(mock_cache):
+    """Test a rollback keeps the cached user, a savepoint rollback does not."""
+    mock_cache.set("user:1", {"id": 1}, ttl=60)
+    mock_cache.set("user:2", {"id": 2}, ttl=60)
+
+    with Session(create_engine("sqlite://")) as db:
+        db.execute(text("SELECT 1"))
+        invalidate_user(db, 1)
+        db.rollback()
+        db.commit()
+        assert mock_cache.get("user:1") == {"id": 1}
+
+        db.execute(text("SELECT 1"))
+        invalidate_user(db, 2)
+        with db.begin_nested() as savepoint:
+            savepoint.rollback()
+        db.commit()
+        assert mock_cache.get("user:2") is None
+
+
+@patch("app.core.security.cache", new_callable=lambda: MemoryCache(max_size=10))
+@patch("app.core.security._user_repository")
+def test_async_load_user_shares_the_cache(
+    mock_user_repository, mock_cache, mock_session, user_model_out
+):
+    """Test the async loader reads the user once and shares the sync cache."""
+    mock_user_repository.return_value.async_get = AsyncMock(return_value=user_model_out)
+    async_session = MagicMock(spec=AsyncSession)
+
+    first = asyncio.run(async_load_user(async_session, 1))
+    second = asyncio.run(async_load_user(async_session, 1))
+
+    assert first == second == load_user(mock_session, 1)
+    mock_user_repository.return_value.async_get.assert_awaited_once_with(
+        async_session, 1
+    )
+    mock_user_repository.return_value.get.assert_not_called()
@@ -0,0 +1,107 @@
+"""Compression middleware unit tests."""
+
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.responses import PlainTextResponse, Response, StreamingResponse
+
+from app.core.compression import CompressionMiddleware, negotiate
+
+BODY = "job description " * 200
+
+
+def _client():
+    app = FastAPI()
+    app.add_middleware(
+        CompressionMiddleware, minimum_size=500, exclude_paths=("/public",)
+    )
+
+    @app.get("/page")
+    def page():
+        return {"items": [BODY]}
+
+    @app.get("/small")
+    def small():
+        return {"items": []}
+
+    @app.get("/resume")
+    def resume():
+        return Response(BODY.encode(), media_type="application/pdf")
+
+    @app.get("/public/logo.svg")
+    def logo():
+        return Response(BODY.encode(), media_type="image/svg+xml")
+
+    @app.get("/encoded")
+    def encoded():
+        return Response(
+            gzip.compress(BODY.encode()),
+            media_type="text/plain",
+            headers={"Content-Encoding": "gzip"},
+        )
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(
+            (BODY.encode() for _ in range(3)), media_type="text/plain"
+        )
+
+    @app.get("/text")
+    def text():
+        return PlainTextResponse(BODY)
+
+    return TestClient(app)
+
+
+def test_negotiate():
+    """Test the highest weighted supported coding wins, ties keep our order."""
+    assert negotiate("gzip, br", ["br", "gzip"]) == "br"
+    assert negotiate("br;q=0.5, gzip", ["br", "gzip"]) == "gzip"
+    assert negotiate("br;q=0, *", ["br", "gzip"]) == "gzip"
+    assert negotiate("identity", ["br", "gzip"]) is None
+    assert negotiate("", ["gzip"]) is None
+
+
+def test_large_json_is_gzipped():
+    """Test a JSON page above the minimum size is gzip encoded."""
+    response = _client().get("/page", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert int(response.headers["Content-Length"]) < len(BODY)
+    assert response.json() == {"items": [BODY]}
+
+
+def test_streamed_text_is_gzipped():
+    """Test a streamed body is encoded chunk by chunk."""
+    response = _client().get("/stream", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    assert response.text == BODY * 3
+
+
+@pytest.mark.parametrize("path", ["/small", "/resume", "/public/logo.svg"])
+def test_skipped_responses(path):
+    """Test small, binary and static responses are sent as they are."""
+    response = _client().get(path, headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
+
+
+def test_already_encoded_response_is_not_encoded_again():
+    """Test a body with a Content-Encoding passes through."""
+    response = _client().get("/encoded", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.text == BODY
+
+
+def test_brotli_is_preferred():
+    """Test brotli is used when accepted."""
+    response = _client().get("/text", headers={"Accept-Encoding": "gzip, br"})
+
+    assert response.headers["Content-Encoding"] == "br"
+    assert response.text == BODY
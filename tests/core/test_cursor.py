@@ -0,0 +1,28 @@
+"""Cursor unit tests."""
+
+from datetime import datetime
+from http import HTTPStatus
+
+import pytest
+
+from app.core.cursor import decode_cursor, encode_cursor
+from exceptions.exceptions import APIException
+
+
+def test_cursor_round_trip():
+    """Test a cursor decodes to the sort key it was built from."""
+    updated_at = datetime(2025, 5, 24, 2, 29, 12, 535242)
+
+    cursor = encode_cursor(updated_at, 42)
+
+    assert decode_cursor(cursor) == (updated_at, 42)
+
+
+@pytest.mark.parametrize("cursor", ["garbage", "W10=", "WyJub3QtYS1kYXRlIiwxXQ=="])
+def test_decode_invalid_cursor(cursor):
+    """Test an invalid cursor is rejected as a bad request."""
+    with pytest.raises(APIException) as exc_info:
+        decode_cursor(cursor)
+
+    assert exc_info.value.status_code == HTTPStatus.BAD_REQUEST
+    assert exc_info.value.detail == "Invalid cursor."
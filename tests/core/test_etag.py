@@ -0,0 +1,65 @@
+"""ETag unit tests."""
+
+from http import HTTPStatus
+
+from fastapi import Request, Response
+
+from app.core.etag import ConditionalRequest, etag_matches, weak_etag
+
+
+def _request(if_none_match=None):
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/v1/job",
+            "query_string": b"page=2",
+            "headers": headers,
+        }
+    )
+
+
+def test_weak_etag_is_stable():
+    """Test the same parts give the same weak ETag."""
+    etag = weak_etag(1, "2026-10-18")
+
+    assert etag == weak_etag(1, "2026-10-18")
+    assert etag != weak_etag(1, "2026-10-19")
+    assert etag.startswith('W/"')
+
+
+def test_etag_matches():
+    """Test weak comparison against If-None-Match lists and wildcards."""
+    etag = weak_etag(1)
+    opaque = etag.removeprefix("W/")
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {opaque}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_not_modified_when_version_matches():
+    """Test a matching version returns 304 with the ETag header."""
+    etag = ConditionalRequest(_request(), Response()).set_etag(1, "v1")
+
+    conditional = ConditionalRequest(_request(etag), Response())
+    response = conditional.not_modified(1, "v1")
+
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+
+
+def test_modified_when_version_changed():
+    """Test a changed version sets the new ETag and lets the request through."""
+    etag = ConditionalRequest(_request(), Response()).set_etag(1, "v1")
+
+    response = Response()
+    conditional = ConditionalRequest(_request(etag), response)
+
+    assert conditional.not_modified(1, "v2") is None
+    assert response.headers["ETag"] != etag
@@ -0,0 +1,95 @@
+"""Password hashing unit tests."""
+
+import asyncio
+import threading
+from http import HTTPStatus
+
+import pytest
+
+from app.core.hashing import PasswordHasher
+from app.core.security import password_needs_rehash
+from exceptions.exceptions import APIException
+
+
+def test_password_hasher_runs_on_pool():
+    """Test the work runs on the hashing threads and is counted."""
+    hasher = PasswordHasher(max_workers=1, max_queue=0, timeout=1)
+
+    thread_name = hasher.run(lambda: threading.current_thread().name)
+
+    assert thread_name.startswith("password-hasher")
+    assert hasher.snapshot()["completed"] == 1
+
+
+def test_password_hasher_rejects_when_queue_full():
+    """Test callers are turned away once every worker and queue slot is taken."""
+    hasher = PasswordHasher(max_workers=1, max_queue=0, timeout=1)
+    started, release = threading.Event(), threading.Event()
+
+    def block():
+        started.set()
+        release.wait(1)
+
+    worker = threading.Thread(target=hasher.run, args=(block,))
+    worker.start()
+    started.wait(1)
+
+    with pytest.raises(APIException) as exc_info:
+        hasher.run(lambda: None)
+
+    release.set()
+    worker.join()
+
+    assert exc_info.value.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert hasher.snapshot()["rejected"] == 1
+
+
+def test_password_hasher_timeout_is_a_503_and_keeps_the_slot():
+    """Test a timed out hash is a 503 and holds its slot until it finishes."""
+    hasher = PasswordHasher(max_workers=1, max_queue=0, timeout=0.01)
+    release = threading.Event()
+
+    with pytest.raises(APIException) as exc_info:
+        hasher.run(release.wait, 1)
+    assert exc_info.value.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    with pytest.raises(APIException):
+        hasher.run(lambda: None)
+    assert hasher.snapshot()["rejected"] == 1
+
+    release.set()
+    hasher._executor.submit(lambda: None).result(1)
+    assert hasher.run(lambda: "done") == "done"
+    assert hasher.snapshot()["in_flight"] == 0
+
+
+def test_password_hasher_is_awaited_without_blocking():
+    """Test async callers await the pool and time out with a 503."""
+    hasher = PasswordHasher(max_workers=1, max_queue=0, timeout=0.05)
+    release = threading.Event()
+
+    async def login_storm():
+        hashing = asyncio.ensure_future(hasher.run_async(release.wait, 1))
+        # The event loop stays free while the hash runs.
+        await asyncio.sleep(0)
+        assert not hashing.done()
+        with pytest.raises(APIException) as exc_info:
+            await hashing
+        return exc_info.value
+
+    error = asyncio.run(login_storm())
+    release.set()
+    hasher._executor.submit(lambda: None).result(1)
+
+    assert error.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert asyncio.run(hasher.run_async(lambda: "done")) == "done"
+
+
+@pytest.mark.parametrize(
+    "hashed_password, expected",
+    [("$2b$12$hash", False), ("$2b$10$hash", True), ("not-a-hash", True)],
+)
+def test_password_needs_rehash(hashed_password, expected, monkeypatch):
+    """Test hashes are flagged when their cost differs from the setting."""
+    monkeypatch.setattr("app.core.security.settings.BCRYPT_ROUNDS", 12)
+
+    assert password_needs_rehash(hashed_password) is expected
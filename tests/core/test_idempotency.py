@@ -0,0 +1,118 @@
+"""Idempotency key unit tests."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from starlette.responses import JSONResponse
+
+from app import schemas
+from app.core.cache import MemoryCache
+from app.core.idempotency import IdempotentRequest
+
+
+@pytest.fixture()
+def memory_cache():
+    """An empty cache in place of the configured one."""
+    with patch("app.core.idempotency.cache", MemoryCache(max_size=10)) as cache:
+        yield cache
+
+
+def _idempotent(db, key, user_id=1):
+    """An IdempotentRequest of a POST /save-job by ``user_id``."""
+    request = MagicMock()
+    request.headers = {} if key is None else {"idempotency-key": key}
+    request.url.path = "/api/v1/save-job"
+    user = None if user_id is None else MagicMock(spec=schemas.UserOut, id=user_id)
+    return IdempotentRequest(request, db, user)
+
+
+def test_response_is_replayed_once_committed(memory_cache):
+    """Test a retry with the same key gets the first response back."""
+    with Session(create_engine("sqlite://")) as db:
+        first = _idempotent(db, "key")
+        assert first.replay({"job_id": 2}) is None
+        first.store(schemas.SavedJobIn(user_id=1, job_id=2))
+        assert first.replay({"job_id": 2}) is None
+
+        db.commit()
+
+        replayed = _idempotent(db, "key").replay({"job_id": 2})
+        assert replayed.body == b'{"user_id":1,"job_id":2}'
+        assert replayed.headers["Idempotent-Replayed"] == "true"
+        assert _idempotent(db, "key", user_id=2).replay({"job_id": 2}) is None
+        assert _idempotent(db, "other").replay({"job_id": 2}) is None
+
+
+def test_key_reused_with_another_body_is_rejected(memory_cache):
+    """Test a key sent again with a different body is a 422."""
+    with Session(create_engine("sqlite://")) as db:
+        first = _idempotent(db, "key")
+        first.replay("{}", b"resume")
+        first.store(schemas.SavedJobIn(user_id=1, job_id=2))
+        db.commit()
+
+        assert _idempotent(db, "key").replay("{}", b"resume") is not None
+        with pytest.raises(HTTPException) as exc_info:
+            _idempotent(db, "key").replay("{}", b"another resume")
+
+    assert exc_info.value.status_code == 422
+
+
+def test_savepoint_rollback_keeps_the_responses(memory_cache):
+    """Test only the request's own transaction rolling back drops them."""
+    with Session(create_engine("sqlite://")) as db:
+        db.execute(text("SELECT 1"))
+        first = _idempotent(db, "key")
+        first.replay()
+        first.store(schemas.SavedJobIn(user_id=1, job_id=2))
+        with db.begin_nested() as savepoint:
+            savepoint.rollback()
+        db.commit()
+
+        assert _idempotent(db, "key").replay() is not None
+
+
+def test_rolled_back_and_error_responses_are_not_kept(memory_cache):
+    """Test a retry runs again after a rollback or an error response."""
+    with Session(create_engine("sqlite://")) as db:
+        db.execute(text("SELECT 1"))
+        _idempotent(db, "key").store(schemas.SavedJobIn(user_id=1, job_id=2))
+        db.rollback()
+        _idempotent(db, "key").store(JSONResponse(status_code=409, content={}))
+        db.commit()
+
+        assert _idempotent(db, "key").replay() is None
+
+
+def test_requests_without_a_key_are_not_kept(memory_cache):
+    """Test requests without the header run as usual."""
+    with Session(create_engine("sqlite://")) as db:
+        idempotent = _idempotent(db, None)
+        idempotent.store(schemas.SavedJobIn(user_id=1, job_id=2))
+        db.commit()
+
+        assert idempotent.replay() is None
+        assert not memory_cache._entries
+
+
+def test_requests_without_a_user_are_not_kept(memory_cache):
+    """Test an unauthenticated request runs as usual instead of failing."""
+    with Session(create_engine("sqlite://")) as db:
+        idempotent = _idempotent(db, "key", user_id=None)
+        assert idempotent.replay() is None
+        idempotent.store(schemas.SavedJobIn(user_id=1, job_id=2))
+        db.commit()
+
+        assert not memory_cache._entries
+
+
+@pytest.mark.parametrize("key", ["", "k" * 256])
+def test_invalid_key_is_rejected(key):
+    """Test an empty or overlong key is a 400."""
+    with pytest.raises(HTTPException) as exc_info:
+        _idempotent(MagicMock(), key)
+
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,44 @@
+"""Response serialization unit tests."""
+
+import asyncio
+
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from fastapi_pagination import Page
+from pydantic import BaseModel, field_validator
+
+from app.core.responses import DefaultResponse
+
+validated = []
+
+
+class Counted(BaseModel):
+    """Model recording each validation."""
+
+    name: str
+
+    @field_validator("name")
+    @classmethod
+    def count(cls, name):
+        """Record the validation."""
+        validated.append(name)
+        return name
+
+
+def test_default_response_is_orjson():
+    """Test the app encodes with orjson."""
+    assert DefaultResponse is ORJSONResponse
+
+
+def test_validated_page_is_not_validated_again():
+    """Test a page returned by a use case is serialized without validation."""
+    page_class = Page[Counted]
+    page = page_class(items=[Counted(name="a")], total=1, page=1, size=50, pages=1)
+    field = create_model_field("Response", page_class, mode="serialization")
+    validated.clear()
+
+    content = asyncio.run(serialize_response(field=field, response_content=page))
+
+    assert validated == []
+    assert DefaultResponse(content).body.startswith(b'{"items":[{"name":"a"}]')
@@ -0,0 +1,35 @@
+"""Salary parsing unit tests."""
+
+import pytest
+from sqlalchemy import BigInteger
+
+from app.core.salary import SalaryRange, parse_salary
+from app.models import Job
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("₱50,000 - ₱80,000", SalaryRange(50000, 80000, "PHP")),
+        ("$100k-$120k", SalaryRange(100000, 120000, "USD")),
+        ("PHP 30,000/month", SalaryRange(30000, 30000, "PHP")),
+        ("1.2M eur", SalaryRange(1200000, 1200000, "EUR")),
+        ("50000", SalaryRange(50000, 50000, None)),
+        ("up to 3,000,000,000", SalaryRange(3000000000, 3000000000, None)),
+        ("IDR 15M - 99999999999999999999", SalaryRange(15000000, 15000000, None)),
+        ("Negotiable", SalaryRange(None, None, None)),
+        (None, SalaryRange(None, None, None)),
+    ],
+)
+def test_parse_salary(text, expected):
+    """Test free text salaries are parsed into a numeric range."""
+    assert parse_salary(text) == expected
+
+
+def test_salary_columns_hold_every_parsed_amount():
+    """Test amounts past int4, common in IDR or VND, fit the columns."""
+    salary = parse_salary("3,000,000,000 - 4,500,000,000")
+
+    assert salary.maximum > 2**31 - 1
+    for column in (Job.salary_min, Job.salary_max):
+        assert isinstance(column.type, BigInteger)
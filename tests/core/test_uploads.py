@@ -0,0 +1,47 @@
+"""Uploaded file unit tests."""
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from app.core.uploads import remove_after_commit, write_after_commit
+
+
+def test_superseded_file_is_removed_once_committed(tmp_path):
+    """Test the file goes with the commit, and stays after a rollback."""
+    kept = tmp_path / "kept.pdf"
+    removed = tmp_path / "removed.pdf"
+    kept.write_bytes(b"kept")
+    removed.write_bytes(b"removed")
+
+    with Session(create_engine("sqlite://")) as db:
+        db.execute(text("SELECT 1"))
+        remove_after_commit(db, str(tmp_path), "kept.pdf")
+        db.rollback()
+
+        db.execute(text("SELECT 1"))
+        remove_after_commit(db, str(tmp_path), "uploads/resumes/removed.pdf")
+        with db.begin_nested() as savepoint:
+            savepoint.rollback()
+        assert removed.exists()
+        db.commit()
+
+    assert kept.exists()
+    assert not removed.exists()
+
+
+def test_upload_is_written_once_committed(tmp_path):
+    """Test a new file is only written by the commit, never by a rollback."""
+    written, dropped = tmp_path / "new" / "written.pdf", tmp_path / "dropped.pdf"
+
+    with Session(create_engine("sqlite://")) as db:
+        db.execute(text("SELECT 1"))
+        write_after_commit(db, str(dropped), b"dropped")
+        db.rollback()
+
+        db.execute(text("SELECT 1"))
+        write_after_commit(db, str(written), b"resume")
+        assert not written.exists()
+        db.commit()
+
+    assert written.read_bytes() == b"resume"
+    assert not dropped.exists()
@@ -0,0 +1 @@
+"""This package contains test db modules for the application."""
@@ -0,0 +1,94 @@
+"""Application repository unit tests."""
+
+from http import HTTPStatus
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import NoResultFound
+
+from app.models import Application, Job
+from app.repositories.application import ApplicationRepository
+from app.repositories.job import JobRepository
+from app.schemas import ApplicationIn
+from exceptions.exceptions import APIException
+
+
+def test_get_all_by_job_id_paginated_selects_the_out_columns(mock_session):
+    """Test applications by job are read as the ApplicationOut columns only."""
+    application_repo = ApplicationRepository(Application)
+
+    with patch("app.repositories.base.sqlalchemy_paginate", spec=True) as m_paginate:
+        application_repo.get_all_by_job_id_paginated(mock_session, job_id=1)
+
+    query = str(m_paginate.call_args.args[1])
+    assert query.startswith("SELECT application.id, application.email")
+    assert "application.created_at" not in query.split("FROM")[0]
+    assert "AND application.job_id = :job_id_1" in query
+    # Applications of deleted jobs or applicants are left out.
+    assert "WHERE job.id = application.job_id AND job.deleted_at IS NULL" in query
+    assert 'WHERE "user".id = application.user_id AND "user".deleted_at' in query
+    assert "transformer" in m_paginate.call_args.kwargs
+
+
+def test_upsert_updates_the_details_of_an_existing_application(mock_session):
+    """Test applying again overwrites the given columns and updated_at only."""
+    ApplicationRepository(Application).upsert(
+        mock_session,
+        obj_in=ApplicationIn(user_id=2, job_id=3, resume="resume.pdf"),
+        index_elements=("user_id", "job_id"),
+        update_columns=("email", "resume"),
+    )
+
+    statement = str(
+        mock_session.scalars.call_args.args[0].compile(dialect=postgresql.dialect())
+    )
+    assert (
+        "ON CONFLICT (user_id, job_id) DO UPDATE SET email = excluded.email, "
+        "resume = excluded.resume, updated_at = %(param_1)s RETURNING"
+    ) in statement
+
+
+def test_apply_writes_to_a_live_job_in_one_statement(mock_session):
+    """Test the live job check and the unused resume come with the upsert."""
+    written = Application(id=1, resume="new.pdf")
+    mock_session.execute.return_value.one.return_value = (written, "old.pdf")
+
+    result = ApplicationRepository(Application).apply(
+        mock_session,
+        obj_in=ApplicationIn(user_id=2, job_id=3, resume="new.pdf"),
+        where=[JobRepository(Job).live_exists(3)],
+    )
+
+    statement = str(
+        mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+    )
+    mock_session.execute.assert_called_once()
+    assert statement.startswith("INSERT INTO application (user_id, job_id,")
+    assert (
+        "WHERE EXISTS (SELECT * \nFROM job \n"
+        "WHERE job.id = %(id_1)s AND job.deleted_at IS NULL) "
+        "ON CONFLICT (user_id, job_id) DO UPDATE"
+    ) in statement
+    # The replaced resume, unless another application still holds it.
+    assert (
+        "(SELECT application_1.resume \nFROM application AS application_1 \n"
+        "WHERE application_1.id = application.id "
+        "AND application_1.resume != application.resume AND NOT (EXISTS"
+    ) in statement
+    assert result == (written, "old.pdf")
+
+
+def test_apply_to_a_deleted_job_is_a_404(mock_session):
+    """Test an upsert that wrote no row, the job being deleted, is a 404."""
+    mock_session.execute.return_value.one.side_effect = NoResultFound()
+
+    with pytest.raises(APIException) as exc_info:
+        ApplicationRepository(Application).apply(
+            mock_session,
+            obj_in=ApplicationIn(user_id=2, job_id=3),
+            where=[JobRepository(Job).live_exists(3)],
+        )
+
+    assert exc_info.value.status_code == HTTPStatus.NOT_FOUND
+    mock_session.flush.assert_not_called()
@@ -0,0 +1,250 @@
+"""Repository delete tests against an in-memory database."""
+
+import tracemalloc
+
+import pytest
+from fastapi_pagination import Params, set_params
+from sqlalchemy import create_engine, event, func, insert, select
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.schema import CreateIndex, CreateTable, DropIndex
+
+from app.commands.dedupe_user_jobs import dedupe_step
+from app.commands.purge_deleted import purge_step
+from app.db.session import SessionLocal
+from app.models import Application, Job, SavedJob, User
+from app.repositories.application import ApplicationRepository
+from app.repositories.job import JobRepository
+from app.repositories.save_job import SavedJobRepository
+from app.repositories.user import UserRepository
+from exceptions.exceptions import APIException
+
+APPLICATIONS = 50_000
+
+
+@compiles(ARRAY, "sqlite")
+@compiles(TSVECTOR, "sqlite")
+def _compile_as_text(type_, compiler, **kw):
+    """Create the Postgres-only job columns as text in SQLite."""
+    return "TEXT"
+
+
+@pytest.fixture()
+def engine():
+    """An in-memory database enforcing the ON DELETE CASCADE foreign keys."""
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def _enable_foreign_keys(dbapi_connection, _):
+        dbapi_connection.execute("PRAGMA foreign_keys = ON")
+
+    # Tables and their unique indexes; some job indexes use Postgres syntax.
+    with engine.begin() as connection:
+        for model in (User, Job, Application, SavedJob):
+            connection.execute(CreateTable(model.__table__))
+            for index in model.__table__.indexes:
+                if index.unique:
+                    connection.execute(CreateIndex(index))
+        connection.execute(insert(User), [{"id": 1}, {"id": 2}])
+        connection.execute(insert(Job), [{"id": 1, "user_id": 1, "title": "Backend"}])
+        connection.execute(insert(SavedJob), [{"user_id": 2, "job_id": 1}])
+    return engine
+
+
+def _apply(engine, count, job_id=1, **values):
+    """Add ``count`` new users, each with one application to ``job_id``."""
+    with engine.begin() as connection:
+        first = connection.scalar(select(func.max(User.id))) + 1
+        user_ids = range(first, first + count)
+        connection.execute(insert(User), [{"id": user_id} for user_id in user_ids])
+        connection.execute(
+            insert(Application),
+            [{"user_id": user_id, "job_id": job_id, **values} for user_id in user_ids],
+        )
+
+
+def _count(db, model):
+    """Number of rows in a model's table."""
+    return db.scalar(select(func.count()).select_from(model))
+
+
+def test_delete_job_cascades_in_one_statement(engine):
+    """Test a job with 50k applications is deleted without loading them."""
+    _apply(engine, APPLICATIONS)
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    with SessionLocal(bind=engine) as db:
+        tracemalloc.start()
+        job = JobRepository(Job).delete(db, _id=1)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert len(statements) == 1
+        assert statements[0].startswith("DELETE FROM job WHERE job.id = ?")
+        assert len(db.identity_map) == 1
+        # Loading the applications as entities takes tens of megabytes.
+        assert peak < 2_000_000
+        assert job.title == "Backend"
+        assert _count(db, Application) == 0
+        assert _count(db, SavedJob) == 0
+
+
+def test_delete_user_cascades_to_jobs_and_their_children(engine):
+    """Test deleting an employer removes their jobs and everything under them."""
+    _apply(engine, 10)
+    with SessionLocal(bind=engine) as db:
+        UserRepository(User).delete(db, _id=1)
+
+        assert _count(db, Job) == 0
+        assert _count(db, Application) == 0
+        assert _count(db, SavedJob) == 0
+        assert db.get(User, 1) is None
+        assert _count(db, User) == 11
+
+
+def test_soft_deleted_job_is_hidden_until_purged(engine):
+    """Test a soft-deleted job leaves the reads but keeps its rows."""
+    _apply(engine, 3)
+    job_repo = JobRepository(Job)
+    with SessionLocal(bind=engine) as db:
+        job_repo.soft_delete(db, _id=1)
+        # The end of the request; the 404 below rolls its transaction back.
+        db.commit()
+
+        with pytest.raises(APIException):
+            job_repo.get(db, _id=1)
+        with pytest.raises(APIException):
+            job_repo.soft_delete(db, _id=1)
+        set_params(Params(page=1, size=10))
+        assert job_repo.get_all_paginated(db).total == 0
+        assert _count(db, Job) == 1
+        assert _count(db, Application) == 3
+
+
+def test_children_of_soft_deleted_jobs_and_users_are_hidden(engine):
+    """Test applications and saved jobs leave the reads with their job or user."""
+    with engine.begin() as connection:
+        connection.execute(insert(Job), [{"id": 2, "user_id": 1, "title": "Live"}])
+    _apply(engine, 2)
+    _apply(engine, 2, job_id=2)
+    with engine.begin() as connection:
+        connection.execute(insert(SavedJob), [{"user_id": 5, "job_id": 2}])
+
+    application_repo = ApplicationRepository(Application)
+    save_job_repo = SavedJobRepository(SavedJob)
+    set_params(Params(page=1, size=10))
+    with SessionLocal(bind=engine) as db:
+        JobRepository(Job).soft_delete(db, _id=1)
+        UserRepository(User).soft_delete(db, _id=5)
+
+        # Only user 6's application to job 2 is left.
+        assert [a.user_id for a in application_repo.get_all_paginated(db).items] == [6]
+        assert application_repo.get_all_by_job_id_paginated(db, job_id=1).total == 0
+        assert application_repo.get_all_by_job_id_paginated(db, job_id=2).total == 1
+        feed = application_repo.get_feed_by_job_id(db, job_id=2, cursor=None, size=10)
+        assert len(feed.items) == 1
+        with pytest.raises(APIException):
+            application_repo.get(db, 1)
+        with pytest.raises(APIException):
+            application_repo.get_by_user_id_and_job_id(db, user_id=5, job_id=2)
+
+        assert save_job_repo.get_all_paginated(db).total == 0
+        assert save_job_repo.get_all_by_user_id_paginated(db, user_id=5).total == 0
+        with pytest.raises(APIException):
+            save_job_repo.get_by_user_id_and_job_id(db, user_id=2, job_id=1)
+        assert _count(db, Application) == 4
+        assert _count(db, SavedJob) == 2
+
+
+def test_purge_removes_deleted_rows_in_batches_with_their_files(engine, tmp_path):
+    """Test the purge deletes children first, in batches, and orphaned files."""
+    (tmp_path / "shared.pdf").write_bytes(b"%PDF")
+    (tmp_path / "gone.pdf").write_bytes(b"%PDF")
+    _apply(engine, 4, resume="uploads/resumes/gone.pdf")
+    _apply(engine, 1, resume="uploads/resumes/shared.pdf")
+    with engine.begin() as connection:
+        connection.execute(insert(Job), [{"id": 2, "user_id": 2, "title": "Live"}])
+    # The same resume file on an application that stays.
+    _apply(engine, 1, job_id=2, resume="uploads/resumes/shared.pdf")
+
+    with SessionLocal(bind=engine) as db:
+        UserRepository(User).soft_delete(db, _id=1)
+        JobRepository(Job).soft_delete_by_user_id(db, user_id=1)
+
+        step = purge_step(
+            ApplicationRepository(Application),
+            2,
+            (Application.resume, str(tmp_path)),
+        )
+        batches = []
+        after_id = 0
+        while (after_id := step(db, after_id)) is not None:
+            batches.append(after_id)
+
+        assert batches == [2, 4, 5]
+        assert not (tmp_path / "gone.pdf").exists()
+        assert (tmp_path / "shared.pdf").exists()
+
+        for repository in (
+            SavedJobRepository(SavedJob),
+            JobRepository(Job),
+            UserRepository(User),
+        ):
+            step = purge_step(repository, 2)
+            while step(db, 0) is not None:
+                pass
+
+        assert _count(db, Application) == 1
+        assert _count(db, SavedJob) == 0
+        assert db.scalars(select(Job.id)).all() == [2]
+        assert db.get(User, 1) is None
+        assert _count(db, User) == 7
+
+
+def test_dedupe_keeps_the_newest_row_of_every_pair(engine, tmp_path):
+    """Test duplicates go in batches, with the resume files left unused."""
+    (tmp_path / "old.pdf").write_bytes(b"%PDF")
+    (tmp_path / "new.pdf").write_bytes(b"%PDF")
+    with engine.begin() as connection:
+        for model in (Application, SavedJob):
+            for index in model.__table__.indexes:
+                if index.unique:
+                    connection.execute(DropIndex(index))
+        connection.execute(
+            insert(Application),
+            [
+                {"user_id": 2, "job_id": 1, "resume": "old.pdf"},
+                {"user_id": 2, "job_id": 1, "resume": "old.pdf"},
+                {"user_id": 1, "job_id": 1, "resume": "new.pdf"},
+                {"user_id": 2, "job_id": 1, "resume": "new.pdf"},
+            ],
+        )
+        connection.execute(insert(SavedJob), [{"user_id": 2, "job_id": 1}])
+
+    with SessionLocal(bind=engine) as db:
+        step = dedupe_step(
+            "Application dedupe",
+            ApplicationRepository(Application),
+            1,
+            (Application.resume, str(tmp_path)),
+        )
+        batches = []
+        after_id = 0
+        while (after_id := step(db, after_id)) is not None:
+            batches.append(after_id)
+
+        step = dedupe_step("Saved job dedupe", SavedJobRepository(SavedJob), 500)
+        while step(db, 0) is not None:
+            pass
+
+        assert batches == [1, 2]
+        kept = db.scalars(select(Application.id).order_by(Application.id)).all()
+        assert kept == [3, 4]
+        assert db.scalars(select(SavedJob.id)).all() == [2]
+        assert not (tmp_path / "old.pdf").exists()
+        assert (tmp_path / "new.pdf").exists()
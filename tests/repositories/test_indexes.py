@@ -0,0 +1,310 @@
+"""Repository index coverage unit tests."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import UniqueConstraint, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import operators, visitors
+from sqlalchemy.sql.elements import (
+    BinaryExpression,
+    BindParameter,
+    ColumnClause,
+    False_,
+    True_,
+    UnaryExpression,
+)
+
+from app.models import Application, Item, Job, SavedJob, User
+from app.repositories.application import ApplicationRepository
+from app.repositories.item import ItemRepository
+from app.repositories.job import JobRepository
+from app.repositories.job_facet import FACET_FILTERS, JobFacetRepository
+from app.repositories.save_job import SavedJobRepository
+from app.repositories.user import UserRepository
+from app.schemas import JobFilter, JobSort
+
+
+def _paginated_query(call):
+    """Return the statement a paginated repository method hands to SQL."""
+    with patch("app.repositories.base.sqlalchemy_paginate", spec=True) as m_paginate:
+        call(MagicMock(spec=Session))
+    return m_paginate.call_args.args[1]
+
+
+def _legacy_query(model, call):
+    """Return the statement a ``db.query(...).filter(...)`` method would run."""
+    mock_session = MagicMock(spec=Session)
+    call(mock_session)
+    criteria = mock_session.query.return_value.filter.call_args.args
+    return select(model).where(*criteria)
+
+
+def _feed_query(call):
+    """Return the statement a cursor paginated repository method runs."""
+    mock_session = MagicMock(spec=Session)
+    call(mock_session)
+    return mock_session.execute.call_args.args[0]
+
+
+def _facet_query(facet, filters):
+    """Return the job select a grouped facet count is taken over."""
+    (jobs,) = JobFacetRepository()._grouped_query(facet, filters).get_final_froms()
+    return jobs.element
+
+
+# One filter narrowing each facet's count, by the JobFilter field it sets.
+FACET_NARROWING = {
+    "location": JobFilter(company="Acme"),
+    "is_remote": JobFilter(location="Manila"),
+    "company": JobFilter(is_remote=True),
+    "tags": JobFilter(location="Manila", tags=["python"]),
+}
+
+REPOSITORY_QUERIES = {
+    "item.get_all_paginated": lambda: _paginated_query(
+        lambda db: ItemRepository(Item).get_all_paginated(db)
+    ),
+    "user.get_all_paginated": lambda: _paginated_query(
+        lambda db: UserRepository(User).get_all_paginated(db)
+    ),
+    "job.get_all_paginated": lambda: _paginated_query(
+        lambda db: JobRepository(Job).get_all_paginated(db)
+    ),
+    "application.get_all_paginated": lambda: _paginated_query(
+        lambda db: ApplicationRepository(Application).get_all_paginated(db)
+    ),
+    "savedjob.get_all_paginated": lambda: _paginated_query(
+        lambda db: SavedJobRepository(SavedJob).get_all_paginated(db)
+    ),
+    "job.search location": lambda: _paginated_query(
+        lambda db: JobRepository(Job).search(db, filters=JobFilter(location="Manila"))
+    ),
+    "job.search company": lambda: _paginated_query(
+        lambda db: JobRepository(Job).search(db, filters=JobFilter(company="Acme"))
+    ),
+    "job.search is_remote": lambda: _paginated_query(
+        lambda db: JobRepository(Job).search(db, filters=JobFilter(is_remote=True))
+    ),
+    "job.search user_id": lambda: _paginated_query(
+        lambda db: JobRepository(Job).search(db, filters=JobFilter(user_id=1))
+    ),
+    "job.search sort created_at": lambda: _paginated_query(
+        lambda db: JobRepository(Job).search(
+            db, filters=JobFilter(sort=JobSort.created_at)
+        )
+    ),
+    "job.search sort salary": lambda: _paginated_query(
+        lambda db: JobRepository(Job).search(db, filters=JobFilter(sort=JobSort.salary))
+    ),
+    "job.get_all_by_user_id_paginated": lambda: _paginated_query(
+        lambda db: JobRepository(Job).get_all_by_user_id_paginated(db, user_id=1)
+    ),
+    "job.get_applied_by_user_id_paginated": lambda: _paginated_query(
+        lambda db: JobRepository(Job).get_applied_by_user_id_paginated(db, user_id=1)
+    ),
+    "application.get_all_by_job_id_paginated": lambda: _paginated_query(
+        lambda db: ApplicationRepository(Application).get_all_by_job_id_paginated(
+            db, job_id=1
+        )
+    ),
+    "savedjob.get_all_by_user_id_paginated": lambda: _paginated_query(
+        lambda db: SavedJobRepository(SavedJob).get_all_by_user_id_paginated(
+            db, user_id=1
+        )
+    ),
+    "job.search_paginated": lambda: _paginated_query(
+        lambda db: JobRepository(Job).search_paginated(db, q="python developer")
+    ),
+    "job.get_feed_by_user_id": lambda: _feed_query(
+        lambda db: JobRepository(Job).get_feed_by_user_id(
+            db, user_id=1, cursor=None, size=50
+        )
+    ),
+    "application.get_feed_by_job_id": lambda: _feed_query(
+        lambda db: ApplicationRepository(Application).get_feed_by_job_id(
+            db, job_id=1, cursor=None, size=50
+        )
+    ),
+    "savedjob.get_feed_by_user_id": lambda: _feed_query(
+        lambda db: SavedJobRepository(SavedJob).get_feed_by_user_id(
+            db, user_id=1, cursor=None, size=50
+        )
+    ),
+    **{
+        f"{name}.get_feed": (
+            lambda repository=repository, model=model: _feed_query(
+                lambda db: repository(model).get_feed(db, cursor=None, size=50)
+            )
+        )
+        for name, repository, model in [
+            ("item", ItemRepository, Item),
+            ("user", UserRepository, User),
+            ("job", JobRepository, Job),
+            ("application", ApplicationRepository, Application),
+            ("savedjob", SavedJobRepository, SavedJob),
+        ]
+    },
+    **{
+        f"job_facet._grouped_query {facet}": (
+            lambda facet=facet: _facet_query(
+                facet, FACET_NARROWING[FACET_FILTERS[facet]]
+            )
+        )
+        for facet in FACET_FILTERS
+    },
+    "job.get": lambda: _legacy_query(Job, lambda db: JobRepository(Job).get(db, _id=1)),
+    "user.get_by_email": lambda: _legacy_query(
+        User, lambda db: UserRepository.get_by_email(db, email="user@yahoo.com")
+    ),
+    "user.get_by_username": lambda: _legacy_query(
+        User, lambda db: UserRepository.get_by_username(db, username="user")
+    ),
+    "application.get_by_user_id_and_job_id": lambda: _legacy_query(
+        Application,
+        lambda db: ApplicationRepository(Application).get_by_user_id_and_job_id(
+            db, user_id=1, job_id=1
+        ),
+    ),
+    "savedjob.get_by_user_id_and_job_id": lambda: _legacy_query(
+        SavedJob,
+        lambda db: SavedJobRepository(SavedJob).get_by_user_id_and_job_id(
+            db, user_id=1, job_id=1
+        ),
+    ),
+}
+
+
+def _column(expression):
+    """Return the column under DESC / NULLS LAST modifiers."""
+    while isinstance(expression, UnaryExpression):
+        expression = expression.element
+    return expression
+
+
+# Operators answered by a GIN index: full-text match and array containment.
+GIN_OPERATORS = {"@@", "@>", "&&"}
+
+
+def _access_path(query):
+    """Return the table, equality filtered, GIN matched and ORDER BY columns."""
+    equals, matches = [], []
+    if query.whereclause is not None:
+        for element in visitors.iterate(query.whereclause):
+            if not isinstance(element, BinaryExpression):
+                continue
+            if element.operator is operators.eq and isinstance(
+                element.right, (BindParameter, True_, False_)
+            ):
+                equals.append(element.left)
+            elif getattr(element.operator, "opstring", None) in GIN_OPERATORS:
+                matches.append(element.left)
+
+    order_by = []
+    for clause in query._order_by_clauses:
+        column = _column(clause)
+        # No index orders by a computed value (ts_rank), nor by what follows.
+        if not isinstance(column, ColumnClause):
+            break
+        order_by.append(column)
+
+    tables = {column.table for column in equals + matches + order_by}
+    assert len(tables) == 1, "access path spans several tables"
+    return (
+        tables.pop(),
+        {c.name for c in equals},
+        {c.name for c in matches},
+        [c.name for c in order_by],
+    )
+
+
+def _live_only(query):
+    """Whether a query leaves soft-deleted rows out with ``deleted_at IS NULL``."""
+    if query.whereclause is None:
+        return False
+    return any(
+        isinstance(element, BinaryExpression)
+        and element.operator is operators.is_
+        and getattr(element.left, "name", None) == "deleted_at"
+        for element in visitors.iterate(query.whereclause)
+    )
+
+
+def _usable_indexes(table, query):
+    """Return the indexes of a table a query can use.
+
+    A partial index on the live rows only counts for queries that filter on
+    the same predicate.
+    """
+    for index in table.indexes:
+        where = index.dialect_options["postgresql"]["where"]
+        if where is None or (str(where) == "deleted_at IS NULL" and _live_only(query)):
+            yield index
+
+
+def _is_gin(index):
+    """Whether an index is a GIN index."""
+    return index.dialect_options["postgresql"]["using"] == "gin"
+
+
+def _indexed_column_lists(table, query):
+    """Return the column names of every B-tree usable for lookups on a table."""
+    column_lists = [[column.name for column in table.primary_key.columns]]
+    for index in _usable_indexes(table, query):
+        if not _is_gin(index):
+            column_lists.append([_column(expr).name for expr in index.expressions])
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint):
+            column_lists.append([column.name for column in constraint.columns])
+    return column_lists
+
+
+@pytest.mark.parametrize("name", sorted(REPOSITORY_QUERIES))
+def test_repository_query_has_covering_index(name):
+    """Test every repository filter and sort is served by an index prefix."""
+    query = REPOSITORY_QUERIES[name]()
+    table, equals, matches, order_by = _access_path(query)
+
+    covered = any(
+        set(columns[: len(equals)]) == equals
+        and columns[len(equals) : len(equals) + len(order_by)] == order_by
+        for columns in _indexed_column_lists(table, query)
+    )
+    gin_indexed = {
+        _column(expr).name
+        for index in _usable_indexes(table, query)
+        if _is_gin(index)
+        for expr in index.expressions
+    }
+
+    assert covered, f"{table.name}: no index on {sorted(equals)} then {order_by}"
+    assert matches <= gin_indexed, f"{table.name}: no GIN index on {sorted(matches)}"
+
+
+def test_every_repository_query_is_checked():
+    """Test a new paginated, feed or search method gets an entry above."""
+    checked = {name.split(" ")[0] for name in REPOSITORY_QUERIES}
+    for name, repository in [
+        ("item", ItemRepository),
+        ("user", UserRepository),
+        ("job", JobRepository),
+        ("application", ApplicationRepository),
+        ("savedjob", SavedJobRepository),
+    ]:
+        for method in dir(repository):
+            if method == "search" or (
+                not method.startswith("async_")
+                and (method.startswith("get_feed") or method.endswith("_paginated"))
+            ):
+                assert f"{name}.{method}" in checked
+
+
+@pytest.mark.parametrize("model", [Job, User])
+def test_soft_deleted_reads_filter_on_the_partial_index_predicate(model):
+    """Test the base reads of soft-deleted models carry ``deleted_at IS NULL``."""
+    repository = {Job: JobRepository, User: UserRepository}[model](model)
+
+    query = _paginated_query(lambda db: repository.get_all_paginated(db))
+
+    assert _live_only(query)
+    assert _live_only(repository._version_query(1))
@@ -1,19 +1,22 @@
 """Item repository unit tests."""
 
 from http import HTTPStatus
+from unittest.mock import patch
 
 import pytest
 from sqlalchemy.exc import IntegrityError
 
 from app.models import Item
 from app.repositories.item import ItemRepository
+from app.schemas import ItemOut
 from exceptions.exceptions import DatabaseException, APIException
 
 
 def test_get_items(mock_session):
     """Test successful retrieval of all items."""
     mock_data = [Item(), Item()]
-    mock_session.query.return_value.all.return_value = mock_data
+    mock_query = mock_session.query.return_value.filter.return_value
+    mock_query.order_by.return_value.all.return_value = mock_data
 
     # Call the method
     item_repo = ItemRepository(Item)
@@ -38,6 +41,73 @@ def test_get_items_exception(mock_session):
     assert exc_info.value.detail == "An error occurred while fetching the items."
 
 
+@patch("app.repositories.base.sqlalchemy_paginate", spec=True)
+def test_get_items_paginated(m_paginate, mock_session):
+    """Test retrieval of a page of items is delegated to SQL."""
+    mock_page = object()
+    m_paginate.return_value = mock_page
+
+    item_repo = ItemRepository(Item)
+    result = item_repo.get_all_paginated(mock_session)
+
+    m_paginate.assert_called_once()
+    session, query = m_paginate.call_args.args
+    assert session is mock_session
+    assert "ORDER BY item.id DESC" in str(query)
+    assert result is mock_page
+
+
+@patch("app.repositories.base.sqlalchemy_paginate", spec=True)
+def test_get_items_paginated_exception(m_paginate, mock_session):
+    """Test exception handling during paginated retrieval."""
+    m_paginate.side_effect = Exception("DB error")
+
+    with pytest.raises(DatabaseException) as exc_info:
+        item_repo = ItemRepository(Item)
+        item_repo.get_all_paginated(mock_session)
+
+    assert exc_info.value.detail == "An error occurred while fetching the items."
+
+
+def test_get_items_projected(mock_session):
+    """Test projected rows are slotted objects that validate into the schema."""
+    mock_session.execute.return_value = [(2, "b"), (1, "a")]
+
+    item_repo = ItemRepository(Item)
+    rows = item_repo.get_all_projected(mock_session, ["name"])
+
+    query = mock_session.execute.call_args.args[0]
+    assert str(query).startswith("SELECT item.id, item.name \nFROM item")
+    assert not hasattr(rows[0], "__dict__")
+    assert [ItemOut.model_validate(row) for row in rows] == [
+        ItemOut(id=2, name="b"),
+        ItemOut(id=1, name="a"),
+    ]
+
+
+def test_get_items_projected_exception(mock_session):
+    """Test exception handling during projected retrieval."""
+    mock_session.execute.side_effect = Exception("DB error")
+
+    with pytest.raises(DatabaseException) as exc_info:
+        ItemRepository(Item).get_all_projected(mock_session, ["name"])
+
+    assert exc_info.value.detail == "An error occurred while fetching the items."
+
+
+@patch("app.repositories.base.sqlalchemy_paginate", spec=True)
+def test_paginate_projection_builds_slotted_rows(m_paginate, mock_session):
+    """Test a page of a column select is transformed into slotted rows."""
+    item_repo = ItemRepository(Item)
+    query = item_repo._select(item_repo.columns(["name"]))
+
+    item_repo.paginate(mock_session, query)
+
+    transformer = m_paginate.call_args.kwargs["transformer"]
+    (row,) = transformer([(1, "a")])
+    assert (row.id, row.name) == (1, "a")
+
+
 def test_get_item(mock_session):
     """Test successful retrieval of a specific item."""
     mock_data = Item()
@@ -67,13 +137,19 @@ def test_get_item_not_found(mock_session):
 
 
 def test_create_item_success(mock_session, item_db_in):
-    """Test successful creation of an item."""
+    """Test successful creation of an item in one INSERT ... RETURNING."""
+    mock_session.scalars.return_value.one.return_value = Item(
+        id=1, name=item_db_in.name
+    )
+
     item_repo = ItemRepository(Item)
     create_item = item_repo.create(db=mock_session, obj_in=item_db_in)
 
-    mock_session.add.assert_called_once()
-    mock_session.commit.assert_called_once()
-    mock_session.refresh.assert_called_once()
+    statement = str(mock_session.scalars.call_args.args[0])
+    assert statement.startswith("INSERT INTO item (name) VALUES (:name)")
+    assert "RETURNING item.id, item.name" in statement
+    mock_session.flush.assert_called_once()
+    mock_session.refresh.assert_not_called()
 
     assert create_item is not None
     assert create_item.name == item_db_in.name
@@ -81,9 +157,7 @@ def test_create_item_success(mock_session, item_db_in):
 
 def test_create_item_integrity_error(mock_session, item_db_in):
     """Test creation with Integrity error."""
-    # Simulate an IntegrityError being raised when `add` is called
-    mock_session.add.side_effect = None
-    mock_session.commit.side_effect = IntegrityError(
+    mock_session.flush.side_effect = IntegrityError(
         "Simulated Integrity Error",
         orig=ValueError("Duplicate entry for unique constraint"),
         params=None,
@@ -94,113 +168,84 @@ def test_create_item_integrity_error(mock_session, item_db_in):
         item_repo = ItemRepository(Item)
         item_repo.create(db=mock_session, obj_in=item_db_in)
 
-    mock_session.add.assert_called_once()
-    mock_session.commit.assert_called_once()
-    mock_session.refresh.assert_not_called()
+    mock_session.scalars.assert_called_once()
+    mock_session.flush.assert_called_once()
+    mock_session.rollback.assert_called_once()
     assert exc_info.value.detail == "Duplicate entry for unique constraint"
     assert exc_info.value.status_code == HTTPStatus.CONFLICT
 
 
 def test_create_item_exception_error(mock_session, item_db_in):
     """Test creation with Exception error."""
-    # Simulate an IntegrityError being raised when `add` is called
-    mock_session.add.side_effect = Exception("error")
+    mock_session.scalars.side_effect = Exception("error")
 
     # Check that DatabaseException is raised
     with pytest.raises(DatabaseException) as exc_info:
         item_repo = ItemRepository(Item)
         item_repo.create(db=mock_session, obj_in=item_db_in)
 
-    mock_session.add.assert_called_once()
-    mock_session.commit.assert_not_called()
-    mock_session.refresh.assert_not_called()
+    mock_session.flush.assert_not_called()
     assert exc_info.value.detail == "An unexpected error occurred."
     assert exc_info.value.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
 
 
-def test_update_item_success(mock_session, item_db_in):
-    """Test successful update of an item."""
-    mock_data = Item()
-    mock_data.name = "Item 2"
+def test_update_item_by_id(mock_session, item_db_in):
+    """Test an update is one UPDATE ... WHERE id RETURNING, without a read."""
+    mock_session.execute.return_value.first.return_value = (
+        Item(id=1, name=item_db_in.name),
+    )
 
     item_repo = ItemRepository(Item)
-    update_item = item_repo.update(db=mock_session, obj_in=item_db_in, db_obj=mock_data)
-
-    mock_session.add.assert_called_once()
-    mock_session.commit.assert_called_once()
-    mock_session.refresh.assert_called_once()
+    update_item = item_repo.update_by_id(db=mock_session, _id=1, obj_in=item_db_in)
 
-    assert update_item is not None
+    statement = str(mock_session.execute.call_args.args[0])
+    assert statement.startswith("UPDATE item SET name=:name WHERE item.id = :id_1")
+    assert "RETURNING item.id, item.name" in statement
+    mock_session.query.assert_not_called()
+    mock_session.flush.assert_called_once()
     assert update_item.name == item_db_in.name
 
 
-def test_update_item_integrity_error(mock_session, item_db_in):
-    """Test update with Integrity error."""
-    # Simulate an IntegrityError being raised when `add` is called
-    mock_session.add.side_effect = None
-    mock_session.commit.side_effect = IntegrityError(
-        "Simulated Integrity Error",
-        orig=ValueError("Duplicate entry for unique constraint"),
-        params=None,
-    )
-
-    # Check that DatabaseException is raised
-    with pytest.raises(DatabaseException) as exc_info:
-        item_model = Item()
-        item_repo = ItemRepository(Item)
-        item_repo.update(db=mock_session, obj_in=item_db_in, db_obj=item_model)
-
-    mock_session.add.assert_called_once()
-    mock_session.commit.assert_called_once()
-    mock_session.refresh.assert_not_called()
-    assert exc_info.value.detail == "Duplicate entry for unique constraint"
-    assert exc_info.value.status_code == HTTPStatus.CONFLICT
+def test_update_item_by_id_not_found(mock_session, item_db_in):
+    """Test an update matching no row is a 404."""
+    mock_session.execute.return_value.first.return_value = None
 
+    with pytest.raises(APIException) as exc_info:
+        ItemRepository(Item).update_by_id(db=mock_session, _id=1, obj_in=item_db_in)
 
-def test_update_item_exception_error(mock_session, item_db_in):
-    """Test update with Exception error."""
-    # Simulate an IntegrityError being raised when `add` is called
-    mock_session.add.side_effect = Exception("error")
-
-    # Check that DatabaseException is raised
-    with pytest.raises(DatabaseException) as exc_info:
-        item_model = Item()
-        item_repo = ItemRepository(Item)
-        item_repo.update(db=mock_session, obj_in=item_db_in, db_obj=item_model)
-
-    mock_session.add.assert_called_once()
-    mock_session.commit.assert_not_called()
-    mock_session.refresh.assert_not_called()
-    assert exc_info.value.detail == "An unexpected error occurred during the update."
-    assert exc_info.value.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+    mock_session.flush.assert_not_called()
+    mock_session.rollback.assert_called_once()
+    assert exc_info.value.status_code == HTTPStatus.NOT_FOUND
 
 
 def test_delete_item_success(mock_session):
-    """Test delete of an item."""
+    """Test delete of an item in one DELETE ... RETURNING."""
     mock_data = Item()
-    mock_session.query.return_value.get.return_value = mock_data
+    mock_session.scalars.return_value.first.return_value = mock_data
 
     item_repo = ItemRepository(Item)
     delete_item = item_repo.delete(db=mock_session, _id=1)
 
-    mock_session.query.assert_called_once()
-    mock_session.commit.assert_called_once()
-    mock_session.delete.assert_called_once()
+    statement = str(mock_session.scalars.call_args.args[0])
+    assert statement.startswith("DELETE FROM item WHERE item.id = :id_1")
+    assert "RETURNING item.id, item.name" in statement
+    mock_session.flush.assert_called_once()
+    mock_session.query.assert_not_called()
+    mock_session.delete.assert_not_called()
 
     assert delete_item == mock_data
 
 
 def test_delete_item_not_found(mock_session):
     """Test item not found during deletion."""
-    mock_session.query.return_value.get.return_value = None
+    mock_session.scalars.return_value.first.return_value = None
 
     with pytest.raises(APIException) as exc_info:
         item_repo = ItemRepository(Item)
         item_repo.delete(db=mock_session, _id=1)
 
-    mock_session.query.assert_called_once()
-    mock_session.commit.assert_not_called()
-    mock_session.delete.assert_not_called()
+    mock_session.scalars.assert_called_once()
+    mock_session.flush.assert_not_called()
 
     assert exc_info.value.detail == "Record not found."
     assert exc_info.value.status_code == HTTPStatus.NOT_FOUND
@@ -208,15 +253,14 @@ def test_delete_item_not_found(mock_session):
 
 def test_delete_item_exception(mock_session):
     """Test item exception error during deletion."""
-    mock_session.query.side_effect = Exception("error")
+    mock_session.scalars.side_effect = Exception("error")
 
     with pytest.raises(DatabaseException) as exc_info:
         item_repo = ItemRepository(Item)
         item_repo.delete(db=mock_session, _id=1)
 
-    mock_session.query.assert_called_once()
-    mock_session.commit.assert_not_called()
-    mock_session.delete.assert_not_called()
+    mock_session.scalars.assert_called_once()
+    mock_session.flush.assert_not_called()
 
     assert exc_info.value.detail == "An unexpected error occurred during the deletion."
     assert exc_info.value.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
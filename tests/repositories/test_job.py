@@ -0,0 +1,257 @@
+"""Job repository unit tests."""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.dialects import postgresql
+
+from app.core.cursor import decode_cursor, encode_cursor
+from app.models import Job
+from app.repositories.job import JobRepository
+from app.schemas import JOB_CARD_FIELDS, JobFilter, JobOut, JobSort
+
+
+def _jobs(count):
+    """Build jobs ordered newest first."""
+    now = datetime(2025, 5, 24)
+    jobs = []
+    for i in range(count):
+        job = Job()
+        job.id = count - i
+        job.updated_at = now - timedelta(minutes=i)
+        jobs.append(job)
+    return jobs
+
+
+def test_get_feed_by_user_id_has_next_page(mock_session):
+    """Test one extra row is fetched to decide whether there is a next page."""
+    mock_data = _jobs(3)
+    mock_session.execute.return_value.scalars.return_value = mock_data
+
+    job_repo = JobRepository(Job)
+    result = job_repo.get_feed_by_user_id(mock_session, user_id=1, cursor=None, size=2)
+
+    query = mock_session.execute.call_args.args[0]
+    assert query._limit_clause.value == 3
+    assert result.items == mock_data[:2]
+    assert decode_cursor(result.next_cursor) == (
+        mock_data[1].updated_at,
+        mock_data[1].id,
+    )
+
+
+def test_get_feed_by_user_id_last_page(mock_session):
+    """Test the last page has no next cursor and filters after the cursor."""
+    mock_data = _jobs(1)
+    mock_session.execute.return_value.scalars.return_value = mock_data
+
+    job_repo = JobRepository(Job)
+    cursor = encode_cursor(datetime(2025, 5, 24), 10)
+    result = job_repo.get_feed_by_user_id(
+        mock_session, user_id=1, cursor=cursor, size=2
+    )
+
+    query = mock_session.execute.call_args.args[0]
+    assert "(job.updated_at, job.id) <" in str(query)
+    assert result.items == mock_data
+    assert result.next_cursor is None
+
+
+def test_get_applied_by_user_id_paginated(mock_session):
+    """Test applied jobs are fetched with a single join query."""
+    job_repo = JobRepository(Job)
+
+    with patch("app.repositories.base.sqlalchemy_paginate", spec=True) as m_paginate:
+        job_repo.get_applied_by_user_id_paginated(mock_session, user_id=1)
+
+    m_paginate.assert_called_once()
+    query = str(m_paginate.call_args.args[1])
+    assert "JOIN application ON application.job_id = job.id" in query
+    assert "WHERE job.deleted_at IS NULL AND application.user_id = :user_id_1" in query
+    mock_session.query.assert_not_called()
+
+
+def test_applied_jobs_select_only_the_card_columns(mock_session):
+    """Test a card list reads the card columns, not the description."""
+    job_repo = JobRepository(Job)
+
+    with patch("app.repositories.base.sqlalchemy_paginate", spec=True) as m_paginate:
+        job_repo.get_applied_by_user_id_paginated(
+            mock_session, user_id=1, columns=job_repo.columns(JOB_CARD_FIELDS)
+        )
+
+    select_list = str(m_paginate.call_args.args[1]).split("FROM")[0]
+    assert "job.id, job.title, job.company, job.location" in select_list
+    assert "job.description" not in select_list
+    assert "JOIN application ON application.job_id = job.id" in str(
+        m_paginate.call_args.args[1]
+    )
+
+
+def test_columns_always_start_with_the_primary_key():
+    """Test the id is selected once and first, whatever fields are asked."""
+    columns = JobRepository(Job).columns(["title", "id", "salary_max"])
+
+    assert [column.key for column in columns] == ["id", "title", "salary_max"]
+
+
+def test_search_paginated(mock_session):
+    """Test the full-text search matches the GIN indexed vector and ranks in SQL."""
+    job_repo = JobRepository(Job)
+
+    with patch("app.repositories.base.sqlalchemy_paginate", spec=True) as m_paginate:
+        job_repo.search_paginated(mock_session, q="python remote")
+
+    query = m_paginate.call_args.args[1]
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert "job.search_vector @@ websearch_to_tsquery" in sql
+    assert "ORDER BY ts_rank(job.search_vector" in sql
+    assert "job.search_vector," not in sql.split("FROM")[0]
+
+
+def test_backfill_search_vector(mock_session):
+    """Test one batch is updated after the given id and its last id returned."""
+    mock_session.scalars.return_value.all.return_value = [11, 12, 13]
+
+    job_repo = JobRepository(Job)
+    last_id = job_repo.backfill_search_vector(mock_session, after_id=10, batch_size=3)
+
+    statement = str(
+        mock_session.scalars.call_args.args[0].compile(dialect=postgresql.dialect())
+    )
+    assert "SET updated_at=job.updated_at, search_vector=" in statement
+    assert "job.id > %(id_1)s ORDER BY job.id" in statement
+    mock_session.flush.assert_called_once()
+    assert last_id == 13
+
+
+def test_search_combines_filters(mock_session):
+    """Test every filter lands in the one query, in the whitelisted order."""
+    job_repo = JobRepository(Job)
+    filters = JobFilter(
+        location="Manila", is_remote=True, tags=["python"], sort=JobSort.created_at
+    )
+
+    with patch("app.repositories.base.sqlalchemy_paginate", spec=True) as m_paginate:
+        job_repo.search(mock_session, filters=filters)
+
+    m_paginate.assert_called_once()
+    query = str(m_paginate.call_args.args[1])
+    assert "job.location = :location_1" in query
+    assert "job.is_remote = true" in query
+    assert "job.tags @> :tags_1" in query
+    assert "job.company" not in query.split("WHERE")[1]
+    assert "ORDER BY job.created_at DESC, job.id DESC" in query
+
+
+def test_tags_keep_the_comma_separated_format():
+    """Test tags are stored as a list and emitted as the API string again."""
+    job = Job(
+        id=1,
+        user_id=1,
+        location="Manila",
+        tags=" python, fastapi ,,",
+        created_at=datetime(2025, 5, 24),
+        updated_at=datetime(2025, 5, 24),
+    )
+
+    assert job.tags == ["python", "fastapi"]
+    assert JobOut.model_validate(job).tags == "python, fastapi"
+
+
+def test_search_salary_range_and_sort(mock_session):
+    """Test salary filters overlap the stored range and sort highest first."""
+    job_repo = JobRepository(Job)
+    filters = JobFilter(salary_min=50000, salary_max=90000, sort=JobSort.salary)
+
+    with patch("app.repositories.base.sqlalchemy_paginate", spec=True) as m_paginate:
+        job_repo.search(mock_session, filters=filters)
+
+    query = str(m_paginate.call_args.args[1])
+    assert "job.salary_max >= :salary_max_1" in query
+    assert "job.salary_min <= :salary_min_1" in query
+    assert "ORDER BY job.salary_max DESC NULLS LAST, job.id DESC" in query
+
+
+def test_salary_is_parsed_on_write():
+    """Test setting the salary text fills the numeric columns."""
+    job = Job(salary="₱50,000 - ₱80,000")
+
+    assert (job.salary_min, job.salary_max, job.salary_currency) == (
+        50000,
+        80000,
+        "PHP",
+    )
+
+
+def test_backfill_salary(mock_session):
+    """Test one batch is parsed and written back by primary key."""
+    row = MagicMock(id=11, salary="$100k", updated_at=datetime(2025, 5, 24))
+    mock_session.execute.return_value.all.return_value = [row]
+
+    job_repo = JobRepository(Job)
+    last_id = job_repo.backfill_salary(mock_session, after_id=10, batch_size=3)
+
+    values = mock_session.execute.call_args.args[1]
+    assert values == [
+        {
+            "id": 11,
+            "salary_min": 100000,
+            "salary_max": 100000,
+            "salary_currency": "USD",
+            "updated_at": datetime(2025, 5, 24),
+        }
+    ]
+    mock_session.flush.assert_called_once()
+    assert last_id == 11
+
+
+def test_search_version_keeps_filters_and_drops_order(mock_session):
+    """Test the list version aggregates the filtered rows without sorting."""
+    mock_session.execute.return_value.one.return_value = (datetime(2025, 5, 24), 3)
+
+    job_repo = JobRepository(Job)
+    version = job_repo.search_version(
+        mock_session, filters=JobFilter(location="Manila")
+    )
+
+    query = mock_session.execute.call_args.args[0]
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert "max(job.updated_at)" in sql
+    assert "count(*)" in sql
+    assert "job.location" in sql
+    assert "ORDER BY" not in sql
+    assert version == (datetime(2025, 5, 24), 3)
+
+
+def test_update_returns_previous_facets_in_one_statement(mock_session):
+    """Test the update locks and returns the old facet columns with the new row."""
+    updated = Job(id=1, location="Cebu")
+    mock_session.execute.return_value.first.return_value = (
+        updated,
+        "Manila",
+        None,
+        None,
+        ["python"],
+    )
+
+    job_repo = JobRepository(Job)
+    job, before = job_repo.update_by_id_returning_previous(
+        mock_session,
+        _id=1,
+        obj_in={"location": "Cebu", "salary": "$100k", "tags": "python, sql"},
+        previous=("location", "is_remote", "company", "tags"),
+    )
+
+    query = mock_session.execute.call_args.args[0]
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE job SET")
+    assert "FOR UPDATE) AS previous" in sql
+    assert "WHERE job.id = previous.id" in sql
+    assert "previous.location" in sql
+    params = query.compile().params
+    assert params["tags"] == ["python", "sql"]
+    assert (params["salary_min"], params["salary_currency"]) == (100000, "USD")
+    mock_session.flush.assert_called_once()
+    assert job is updated
+    assert (before.location, before.tags) == ("Manila", ["python"])
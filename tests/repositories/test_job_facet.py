@@ -0,0 +1,81 @@
+"""Job facet repository unit tests."""
+
+from sqlalchemy.dialects import postgresql
+
+from app.models import Job, JobFacet
+from app.repositories.job_facet import JobFacetRepository
+from app.schemas import JobFilter
+
+
+def test_facet_values():
+    """Test a job counts once towards each of its facet values."""
+    job = Job(
+        location="Manila", is_remote=False, company="", tags="python, python, sql"
+    )
+
+    assert JobFacetRepository.facet_values(job) == [
+        ("location", "Manila"),
+        ("is_remote", "false"),
+        ("tag", "python"),
+        ("tag", "sql"),
+    ]
+
+
+def test_apply_upserts_only_changed_counts(mock_session):
+    """Test an update moves counts between values in a single upsert."""
+    job_facet_repo = JobFacetRepository(JobFacet)
+
+    job_facet_repo.apply(
+        mock_session,
+        removed=[("location", "Manila"), ("tag", "python")],
+        added=[("location", "Cebu"), ("tag", "python")],
+    )
+
+    compiled = mock_session.execute.call_args.args[0].compile(
+        dialect=postgresql.dialect()
+    )
+    params = compiled.params
+    assert "ON CONFLICT (facet, value) DO UPDATE" in str(compiled)
+    assert "value_m2" not in params
+    assert sorted((params[f"value_m{i}"], params[f"count_m{i}"]) for i in range(2)) == [
+        ("Cebu", 1),
+        ("Manila", -1),
+    ]
+    mock_session.begin_nested.assert_called_once()
+
+
+def test_apply_without_changes_skips_the_database(mock_session):
+    """Test an update that keeps the facet values issues no statement."""
+    job_facet_repo = JobFacetRepository(JobFacet)
+
+    job_facet_repo.apply(
+        mock_session, removed=[("company", "Acme")], added=[("company", "Acme")]
+    )
+
+    mock_session.execute.assert_not_called()
+
+
+def test_facets_respect_the_other_filters():
+    """Test a facet ignores its own filter and reads the aggregate when alone."""
+    job_facet_repo = JobFacetRepository(JobFacet)
+
+    queries = job_facet_repo._facet_queries(JobFilter(location="Manila"))
+
+    assert "FROM jobfacet" in str(queries["location"])
+    for facet in ("is_remote", "company", "tag"):
+        assert "FROM jobfacet" not in str(queries[facet])
+        assert "job.location = :location_1" in str(queries[facet])
+
+
+def test_grouped_tag_counts_a_repeated_tag_once():
+    """Test the filtered tag counts dedupe per job, like ``facet_values``."""
+    job_facet_repo = JobFacetRepository(JobFacet)
+
+    for filters in (JobFilter(location="Manila"), JobFilter()):
+        query = str(
+            job_facet_repo._grouped_query("tag", filters).compile(
+                dialect=postgresql.dialect()
+            )
+        )
+
+        assert "SELECT DISTINCT unnest(job.tags) AS value, job.id" in query
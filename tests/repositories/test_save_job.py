@@ -0,0 +1,78 @@
+"""Saved job repository unit tests."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+from sqlalchemy.dialects import postgresql
+
+from app.models import SavedJob
+from app.repositories.save_job import SavedJobRepository
+from app.schemas import SavedJobIn, SavedJobsOut
+
+
+def test_get_all_by_user_id_paginated(mock_session):
+    """Test saved jobs are fetched with one join over the needed job columns."""
+    save_job_repo = SavedJobRepository(SavedJob)
+
+    with patch("app.repositories.base.sqlalchemy_paginate", spec=True) as m_paginate:
+        save_job_repo.get_all_by_user_id_paginated(mock_session, user_id=1)
+
+    m_paginate.assert_called_once()
+    query = m_paginate.call_args.args[1]
+    assert [column["name"] for column in query.column_descriptions] == [
+        "id",
+        "user_id",
+        "job_id",
+        "job_title",
+        "job_location",
+        "job_description",
+        "job_salary",
+        "created_at",
+        "updated_at",
+    ]
+    assert "JOIN job ON job.id = savedjob.job_id" in str(query)
+    mock_session.query.assert_not_called()
+
+
+def test_to_saved_jobs_out():
+    """Test projected rows map straight to the schema."""
+    now = datetime(2025, 5, 24)
+    row = {
+        "id": 1,
+        "user_id": 2,
+        "job_id": 3,
+        "job_title": "Backend Engineer",
+        "job_location": "Manila",
+        "job_description": None,
+        "job_salary": "PHP 80,000",
+        "created_at": now,
+        "updated_at": now,
+    }
+
+    result = SavedJobRepository._to_saved_jobs_out([row])
+
+    assert result == [SavedJobsOut(**row)]
+
+
+def test_upsert_returns_the_existing_saved_job(mock_session):
+    """Test saving a job twice is one INSERT ... ON CONFLICT that returns a row."""
+    saved = SavedJob(id=1, user_id=2, job_id=3)
+    mock_session.scalars.return_value.one.return_value = saved
+
+    result = SavedJobRepository(SavedJob).upsert(
+        mock_session,
+        obj_in=SavedJobIn(user_id=2, job_id=3),
+        index_elements=("user_id", "job_id"),
+    )
+
+    statement = str(
+        mock_session.scalars.call_args.args[0].compile(dialect=postgresql.dialect())
+    )
+    assert statement.startswith("INSERT INTO savedjob (user_id, job_id,")
+    # A no-op update, so a duplicate returns the existing row.
+    assert (
+        "ON CONFLICT (user_id, job_id) DO UPDATE SET user_id = savedjob.user_id"
+        " RETURNING savedjob.id"
+    ) in statement
+    mock_session.flush.assert_called_once()
+    assert result is saved
@@ -1,11 +1,13 @@
 """User repository unit tests."""
 
+import asyncio
 from http import HTTPStatus
 from unittest.mock import patch
 
 import pytest
 from sqlalchemy.exc import IntegrityError
 
+from app.core.config import settings
 from app.core.security import verify_password
 from app.models import User
 from app.repositories.user import UserRepository
@@ -34,7 +36,7 @@ def test_create_user_success(mock_session, user_db_in):
     )
 
     mock_session.add.assert_called_once()
-    mock_session.commit.assert_called_once()
+    mock_session.flush.assert_called_once()
     mock_session.refresh.assert_called_once()
 
     assert create_user is not None
@@ -46,7 +48,7 @@ def test_create_user_integrity_error(mock_session, user_db_in):
     """Test creation with Integrity error."""
     # Simulate an IntegrityError being raised when `add` is called
     mock_session.add.side_effect = None
-    mock_session.commit.side_effect = IntegrityError(
+    mock_session.flush.side_effect = IntegrityError(
         "Simulated Integrity Error",
         orig=ValueError("Duplicate entry for unique constraint"),
         params=None,
@@ -58,8 +60,9 @@ def test_create_user_integrity_error(mock_session, user_db_in):
         user_repo.create_user_with_password(db=mock_session, obj_in=user_db_in)
 
     mock_session.add.assert_called_once()
-    mock_session.commit.assert_called_once()
+    mock_session.flush.assert_called_once()
     mock_session.refresh.assert_not_called()
+    mock_session.rollback.assert_called_once()
     assert exc_info.value.detail == "Duplicate entry for unique constraint"
     assert exc_info.value.status_code == HTTPStatus.CONFLICT
 
@@ -75,30 +78,55 @@ def test_create_user_exception_error(mock_session, user_db_in):
         user_repo.create_user_with_password(db=mock_session, obj_in=user_db_in)
 
     mock_session.add.assert_called_once()
-    mock_session.commit.assert_not_called()
+    mock_session.flush.assert_not_called()
     mock_session.refresh.assert_not_called()
     assert exc_info.value.detail == "An unexpected error occurred."
     assert exc_info.value.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
 
 
-@patch("app.repositories.user.verify_password", spec=True)
+@patch("app.repositories.user.async_verify_password", spec=True)
 def test_authenticate(m_verify_password, mock_session):
     """Test successful authentication of a user."""
-    mock_data = User()
+    mock_data = User(hashed_password=f"$2b${settings.BCRYPT_ROUNDS}$hash")
     mock_session.query.return_value.filter.return_value.first.return_value = mock_data
 
     m_verify_password.return_value = True
 
     # Call the method
     user_repo = UserRepository(User)
-    result = user_repo.authenticate(mock_session, username="user", password="password")
+    result = asyncio.run(
+        user_repo.authenticate(mock_session, username="user", password="password")
+    )
 
     # Assertions
     mock_session.query.assert_called_once()
+    mock_session.flush.assert_not_called()
     assert result == mock_data
 
 
-@patch("app.repositories.user.verify_password", spec=True)
+@patch("app.repositories.user.async_get_password_hash", spec=True)
+@patch("app.repositories.user.async_verify_password", spec=True)
+def test_authenticate_rehashes_on_cost_change(
+    m_verify_password, m_get_password_hash, mock_session
+):
+    """Test a hash made with another cost factor is replaced on login."""
+    mock_data = User(hashed_password=f"$2b${settings.BCRYPT_ROUNDS - 1}$hash")
+    mock_session.query.return_value.filter.return_value.first.return_value = mock_data
+
+    m_verify_password.return_value = True
+    m_get_password_hash.return_value = "new-hash"
+
+    user_repo = UserRepository(User)
+    result = asyncio.run(
+        user_repo.authenticate(mock_session, username="user", password="password")
+    )
+
+    m_get_password_hash.assert_awaited_once_with("password")
+    mock_session.flush.assert_called_once()
+    assert result.hashed_password == "new-hash"
+
+
+@patch("app.repositories.user.async_verify_password", spec=True)
 def test_authenticate_no_user(m_verify_password, mock_session):
     """Test successful authentication of a user."""
     mock_session.query.return_value.filter.return_value.first.return_value = None
@@ -107,14 +135,16 @@ def test_authenticate_no_user(m_verify_password, mock_session):
 
     # Call the method
     user_repo = UserRepository(User)
-    result = user_repo.authenticate(mock_session, username="user", password="password")
+    result = asyncio.run(
+        user_repo.authenticate(mock_session, username="user", password="password")
+    )
 
     # Assertions
     mock_session.query.assert_called_once()
     assert result is None
 
 
-@patch("app.repositories.user.verify_password", spec=True)
+@patch("app.repositories.user.async_verify_password", spec=True)
 def test_authenticate_wrong_password(m_verify_password, mock_session):
     """Test successful authentication of a user."""
     mock_data = User()
@@ -124,7 +154,9 @@ def test_authenticate_wrong_password(m_verify_password, mock_session):
 
     # Call the method
     user_repo = UserRepository(User)
-    result = user_repo.authenticate(mock_session, username="user", password="password")
+    result = asyncio.run(
+        user_repo.authenticate(mock_session, username="user", password="password")
+    )
 
     # Assertions
     mock_session.query.assert_called_once()
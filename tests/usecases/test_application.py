@@ -0,0 +1,69 @@
+"""Application use case unit tests."""
+
+from datetime import datetime
+from http import HTTPStatus
+from unittest.mock import patch
+
+import pytest
+from starlette.responses import JSONResponse
+
+from app import schemas
+from app.core.config import settings
+from app.models import Application
+from app.use_cases.application import ApplicationUseCase
+from exceptions.exceptions import APIException
+
+
+@patch("app.use_cases.application.JobRepository", spec=True)
+@patch("app.use_cases.application.ApplicationRepository", spec=True)
+def test_create_application_of_deleted_job(
+    m_repo_application, m_repo_job, mock_session
+):
+    """Test applying to a soft-deleted job, which writes no row, is a 404."""
+    m_repo_application.return_value.apply.side_effect = APIException(
+        status_code=HTTPStatus.NOT_FOUND, detail="Record not found."
+    )
+
+    response = ApplicationUseCase(db=mock_session).create_application(
+        obj_in=schemas.ApplicationIn(user_id=2, job_id=3)
+    )
+
+    assert isinstance(response, JSONResponse)
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert m_repo_application.return_value.apply.call_args.kwargs["where"] == [
+        m_repo_job.return_value.live_exists.return_value
+    ]
+    m_repo_job.return_value.live_exists.assert_called_once_with(3)
+
+
+@pytest.mark.parametrize("unused_resume", ["user_2_old.pdf", None])
+@patch("app.use_cases.application.remove_after_commit")
+@patch("app.use_cases.application.JobRepository", spec=True)
+@patch("app.use_cases.application.ApplicationRepository", spec=True)
+def test_create_application_again_removes_the_previous_resume(
+    m_repo_application,
+    m_repo_job,
+    m_remove_after_commit,
+    unused_resume,
+    mock_session,
+):
+    """Test the resume a repeat application left unused is removed on commit."""
+    m_repo_application.return_value.apply.return_value = (
+        Application(
+            id=1,
+            user_id=2,
+            job_id=3,
+            resume="user_2_new.pdf",
+            applied_at=datetime.now(),
+        ),
+        unused_resume,
+    )
+
+    response = ApplicationUseCase(db=mock_session).create_application(
+        obj_in=schemas.ApplicationIn(user_id=2, job_id=3, resume="user_2_new.pdf")
+    )
+
+    assert response.resume == "user_2_new.pdf"
+    m_remove_after_commit.assert_called_once_with(
+        mock_session, settings.UPLOAD_DIR, unused_resume
+    )
@@ -0,0 +1,121 @@
+"""Async job use case unit tests."""
+
+import asyncio
+from datetime import datetime
+from http import HTTPStatus
+from unittest.mock import AsyncMock, patch
+
+from fastapi_pagination import Page
+from starlette.responses import JSONResponse
+
+from app import schemas
+from app.models import Job
+from app.repositories.base import row_type
+from app.repositories.job_facet import FACET_COLUMNS
+from app.use_cases.async_job import AsyncJobUseCase
+from exceptions.exceptions import DatabaseException, APIException
+
+
+def _job():
+    """Build a job model."""
+    job = Job()
+    job.id = 1
+    job.user_id = 1
+    job.title = "Backend Engineer"
+    job.location = "Manila"
+    job.created_at = datetime(2025, 5, 24)
+    job.updated_at = datetime(2025, 5, 24)
+    return job
+
+
+@patch("app.use_cases.async_job.JobRepository", spec=True)
+def test_get_jobs(m_repo_job):
+    """Test get jobs."""
+    mock_data = [_job()]
+    m_repo_job_instance = m_repo_job.return_value
+    m_repo_job_instance.async_search = AsyncMock(
+        return_value=Page(items=mock_data, total=1, page=1, size=10)
+    )
+    filters = schemas.JobFilter(location="Manila")
+
+    job_uc = AsyncJobUseCase(db=AsyncMock())
+
+    response = asyncio.run(job_uc.get_jobs(filters=filters))
+
+    m_repo_job_instance.columns.assert_called_once_with(schemas.JOB_CARD_FIELDS)
+    m_repo_job_instance.async_search.assert_awaited_once_with(
+        job_uc.db, filters=filters, columns=m_repo_job_instance.columns.return_value
+    )
+    assert response.items == mock_data
+    assert response.total == 1
+
+
+@patch("app.use_cases.async_job.JobRepository", spec=True)
+def test_get_jobs_exception(m_repo_job):
+    """Test get jobs with exception."""
+    m_repo_job_instance = m_repo_job.return_value
+    m_repo_job_instance.async_search = AsyncMock(
+        side_effect=DatabaseException(
+            status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail="error"
+        )
+    )
+
+    job_uc = AsyncJobUseCase(db=AsyncMock())
+
+    response = asyncio.run(job_uc.get_jobs(filters=schemas.JobFilter()))
+
+    assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert isinstance(response, JSONResponse)
+
+
+@patch("app.use_cases.async_job.JobRepository", spec=True)
+def test_get_job(m_repo_job):
+    """Test get job."""
+    m_repo_job_instance = m_repo_job.return_value
+    m_repo_job_instance.async_get = AsyncMock(return_value=_job())
+
+    job_uc = AsyncJobUseCase(db=AsyncMock())
+
+    response = asyncio.run(job_uc.get_job(_id=1))
+
+    assert response == schemas.JobOut.model_validate(_job())
+
+
+@patch("app.use_cases.async_job.JobRepository", spec=True)
+def test_get_job_exception(m_repo_job):
+    """Test get job exception."""
+    m_repo_job_instance = m_repo_job.return_value
+    m_repo_job_instance.async_get = AsyncMock(
+        side_effect=APIException(status_code=HTTPStatus.NOT_FOUND, detail="error")
+    )
+
+    job_uc = AsyncJobUseCase(db=AsyncMock())
+
+    response = asyncio.run(job_uc.get_job(_id=1))
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert isinstance(response, JSONResponse)
+
+
+@patch("app.use_cases.async_job.JobFacetRepository.async_apply", new_callable=AsyncMock)
+@patch("app.use_cases.async_job.JobRepository", spec=True)
+def test_update_job_moves_facet_counts(m_repo_job, m_async_apply):
+    """Test an update moves the facet counts from the old to the new values."""
+    before = row_type(FACET_COLUMNS)("Manila", None, None, None)
+    updated = _job()
+    updated.location = "Cebu"
+    m_repo_job_instance = m_repo_job.return_value
+    m_repo_job_instance.async_update_by_id_returning_previous = AsyncMock(
+        return_value=(updated, before)
+    )
+
+    job_uc = AsyncJobUseCase(db=AsyncMock())
+
+    response = asyncio.run(
+        job_uc.update_job(1, obj_in=schemas.JobIn(user_id=1, location="Cebu"))
+    )
+
+    m_async_apply.assert_awaited_once_with(
+        job_uc.db, removed=[("location", "Manila")], added=[("location", "Cebu")]
+    )
+    assert response.location == "Cebu"
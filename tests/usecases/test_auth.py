@@ -1,5 +1,6 @@
 """Auth use case unit tests."""
 
+import asyncio
 from http import HTTPStatus
 from unittest.mock import patch
 
@@ -26,8 +27,10 @@ def test_login_access_token(
 
     user_uc = AuthenticationUseCase(db=mock_session)
 
-    response = user_uc.login_access_token(
-        form_data=OAuth2PasswordRequestForm(username="user", password="password")
+    response = asyncio.run(
+        user_uc.login_access_token(
+            form_data=OAuth2PasswordRequestForm(username="user", password="password")
+        )
     )
 
     assert "access_token" in response
@@ -49,8 +52,10 @@ def test_login_access_token_no_user(
 
     user_uc = AuthenticationUseCase(db=mock_session)
 
-    response = user_uc.login_access_token(
-        form_data=OAuth2PasswordRequestForm(username="user", password="password")
+    response = asyncio.run(
+        user_uc.login_access_token(
+            form_data=OAuth2PasswordRequestForm(username="user", password="password")
+        )
     )
 
     assert isinstance(response, JSONResponse)
@@ -12,20 +12,18 @@ from exceptions.exceptions import DatabaseException, APIException
 
 
 @patch("app.use_cases.item.ItemRepository", spec=True)
-@patch("app.use_cases.item.paginate", spec=True)
-def test_get_items(m_paginate, m_repo_item, mock_session):
+def test_get_items(m_repo_item, mock_session):
     """Test get items."""
     mock_data = [Item(), Item()]
     m_repo_item_instance = m_repo_item.return_value
-    m_repo_item_instance.get_all.return_value = mock_data
-    m_paginate.return_value = Page(
+    m_repo_item_instance.get_all_paginated.return_value = Page(
         items=mock_data, total=len(mock_data), page=1, size=10
     )
 
     item_uc = ItemUseCase(db=mock_session)
 
     response = item_uc.get_items()
-    m_paginate.assert_called_once_with(mock_data)
+    m_repo_item_instance.get_all_paginated.assert_called_once_with(mock_session)
 
     assert response.items == mock_data
     assert response.total == len(mock_data)
@@ -37,7 +35,7 @@ def test_get_items(m_paginate, m_repo_item, mock_session):
 def test_get_items_exception(m_repo_item, mock_session):
     """Test get items with exception."""
     m_repo_item_instance = m_repo_item.return_value
-    m_repo_item_instance.get_all.side_effect = DatabaseException(
+    m_repo_item_instance.get_all_paginated.side_effect = DatabaseException(
         status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail="error"
     )
 
@@ -122,7 +120,7 @@ def test_update_item(m_repo_item, mock_session, item_db_in, item_db_out):
     mock_data.name = "Item 1"
 
     m_repo_item_instance = m_repo_item.return_value
-    m_repo_item_instance.update.return_value = mock_data
+    m_repo_item_instance.update_by_id.return_value = mock_data
 
     item_uc = ItemUseCase(db=mock_session)
 
@@ -135,7 +133,7 @@ def test_update_item(m_repo_item, mock_session, item_db_in, item_db_out):
 def test_update_item_exception(m_repo_item, mock_session, item_db_in, item_db_out):
     """Test item with exception."""
     m_repo_item_instance = m_repo_item.return_value
-    m_repo_item_instance.update.side_effect = DatabaseException(
+    m_repo_item_instance.update_by_id.side_effect = DatabaseException(
         status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail="error"
     )
 
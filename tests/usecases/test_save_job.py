@@ -0,0 +1,49 @@
+"""SavedJob use case unit tests."""
+
+from datetime import datetime
+from http import HTTPStatus
+from unittest.mock import patch
+
+from starlette.responses import JSONResponse
+
+from app import schemas
+from app.models import SavedJob
+from app.use_cases.save_job import SavedJobUseCase
+from exceptions.exceptions import APIException
+
+
+@patch("app.use_cases.save_job.JobRepository", spec=True)
+@patch("app.use_cases.save_job.SavedJobRepository", spec=True)
+def test_create_saved_job(m_repo_save_job, m_repo_job, mock_session):
+    """Test saving a job upserts it only if the job is live, in one statement."""
+    now = datetime(2026, 10, 18)
+    m_repo_save_job.return_value.upsert.return_value = SavedJob(
+        id=1, user_id=2, job_id=3, created_at=now, updated_at=now
+    )
+
+    response = SavedJobUseCase(db=mock_session).create_saved_job(
+        obj_in=schemas.SavedJobIn(user_id=2, job_id=3)
+    )
+
+    m_repo_job.return_value.live_exists.assert_called_once_with(3)
+    assert m_repo_save_job.return_value.upsert.call_args.kwargs["where"] == [
+        m_repo_job.return_value.live_exists.return_value
+    ]
+    m_repo_job.return_value.get_version.assert_not_called()
+    assert response.id == 1
+
+
+@patch("app.use_cases.save_job.JobRepository", spec=True)
+@patch("app.use_cases.save_job.SavedJobRepository", spec=True)
+def test_create_saved_job_of_deleted_job(m_repo_save_job, m_repo_job, mock_session):
+    """Test saving a soft-deleted job, which writes no row, is a 404."""
+    m_repo_save_job.return_value.upsert.side_effect = APIException(
+        status_code=HTTPStatus.NOT_FOUND, detail="Record not found."
+    )
+
+    response = SavedJobUseCase(db=mock_session).create_saved_job(
+        obj_in=schemas.SavedJobIn(user_id=2, job_id=3)
+    )
+
+    assert isinstance(response, JSONResponse)
+    assert response.status_code == HTTPStatus.NOT_FOUND
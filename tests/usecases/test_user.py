@@ -1,19 +1,21 @@
 """User use case unit tests."""
 
 from http import HTTPStatus
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from fastapi_pagination import Page
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
+from app.core.etag import ConditionalRequest
 from app.models import User
+from app.repositories.base import row_type
+from app.repositories.job_facet import FACET_COLUMNS, JobFacetRepository
 from app.use_cases.user import UserUseCase
 from exceptions.exceptions import DatabaseException, APIException
 
 
 @patch("app.use_cases.user.UserRepository", spec=True)
-@patch("app.use_cases.user.paginate", spec=True)
-def test_get_users(m_paginate, m_repo_user, mock_session):
+def test_get_users(m_repo_user, mock_session):
     """Test get users."""
     user_1 = User()
     user_1.email = "user@yahoo.com"
@@ -26,15 +28,14 @@ def test_get_users(m_paginate, m_repo_user, mock_session):
     mock_data = [user_1, user_2]
 
     m_repo_user_instance = m_repo_user.return_value
-    m_repo_user_instance.get_all.return_value = mock_data
-    m_paginate.return_value = Page(
+    m_repo_user_instance.get_all_paginated.return_value = Page(
         items=mock_data, total=len(mock_data), page=1, size=10
     )
 
     user_uc = UserUseCase(db=mock_session)
 
     response = user_uc.get_users()
-    m_paginate.assert_called_once_with(mock_data)
+    m_repo_user_instance.get_all_paginated.assert_called_once_with(mock_session)
 
     assert response.items == mock_data
     assert response.total == len(mock_data)
@@ -46,7 +47,7 @@ def test_get_users(m_paginate, m_repo_user, mock_session):
 def test_get_users_exception(m_repo_user, mock_session):
     """Test get users with exception."""
     m_repo_user_instance = m_repo_user.return_value
-    m_repo_user_instance.get_all.side_effect = DatabaseException(
+    m_repo_user_instance.get_all_paginated.side_effect = DatabaseException(
         status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail="error"
     )
 
@@ -71,6 +72,25 @@ def test_get_user(m_repo_user, mock_session, user_db_out, user_model_out):
     assert response == user_db_out
 
 
+@patch("app.use_cases.user.UserRepository", spec=True)
+def test_get_user_not_modified(m_repo_user, mock_session):
+    """Test get user answers 304 from the version without loading the row."""
+    m_repo_user_instance = m_repo_user.return_value
+    m_repo_user_instance.get_version.return_value = (1, "v1")
+    conditional = MagicMock(spec=ConditionalRequest, if_none_match='W/"etag"')
+    conditional.not_modified.return_value = Response(
+        status_code=HTTPStatus.NOT_MODIFIED
+    )
+
+    user_uc = UserUseCase(db=mock_session)
+
+    response = user_uc.get_user(_id=1, conditional=conditional)
+
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    conditional.not_modified.assert_called_once_with(1, "v1")
+    m_repo_user_instance.get.assert_not_called()
+
+
 @patch("app.use_cases.user.UserRepository", spec=True)
 def test_get_user_exception(m_repo_user, mock_session, user_db_out):
     """Test get user exception."""
@@ -118,16 +138,31 @@ def test_create_user_exception(m_repo_user, mock_session, user_db_in, user_db_ou
     assert isinstance(response, JSONResponse)
 
 
+@patch("app.use_cases.user.JobFacetRepository", spec=True)
+@patch("app.use_cases.user.JobRepository", spec=True)
 @patch("app.use_cases.user.UserRepository", spec=True)
-def test_delete_user(m_repo_user, mock_session, user_db_out, user_model_out):
-    """Test delete user."""
+def test_delete_user(
+    m_repo_user, m_repo_job, m_repo_facet, mock_session, user_db_out, user_model_out
+):
+    """Test delete marks the user and their jobs deleted and drops the facets."""
     m_repo_user_instance = m_repo_user.return_value
-    m_repo_user_instance.delete.return_value = user_model_out
+    m_repo_user_instance.soft_delete.return_value = user_model_out
+    job = row_type(("id", *FACET_COLUMNS))(1, "Manila", True, None, None)
+    m_repo_job.return_value.soft_delete_by_user_id.return_value = [job]
+    m_repo_facet.facet_values.side_effect = JobFacetRepository.facet_values
 
     user_uc = UserUseCase(db=mock_session)
 
     response = user_uc.delete_user(_id=1)
 
+    m_repo_user_instance.soft_delete.assert_called_once_with(db=mock_session, _id=1)
+    m_repo_user_instance.delete.assert_not_called()
+    m_repo_job.return_value.soft_delete_by_user_id.assert_called_once_with(
+        mock_session, user_id=1, returning=FACET_COLUMNS
+    )
+    m_repo_facet.return_value.apply.assert_called_once_with(
+        mock_session, removed=[("location", "Manila"), ("is_remote", "true")]
+    )
     assert response == user_db_out
 
 
@@ -135,7 +170,7 @@ def test_delete_user(m_repo_user, mock_session, user_db_out, user_model_out):
 def test_delete_user_exception(m_repo_user, mock_session, user_db_out):
     """Test delete user with exception."""
     m_repo_user_instance = m_repo_user.return_value
-    m_repo_user_instance.delete.side_effect = DatabaseException(
+    m_repo_user_instance.soft_delete.side_effect = DatabaseException(
         status_code=HTTPStatus.INTERNAL_SERVER_ERROR, detail="error"
     )
 